@@ -0,0 +1,236 @@
+"""
+Benchmarks for the calculation functions.
+
+Times every public function in clayshale, porosity, saturation, salinity, temperature,
+convert and fused on a scalar input and on curves of increasing size, recording throughput
+and peak memory. Results are saved as JSON and can be compared against a previously
+saved baseline to flag regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json --tolerance 0.25
+    python benchmarks/run_benchmarks.py --sizes scalar 1000 100000 --filter saturation.
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pypetrophysics import clayshale, convert, fused, porosity, salinity, saturation, temperature
+
+MODULES = [clayshale, porosity, saturation, salinity, temperature, convert, fused]
+
+DEFAULT_SIZES = ["scalar", 1000, 100000, 10000000]
+
+# Public functions that are not benchmarked: not implemented, not calculations,
+# or converting their inputs in place (so repeated calls are not comparable)
+SKIPPED = {"saturation.qv_hsk", "convert.register_unit", "convert.unit_quantity", "convert.convert_curves"}
+
+# Functions that only accept curves, which are not run with scalar inputs
+CURVE_ONLY = {"fused.sw_archie_from_logs"}
+
+class Curve:
+    """A curve argument, filled with uniform random values between low and high."""
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def make(self, size, rng):
+        if size == "scalar":
+            return (self.low + self.high) / 2
+        return rng.uniform(self.low, self.high, size)
+
+# Arguments for each benchmarked function. Curve arguments vary with depth,
+# everything else is passed as a scalar parameter.
+CASES = {
+    "clayshale.gr_clay_shale_vol": dict(minvalue=20, maxvalue=130, inputvalue=Curve(10, 150), method="larionov-young", limit_result=True),
+    "clayshale.sp_clay_shale_vol": dict(minvalue=-120, maxvalue=-20, inputvalue=Curve(-130, -10), limit_result=True),
+    "clayshale.den_neu_shale_vol": dict(neut_porosity=Curve(0.1, 0.4), dens_porosity=Curve(0.05, 0.3), neut_shale_porosity=0.35,
+                                        dens_shale_porosity=0.08, limit_result=True),
+    "clayshale.vshale_to_vclay": dict(vshale=Curve(0, 1), multiplier=0.7),
+    "porosity.porosity_density": dict(rhomatrix=2.65, rhofluid=1, rhobulk=Curve(2.0, 2.7), limit_result=True),
+    "porosity.porosity_sonic": dict(dtmatrix=55.5, dtfluid=189, dtlog=Curve(55, 120), method="raymer", limit_result=True),
+    "porosity.porosity_effective": dict(phit=Curve(0.05, 0.35), vclay=Curve(0, 0.6), phitclay=0.12),
+    "porosity.porosity_total": dict(phie=Curve(0.05, 0.3), vclay=Curve(0, 0.6), phiclay=0.12),
+    "porosity.porosity_shale": dict(dens_dry_shale=Curve(2.6, 2.7), dens_wet_shale=Curve(2.3, 2.5), dens_water=1),
+    "saturation.formation_factor": dict(arch_a=1, phi=Curve(0.05, 0.35), arch_m=2),
+    "saturation.ro": dict(formation_factor=Curve(8, 400), rw=0.05),
+    "saturation.resistivity_index": dict(rt=Curve(1, 200), ro=Curve(0.5, 20)),
+    "saturation.sw_archie": dict(phi=Curve(0.05, 0.35), rw=0.05, rt=Curve(1, 200), arch_a=1, arch_m=2, arch_n=2, limit_result=True),
+    "saturation.sw_simandoux": dict(rw=0.05, rt=Curve(1, 200), rshale=4, vclay=Curve(0, 0.5), phi=Curve(0.05, 0.35), arch_a=1, arch_m=2),
+    "saturation.sw_modified_simandoux": dict(rw=0.05, rt=Curve(1, 200), rshale=4, vclay=Curve(0, 0.5), phi=Curve(0.05, 0.35),
+                                             arch_a=1, arch_m=2),
+    "saturation.sw_indonesian": dict(rw=0.05, rt=Curve(1, 200), rshale=4, vclay=Curve(0, 0.5), phi=Curve(0.05, 0.35),
+                                     archie_m=2, archie_n=2),
+    "saturation.sw_waxsmit": dict(rw=0.05, rt=Curve(1, 200), b=4, qv=Curve(0, 1.5), a=1, phit=Curve(0.05, 0.35), m_star=2, n_star=2),
+    "saturation.sw_shaly_sand": dict(rw=0.05, rt=Curve(1, 200), rshale=4, vclay=Curve(0, 0.5), phi=Curve(0.05, 0.35), b=4, qv=Curve(0, 1.5)),
+    "saturation.excess_cond_bqv": dict(b=4, qv=Curve(0, 1.5)),
+    "saturation.qv_cec": dict(density_dry_clay=2.7, phit=Curve(0.05, 0.35), cec=Curve(0.01, 0.5)),
+    "saturation.equiv_cond_echange_cations_B": dict(temp=Curve(20, 150), rw=0.05),
+    "saturation.swb": dict(porosity_wet_clay=0.12, clay_vol=Curve(0, 0.6), phit=Curve(0.05, 0.35)),
+    "saturation.qv_juhasz": dict(vclay_dry=Curve(0, 0.5), density_dry_clay=2.7, cec_dry_clay=0.1, phit=Curve(0.05, 0.35)),
+    "saturation.vol_dry_clay": dict(phi_n=Curve(0.1, 0.4), phi_d=Curve(0.05, 0.3), HI_dry_clay=0.1),
+    "saturation.bvw": dict(sw=Curve(0.1, 1), phi=Curve(0.05, 0.35)),
+    "salinity.chlorides_to_NaCl": dict(salinity_chlorides=Curve(1000, 150000)),
+    "salinity.NaCl_to_chlorides": dict(salinity_NaCl=Curve(1000, 250000)),
+    "salinity.rw_at_form_temp": dict(rw=0.05, rw_temperature=75, temperature_units="f", new_temperature=Curve(80, 300)),
+    "salinity.rw_from_salinity": dict(salinity_NaCl=Curve(1000, 250000), temperature=Curve(60, 300)),
+    "salinity.salinity_from_rw": dict(rw=Curve(0.02, 2), temperature=Curve(60, 300)),
+    "temperature.temp_gradient": dict(bottom_hole_temperature=Curve(100, 300), surface_temperature=60, bottom_hole_depth=Curve(1000, 20000)),
+    "temperature.formation_temperature": dict(surface_temperature=60, gradient=0.015, depth=Curve(0, 20000)),
+    "convert.ft_to_m": dict(inputvalue=Curve(0, 20000)),
+    "convert.m_to_ft": dict(inputvalue=Curve(0, 6000)),
+    "convert.ft_to_in": dict(inputvalue=Curve(0, 20000)),
+    "convert.in_to_ft": dict(inputvalue=Curve(0, 20000)),
+    "convert.velocity_to_slowness": dict(inputvalue=Curve(5000, 25000)),
+    "convert.slowness_to_velocity": dict(inputvalue=Curve(40, 200)),
+    "convert.temperature_convert": dict(inputvalue=Curve(0, 300), inputunits="f", outputunits="c"),
+    "convert.convert_units": dict(inputvalue=Curve(40, 200), inputunits="us/ft", outputunits="us/m"),
+    "fused.sw_archie_from_logs": dict(rhob=Curve(2.0, 2.65), gr=Curve(10, 150), rt=Curve(1, 200), rhomatrix=2.65, rhofluid=1,
+                                      gr_clean=20, gr_shale=130, phi_shale=0.1, rw=0.05, arch_a=1, arch_m=2, arch_n=2),
+}
+
+def public_functions():
+    """Returns the qualified names of the public functions in the benchmarked modules."""
+    names = []
+    for module in MODULES:
+        short_name = module.__name__.split(".")[-1]
+        for name, obj in vars(module).items():
+            if not name.startswith("_") and inspect.isfunction(obj) and obj.__module__ == module.__name__:
+                names.append("{}.{}".format(short_name, name))
+    return names
+
+def get_function(qualified_name):
+    module_name, func_name = qualified_name.split(".")
+    module = {module.__name__.split(".")[-1]: module for module in MODULES}[module_name]
+    return getattr(module, func_name)
+
+def make_arguments(qualified_name, size, seed=0):
+    rng = np.random.default_rng(seed)
+    return {name: value.make(size, rng) if isinstance(value, Curve) else value for name, value in CASES[qualified_name].items()}
+
+def time_call(func, kwargs, min_time=0.2, max_repeats=1000):
+    """Returns the best time per call in seconds, repeating until min_time has elapsed."""
+    best = float("inf")
+    elapsed = 0
+    repeats = 0
+    while elapsed < min_time and repeats < max_repeats:
+        start = time.perf_counter()
+        func(**kwargs)
+        duration = time.perf_counter() - start
+        best = min(best, duration)
+        elapsed += duration
+        repeats += 1
+    return best
+
+def peak_memory(func, kwargs):
+    """Returns the peak memory in bytes allocated during one call."""
+    tracemalloc.start()
+    try:
+        func(**kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmark(qualified_name, size, min_time=0.2):
+    """
+    Benchmarks one function at one input size.
+
+    Returns
+    -------
+    dict
+        Returns the function name, size, best time per call (seconds), throughput
+        (samples per second) and peak memory (bytes).
+    """
+    func = get_function(qualified_name)
+    kwargs = make_arguments(qualified_name, size)
+    seconds = time_call(func, kwargs, min_time=min_time)
+    samples = 1 if size == "scalar" else size
+    return {
+        "name": qualified_name,
+        "size": size,
+        "seconds": seconds,
+        "throughput": samples / seconds if seconds > 0 else float("inf"),
+        "peak_memory": peak_memory(func, kwargs),
+    }
+
+def run_benchmarks(sizes=DEFAULT_SIZES, name_filter="", min_time=0.2, verbose=True):
+    """Runs every benchmark case at each size and returns the results with environment details."""
+    results = []
+    for qualified_name in CASES:
+        if name_filter not in qualified_name:
+            continue
+        for size in sizes:
+            if size == "scalar" and qualified_name in CURVE_ONLY:
+                continue
+            result = run_benchmark(qualified_name, size, min_time=min_time)
+            results.append(result)
+            if verbose:
+                print("{:45s} {:>10} {:12.3e} s {:12.3e} samples/s {:10.1f} MB".format(
+                    qualified_name, size, result["seconds"], result["throughput"], result["peak_memory"] / 2**20))
+    return {
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+                        "processor": platform.processor()},
+        "results": results,
+    }
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares benchmark results with a baseline.
+
+    Returns
+    -------
+    list of dict
+        Returns the benchmarks that are slower than the baseline by more than the
+        tolerance (fraction), with the baseline and current times and their ratio.
+    """
+    baseline_times = {(result["name"], str(result["size"])): result["seconds"] for result in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        key = (result["name"], str(result["size"]))
+        if key in baseline_times and result["seconds"] > baseline_times[key] * (1 + tolerance):
+            regressions.append({"name": result["name"], "size": result["size"], "baseline": baseline_times[key],
+                                "current": result["seconds"], "ratio": result["seconds"] / baseline_times[key]})
+    return regressions
+
+def _size(value):
+    return value if value == "scalar" else int(float(value))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pypetrophysics calculation functions.")
+    parser.add_argument("--sizes", nargs="+", type=_size, default=DEFAULT_SIZES,
+                        help="Input sizes: 'scalar' and/or number of samples (default: scalar 1e3 1e5 1e7)")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum time spent timing each case (seconds)")
+    parser.add_argument("--output", help="Save results to this JSON file")
+    parser.add_argument("--baseline", help="Compare results with this JSON file and exit with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown relative to the baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.filter, args.min_time)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION {name} [{size}]: {baseline:.3e} s -> {current:.3e} s ({ratio:.2f}x)".format(**regression))
+        if regressions:
+            return 1
+        print("No regressions against {}".format(args.baseline))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
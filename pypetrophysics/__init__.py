@@ -0,0 +1,61 @@
+"""
+A library of petrophysical calculations
+
+Submodules and the functions and classes listed in _EXPORTS are available from the
+package root, e.g. pypetrophysics.sw_archie. They are imported on first use, so
+importing the package itself is fast and has no side effects. The accessor module
+requires pandas.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "accessor": ("PetroAccessor",),
+    "autopick": ("QuantileSketch", "EndpointPicker", "pick_endpoints"),
+    "batch": ("BatchResult", "run_batch"),
+    "chunked": ("chunk_length", "run_chunked"),
+    "clayshale": ("gr_clay_shale_vol", "sp_clay_shale_vol", "den_neu_shale_vol", "vshale_to_vclay"),
+    "convert": ("ft_to_m", "m_to_ft", "ft_to_in", "in_to_ft", "velocity_to_slowness", "slowness_to_velocity",
+                "temperature_convert", "register_unit", "unit_quantity", "convert_units", "convert_curves"),
+    "crossplot": ("Crossplot", "crossplot_endpoints"),
+    "depthmatch": ("bulk_shift", "windowed_shifts", "apply_shifts"),
+    "filters": ("running_median", "moving_average", "hampel", "washout_mask"),
+    "fused": ("sw_archie_from_logs",),
+    "las": ("read_las_header", "iter_las", "read_las"),
+    "lithology": (),
+    "miscfuncs": ("limit_vals", "dec_perc_convert"),
+    "pickett": ("PickettFit", "pickett_fit", "pickett_curves"),
+    "porosity": ("porosity_density", "porosity_sonic", "porosity_effective", "porosity_total", "porosity_shale"),
+    "realtime": ("IncrementalEvaluator",),
+    "resample": ("depth_grid", "Resampler", "resample_curves", "align_runs"),
+    "salinity": ("chlorides_to_NaCl", "NaCl_to_chlorides", "rw_at_form_temp", "rw_from_salinity", "salinity_from_rw",
+                 "RwGrid"),
+    "saturation": ("formation_factor", "ro", "resistivity_index", "sw_archie", "sw_simandoux", "sw_modified_simandoux",
+                   "sw_indonesian", "WaxmanSmitsResult", "sw_waxsmit", "sw_shaly_sand", "excess_cond_bqv", "qv_cec",
+                   "equiv_cond_echange_cations_B", "qv_hsk", "swb", "qv_juhasz", "vol_dry_clay", "bvw"),
+    "temperature": ("temp_gradient", "formation_temperature", "TemperatureProfile"),
+    "uncertainty": ("sample_distribution", "PercentileAccumulator", "monte_carlo_sw", "first_order_std",
+                    "formation_factor_derivatives", "sw_archie_derivatives", "porosity_density_derivatives",
+                    "porosity_sonic_derivatives", "gr_clay_shale_vol_derivatives", "sw_archie_uncertainty",
+                    "formation_factor_uncertainty", "porosity_density_uncertainty", "porosity_sonic_uncertainty",
+                    "gr_clay_shale_vol_uncertainty"),
+    "wellstore": ("Well", "WellStore"),
+    "workflow": ("Workflow",),
+    "zones": ("ZoneTable",),
+}
+
+_ATTRIBUTES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_EXPORTS) + sorted(_ATTRIBUTES)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return importlib.import_module("." + name, __name__)
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module("." + _ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
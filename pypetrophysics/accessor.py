@@ -0,0 +1,177 @@
+"""
+pandas DataFrame accessor
+
+Importing this module registers the petro accessor on pandas DataFrames. Requires pandas.
+"""
+
+import functools
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from . import clayshale, fused, porosity, saturation
+
+# Standard curve names used by the accessor
+CURVES = ("DEPT", "GR", "SP", "RHOB", "NPHI", "DPHI", "DT", "RT", "VSH", "VCL", "PHIT", "PHIE", "SW", "BVW")
+
+# name: (function, {argument: curve}, output curve)
+# Outputs given as a dict map the keys of a dict result to curves.
+CALCULATIONS = {
+    "gr_clay_shale_vol": (clayshale.gr_clay_shale_vol, {"inputvalue": "GR"}, "VSH"),
+    "sp_clay_shale_vol": (clayshale.sp_clay_shale_vol, {"inputvalue": "SP"}, "VSH"),
+    "den_neu_shale_vol": (clayshale.den_neu_shale_vol, {"neut_porosity": "NPHI", "dens_porosity": "DPHI"}, "VSH"),
+    "vshale_to_vclay": (clayshale.vshale_to_vclay, {"vshale": "VSH"}, "VCL"),
+    "porosity_density": (porosity.porosity_density, {"rhobulk": "RHOB"}, "PHIT"),
+    "porosity_sonic": (porosity.porosity_sonic, {"dtlog": "DT"}, "PHIT"),
+    "porosity_effective": (porosity.porosity_effective, {"phit": "PHIT", "vclay": "VSH"}, "PHIE"),
+    "porosity_total": (porosity.porosity_total, {"phie": "PHIE", "vclay": "VSH"}, "PHIT"),
+    "sw_archie": (saturation.sw_archie, {"phi": "PHIE", "rt": "RT"}, "SW"),
+    "sw_simandoux": (saturation.sw_simandoux, {"rt": "RT", "vclay": "VSH", "phi": "PHIE"}, "SW"),
+    "sw_modified_simandoux": (saturation.sw_modified_simandoux, {"rt": "RT", "vclay": "VSH", "phi": "PHIE"}, "SW"),
+    "sw_indonesian": (saturation.sw_indonesian, {"rt": "RT", "vclay": "VSH", "phi": "PHIE"}, "SW"),
+    "sw_waxsmit": (saturation.sw_waxsmit, {"rt": "RT", "phit": "PHIT"}, "SW"),
+    "sw_shaly_sand": (saturation.sw_shaly_sand, {"rt": "RT", "vclay": "VSH", "phi": "PHIE"},
+                      {model: "SW_" + model.upper().replace("-", "_") for model in saturation.SHALY_SAND_MODELS}),
+    "bvw": (saturation.bvw, {"sw": "SW", "phi": "PHIE"}, "BVW"),
+    "sw_archie_from_logs": (fused.sw_archie_from_logs, {"rhob": "RHOB", "gr": "GR", "rt": "RT"},
+                            {"vsh": "VSH", "phit": "PHIT", "phie": "PHIE", "sw": "SW"}),
+}
+
+@pd.api.extensions.register_dataframe_accessor("petro")
+class PetroAccessor:
+    """
+    Column-wise petrophysical calculations on a DataFrame, available as df.petro.
+
+    Each calculation in CALCULATIONS is available as a method with the same name as the
+    library function, e.g. df.petro.sw_archie(rw=0.05, arch_a=1, arch_m=2, arch_n=2).
+    Curve arguments are read from the DataFrame columns, as NumPy views of the column
+    data where possible, and the result is written back as a new column. Parameters
+    are passed as keyword arguments and may be scalars or arrays.
+
+    Columns are found by the standard curve names in CURVES. Use set_curves to map
+    these to the column names of the DataFrame, e.g. df.petro.set_curves(GR="GR_EDTC").
+    The mapping is kept in df.attrs so it stays with copies of the DataFrame.
+
+    Examples
+    --------
+        import pypetrophysics.accessor
+        df.petro.set_curves(RHOB="RHOZ", RT="AT90")
+        df.petro.gr_clay_shale_vol(minvalue=20, maxvalue=130, limit_result=True)
+        df.petro.porosity_density(rhomatrix=2.65, rhofluid=1, limit_result=True)
+        df.petro.porosity_effective(phitclay=0.1)
+        df.petro.sw_archie(rw=0.05, arch_a=1, arch_m=2, arch_n=2, limit_result=True)
+    """
+    def __init__(self, df):
+        self._df = df
+
+    def __getattr__(self, name):
+        if name in CALCULATIONS:
+            return functools.partial(self.calculate, name)
+        raise AttributeError("'petro' accessor has no attribute {!r}".format(name))
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(CALCULATIONS))
+
+    @property
+    def curves(self):
+        """Mapping of standard curve names to the column names of the DataFrame."""
+        mapping = {curve: curve for curve in CURVES}
+        mapping.update(self._df.attrs.get("petro_curves", {}))
+        return mapping
+
+    def set_curves(self, **curves):
+        """
+        Maps standard curve names to column names.
+
+        Parameters
+        ----------
+        **curves
+            Column name for each standard curve name, e.g. RHOB="RHOZ".
+
+        Returns
+        -------
+        DataFrame
+            Returns the DataFrame.
+        """
+        mapping = dict(self._df.attrs.get("petro_curves", {}))
+        mapping.update(curves)
+        self._df.attrs["petro_curves"] = mapping
+        return self._df
+
+    def column(self, curve):
+        """
+        Returns the data of a curve as a NumPy array, without copying where possible.
+
+        Parameters
+        ----------
+        curve : string
+            Standard curve name or column name.
+
+        Returns
+        -------
+        array-like
+            Returns the column values.
+        """
+        name = self.curves.get(curve, curve)
+        if name not in self._df.columns:
+            raise Exception("Column {} not found. Map it with set_curves.".format(name))
+        return self._df[name].to_numpy(copy=False)
+
+    def calculate(self, name, output=None, curves=None, **kwargs):
+        """
+        Runs a calculation on the DataFrame columns and writes the result back.
+
+        Parameters
+        ----------
+        name : string
+            Calculation name, a key of CALCULATIONS.
+        output : string or dict, optional
+            Column name for the result, or for dict results a dict of result key to column
+            name. By default the column mapped to the standard output curve.
+        curves : dict, optional
+            Column names to use for function arguments in this call only,
+            e.g. {"phi": "PHIT"}.
+        **kwargs
+            Other arguments for the function. Arguments given here are not read from the
+            DataFrame.
+
+        Returns
+        -------
+        DataFrame
+            Returns the DataFrame with the result column(s) added.
+        """
+        if name not in CALCULATIONS:
+            raise Exception("Enter a valid calculation: {}".format(", ".join(CALCULATIONS)))
+        func, arguments, default_output = CALCULATIONS[name]
+        arguments = dict(arguments, **(curves or {}))
+        signature = inspect.signature(func).parameters
+
+        for argument, curve in arguments.items():
+            if argument not in kwargs:
+                kwargs[argument] = self.column(curve)
+        for argument, value in kwargs.items():
+            if argument not in signature:
+                raise Exception("{} has no argument {}".format(func.__name__, argument))
+            if isinstance(value, pd.Series):
+                kwargs[argument] = value.to_numpy(copy=False)
+
+        result = func(**kwargs)
+
+        if isinstance(result, dict):
+            if output is None:
+                output = default_output
+            for key, values in result.items():
+                column = output[key] if isinstance(output, dict) else "{}_{}".format(output, key.upper().replace("-", "_"))
+                self._write(self.curves.get(column, column), values)
+        else:
+            if isinstance(result, tuple):
+                result = result[0]
+            self._write(output if output is not None else self.curves[default_output], result)
+        return self._df
+
+    def _write(self, column, values):
+        values = np.asarray(values)
+        if values.ndim == 0:
+            values = np.full(len(self._df), values.item())
+        self._df[column] = values
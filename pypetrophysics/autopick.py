@@ -0,0 +1,277 @@
+"""
+Automatic picking of clean and shale endpoints
+"""
+
+import numpy as np
+
+class QuantileSketch:
+    """
+    Mergeable streaming estimate of the distribution of a curve.
+
+    Values are held in a stack of compactors. Each level holds at most k values, and
+    when it fills up it is sorted and every other value is promoted to the next level
+    with twice the weight. Memory use grows with log(n / k) rather than n, and the rank
+    error of a percentile is about 1 / k of the number of values. Sketches built from
+    separate chunks or processes can be merged, and the result is equivalent to a
+    sketch of all the values.
+
+    Parameters
+    ----------
+    k : int, optional
+        Capacity of each level. Larger values are more accurate and use more memory.
+        By default 200
+    seed : int, optional
+        Seed for the random choice of values to promote.
+    """
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    def update(self, values):
+        """
+        Adds a chunk of values. NaN values are ignored.
+
+        Parameters
+        ----------
+        values : float or array-like
+            Values to add.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += values.size
+        self._compress()
+
+    def merge(self, other):
+        """
+        Adds the values of another sketch.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch to merge into this one.
+
+        Returns
+        -------
+        QuantileSketch
+            Returns this sketch.
+        """
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def percentile(self, percentile):
+        """
+        Estimates percentiles of the values added so far.
+
+        Parameters
+        ----------
+        percentile : float or array-like
+            Percentile(s) between 0 and 100.
+
+        Returns
+        -------
+        float or array-like
+            Returns the estimated percentile value(s), or NaN if the sketch is empty.
+        """
+        percentile = np.asarray(percentile, dtype=float)
+        if self.count == 0:
+            return np.full(percentile.shape, np.nan)[()]
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(items.size, 2.0**level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, percentile / 100 * cumulative[-1], side="left")
+        return values[order][np.minimum(index, values.size - 1)][()]
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self.k:
+                items = np.sort(items)
+                # With an odd number of items, a randomly chosen one stays at this level,
+                # so neither end of the distribution is favoured
+                leftover = np.empty(0)
+                if items.size % 2:
+                    index = self._rng.integers(items.size)
+                    leftover = items[index:index + 1]
+                    items = np.delete(items, index)
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = leftover
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+class EndpointPicker:
+    """
+    Picks clean and shale endpoints for clayshale.gr_clay_shale_vol or
+    clayshale.sp_clay_shale_vol from percentiles of the curve.
+
+    The curve can be added in chunks, e.g. from las.iter_las, and pickers built in
+    separate processes can be merged. If a zone table is given, endpoints are picked
+    separately for each zone.
+
+    Parameters
+    ----------
+    clean_percentile : float, optional
+        Percentile of the curve used as the clean (minvalue) endpoint.
+        By default 5
+    shale_percentile : float, optional
+        Percentile of the curve used as the shale (maxvalue) endpoint.
+        By default 95
+    zones : zones.ZoneTable, optional
+        Zones to pick endpoints for. Depths must then be given with each chunk.
+    k : int, optional
+        Capacity of each level of the quantile sketches.
+        By default 200
+    seed : int, optional
+        Seed for the quantile sketches.
+
+    Examples
+    --------
+        picker = EndpointPicker(zones=zone_table)
+        for chunk in las.iter_las("well.las", curves=["DEPT", "GR"]):
+            picker.update(chunk["GR"], chunk["DEPT"])
+        picker.add_to_zones(zone_table)
+    """
+    def __init__(self, clean_percentile=5, shale_percentile=95, zones=None, k=200, seed=None):
+        if not 0 <= clean_percentile <= 100 or not 0 <= shale_percentile <= 100:
+            raise Exception("Enter valid percentiles between 0 and 100")
+        self.clean_percentile = clean_percentile
+        self.shale_percentile = shale_percentile
+        self.zones = zones
+        seeds = np.random.SeedSequence(seed).spawn(1 if zones is None else len(zones))
+        self.sketches = [QuantileSketch(k, seed=s) for s in seeds]
+
+    def update(self, values, depth=None):
+        """
+        Adds a chunk of the curve.
+
+        Parameters
+        ----------
+        values : array-like
+            Curve values, e.g. gamma ray.
+        depth : array-like, optional
+            Depth of each sample. Required if the picker has zones.
+        """
+        if self.zones is None:
+            self.sketches[0].update(values)
+            return
+        if depth is None:
+            raise Exception("Depths are required to pick endpoints by zone")
+        values = np.asarray(values, dtype=float)
+        zone = self.zones.zone_index(depth)
+        order = np.argsort(zone, kind="stable")
+        counts = np.bincount(zone + 1, minlength=len(self.zones) + 1)
+        for sketch, chunk in zip(self.sketches, np.split(values[order], np.cumsum(counts)[:-1])[1:]):
+            if chunk.size:
+                sketch.update(chunk)
+
+    def merge(self, other):
+        """
+        Adds the sketches of another picker with the same zones.
+
+        Parameters
+        ----------
+        other : EndpointPicker
+            Picker to merge into this one.
+
+        Returns
+        -------
+        EndpointPicker
+            Returns this picker.
+        """
+        if len(other.sketches) != len(self.sketches):
+            raise Exception("Pickers must have the same zones to be merged")
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    def endpoints(self):
+        """
+        Returns the picked endpoints.
+
+        Returns
+        -------
+        tuple
+            Returns (clean, shale). These are floats, or arrays with one value per zone if
+            the picker has zones. Zones without data are NaN.
+        """
+        picks = np.array([sketch.percentile([self.clean_percentile, self.shale_percentile]) for sketch in self.sketches])
+        if self.zones is None:
+            return picks[0, 0].item(), picks[0, 1].item()
+        return picks[:, 0], picks[:, 1]
+
+    def add_to_zones(self, zones, clean_name="minvalue", shale_name="maxvalue"):
+        """
+        Stores the picked endpoints as parameter columns of a zone table.
+
+        Parameters
+        ----------
+        zones : zones.ZoneTable
+            Zone table the picker was created with.
+        clean_name : string, optional
+            Column name for the clean endpoint.
+            By default minvalue
+        shale_name : string, optional
+            Column name for the shale endpoint.
+            By default maxvalue
+        """
+        if len(self.sketches) != len(zones):
+            raise Exception("Picker does not have one sketch per zone")
+        clean, shale = self.endpoints()
+        zones.add_parameter(clean_name, clean)
+        zones.add_parameter(shale_name, shale)
+
+def pick_endpoints(values, clean_percentile=5, shale_percentile=95, depth=None, zones=None, chunk_size=10000, k=200, seed=None):
+    """
+    Picks clean and shale endpoints from percentiles of a curve.
+
+    Parameters
+    ----------
+    values : array-like
+        Curve values, e.g. gamma ray or SP.
+    clean_percentile : float, optional
+        Percentile used as the clean (minvalue) endpoint.
+        By default 5
+    shale_percentile : float, optional
+        Percentile used as the shale (maxvalue) endpoint.
+        By default 95
+    depth : array-like, optional
+        Depth of each sample. Required if zones is given.
+    zones : zones.ZoneTable, optional
+        Pick endpoints separately for each zone.
+    chunk_size : int, optional
+        Number of samples added to the sketch at a time. Each chunk is sorted when it is
+        added, so this bounds the sorting cost and memory.
+        By default 10000
+    k : int, optional
+        Capacity of each level of the quantile sketches.
+        By default 200
+    seed : int, optional
+        Seed for the quantile sketches.
+
+    Returns
+    -------
+    tuple
+        Returns (clean, shale), as floats or arrays with one value per zone.
+    """
+    values = np.asarray(values, dtype=float)
+    picker = EndpointPicker(clean_percentile, shale_percentile, zones=zones, k=k, seed=seed)
+    if chunk_size < 1:
+        raise Exception("Enter a valid chunk_size value: at least 1")
+    for start in range(0, values.size, chunk_size):
+        block = slice(start, start + chunk_size)
+        picker.update(values[block], None if depth is None else np.asarray(depth)[block])
+    return picker.endpoints()
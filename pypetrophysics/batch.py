@@ -0,0 +1,113 @@
+"""
+Multi-well batch processing
+"""
+
+import collections
+import concurrent.futures
+import os
+import traceback
+
+from . import las
+
+BatchResult = collections.namedtuple("BatchResult", ["well", "result", "error"])
+
+def _load_well(well, curves):
+    if isinstance(well, (str, os.PathLike)):
+        return las.read_las(well, curves=curves)
+    return well
+
+def _well_label(well):
+    return os.fspath(well) if isinstance(well, (str, os.PathLike)) else None
+
+def _run_wells(recipe, wells, curves):
+    results = []
+    for well in wells:
+        try:
+            results.append((recipe(_load_well(well, curves)), None))
+        except Exception:
+            results.append((None, traceback.format_exc()))
+    return results
+
+def run_batch(wells, recipe, max_workers=None, chunksize=1, curves=None, progress=None, raise_errors=False):
+    """
+    Runs an interpretation recipe over many wells in parallel.
+
+    Wells are distributed across a pool of worker processes. An error in one well
+    is recorded against that well and does not stop the others. If a worker process
+    crashes, or a result cannot be sent back from it, the error is recorded against
+    every well in that chunk. Results are returned
+    in the same order as the input wells regardless of the order in which they finish.
+
+    Parameters
+    ----------
+    wells : list
+        Wells to process. Each well is either a path to a LAS file, which is read in the
+        worker process, or a dict of curve arrays keyed by mnemonic.
+    recipe : function
+        Function called with the curves of a well (dict of arrays) that returns the
+        result for that well, e.g. a module level function or the run method of a
+        workflow.Workflow. It must be picklable so it can be sent to the workers.
+    max_workers : int, optional
+        Number of worker processes. By default the number of CPUs. If 1, wells are run
+        in the current process.
+    chunksize : int, optional
+        Number of wells sent to a worker at a time. Larger values reduce overhead when
+        processing many small wells.
+        By default 1
+    curves : list of string, optional
+        Curve mnemonics to read from LAS files. By default all curves are read.
+    progress : function, optional
+        Called in the main process as progress(completed, total) each time a chunk of
+        wells finishes.
+    raise_errors : bool, optional
+        Raise an exception once all wells have finished if any well failed.
+        By default False
+
+    Returns
+    -------
+    list of BatchResult
+        Returns one BatchResult per well holding the well path (or None for in-memory
+        wells), the recipe result and the error traceback (None if successful).
+
+    Raises
+    ------
+    Exception
+        Raise an exception if chunksize is less than 1.
+    """
+    if chunksize < 1:
+        raise Exception("Enter a valid chunksize value: at least 1")
+    wells = list(wells)
+    chunks = [wells[start:start + chunksize] for start in range(0, len(wells), chunksize)]
+    chunk_results = [None] * len(chunks)
+    completed = 0
+
+    if max_workers == 1:
+        for i, chunk in enumerate(chunks):
+            chunk_results[i] = _run_wells(recipe, chunk, curves)
+            completed += len(chunk)
+            if progress is not None:
+                progress(completed, len(wells))
+    elif chunks:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_wells, recipe, chunk, curves): i for i, chunk in enumerate(chunks)}
+            for future in concurrent.futures.as_completed(futures):
+                i = futures[future]
+                try:
+                    chunk_results[i] = future.result()
+                except Exception:
+                    # A worker crash or a result that cannot be sent back fails the whole
+                    # chunk, but not the other chunks
+                    chunk_results[i] = [(None, traceback.format_exc())] * len(chunks[i])
+                completed += len(chunks[i])
+                if progress is not None:
+                    progress(completed, len(wells))
+
+    results = [BatchResult(_well_label(well), result, error)
+               for well, (result, error) in zip(wells, [item for chunk in chunk_results for item in chunk])]
+
+    if raise_errors:
+        failed = [i for i, result in enumerate(results) if result.error is not None]
+        if failed:
+            raise Exception("{} of {} wells failed. First failure (well {}):\n{}".format(
+                len(failed), len(wells), failed[0], results[failed[0]].error))
+    return results
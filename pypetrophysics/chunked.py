@@ -0,0 +1,202 @@
+"""
+Out-of-core chunked execution
+"""
+
+import os
+
+import numpy as np
+
+def chunk_length(memory_limit, curves, outputs=1, temporaries=8, itemsize=8):
+    """
+    Calculates how many depth samples can be processed at a time within a memory limit.
+
+    Parameters
+    ----------
+    memory_limit : int
+        Memory ceiling in bytes.
+    curves : int
+        Number of input curves.
+    outputs : int, optional
+        Number of output curves.
+        By default 1
+    temporaries : int, optional
+        Number of curve sized intermediate arrays the calculation creates. The default
+        allows for the longest chains of elementwise operations in the library.
+        By default 8
+    itemsize : int, optional
+        Bytes per sample of each array.
+        By default 8
+
+    Returns
+    -------
+    int
+        Returns the number of samples per chunk (at least 1).
+    """
+    return max(int(memory_limit // ((curves + outputs + temporaries) * itemsize)), 1)
+
+class _NpyWriter:
+    """Writes a 1D .npy file sequentially, one chunk at a time."""
+    def __init__(self, path, size, dtype):
+        self.path = os.fspath(path)
+        self.dtype = np.dtype(dtype)
+        self.file = open(self.path, "wb")
+        try:
+            np.lib.format.write_array_header_1_0(self.file, {"descr": np.lib.format.dtype_to_descr(self.dtype),
+                                                              "fortran_order": False, "shape": (size,)})
+        except BaseException:
+            self.discard()
+            raise
+
+    def write(self, block, values):
+        np.asarray(values, dtype=self.dtype).tofile(self.file)
+
+    def close(self):
+        self.file.close()
+        return np.load(self.path, mmap_mode="r")
+
+    def discard(self):
+        """Closes and deletes a partly written file."""
+        self.file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class _ArrayWriter:
+    """Writes chunks into an existing array, flushing memory-mapped arrays as it goes."""
+    def __init__(self, array):
+        self.array = array
+
+    def write(self, block, values):
+        self.array[block] = values
+        if isinstance(self.array, np.memmap):
+            self.array.flush()
+
+    def close(self):
+        return self.array
+
+    def discard(self):
+        pass
+
+def _discard(writers):
+    for writer in writers:
+        writer.discard()
+
+def _writer(out, size, dtype):
+    if out is None:
+        return _ArrayWriter(np.empty(size, dtype=dtype))
+    if isinstance(out, (str, os.PathLike)):
+        return _NpyWriter(out, size, dtype)
+    if len(out) != size:
+        raise Exception("Output array has {} samples, expected {}".format(len(out), size))
+    return _ArrayWriter(out)
+
+def _writers(result, out, size, dtype):
+    if not isinstance(result, dict):
+        if isinstance(out, dict):
+            raise Exception("func returns a single result, out must not be a dict")
+        return _writer(out, size, dtype)
+    if out is None:
+        return {key: _writer(None, size, dtype) for key in result}
+    if not isinstance(out, dict) or not set(out) <= set(result):
+        raise Exception("out must be a dict keyed by result names: {}".format(", ".join(result)))
+    writers = {}
+    try:
+        for key, target in out.items():
+            writers[key] = _writer(target, size, dtype)
+    except BaseException:
+        # Files opened for earlier results are removed if a later one cannot be opened
+        _discard(writers.values())
+        raise
+    return writers
+
+def run_chunked(func, curves, params=None, out=None, memory_limit=64 * 2**20, temporaries=8, dtype="float64", progress=None):
+    """
+    Runs a calculation over curves that may be larger than memory.
+
+    The curves are processed in depth chunks sized so the chunk of every input, output
+    and intermediate array fits within memory_limit, and each chunk of the result is
+    written out before the next is read. Inputs can be memory-mapped arrays, e.g. from
+    np.load(..., mmap_mode="r") or wellstore.Well.read_curve, so only the current chunk
+    is read from disk. Outputs can be .npy files, which are written sequentially, or
+    existing arrays such as those from wellstore.Well.create_curve. Memory use is then
+    flat regardless of the length of the curves (pages of memory-mapped inputs are
+    cached by the operating system but can be reclaimed at any time).
+
+    Parameters
+    ----------
+    func : function
+        Elementwise calculation, e.g. saturation.sw_archie or porosity.porosity_sonic.
+        It may return an array or a dict of arrays (e.g. fused.sw_archie_from_logs).
+    curves : dict
+        Curve arguments of func, keyed by argument name. All must have the same length.
+    params : dict, optional
+        Other arguments of func, passed unchanged to every chunk.
+    out : string, array-like or dict, optional
+        Where to write the result: a path for a new .npy file, or an array to write
+        into. For functions returning a dict, a dict of these keyed by result name, and
+        only the results given are written. By default the result is returned as an
+        in-memory array (or dict of arrays).
+    memory_limit : int, optional
+        Memory ceiling for each chunk, in bytes.
+        By default 64 MiB
+    temporaries : int, optional
+        Number of curve sized intermediate arrays func creates, used to size the chunks.
+        By default 8
+    dtype : string, optional
+        Data type of new output arrays and files.
+        By default float64
+    progress : function, optional
+        Called as progress(samples_done, total_samples) after each chunk.
+
+    Returns
+    -------
+    array-like or dict
+        Returns the output array(s). Outputs written to .npy files are returned
+        memory-mapped read-only. If the calculation fails, the .npy files written so
+        far are deleted.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if the curves have different lengths or an output does not
+        match the curves.
+
+    Examples
+    --------
+        well = store.open_well("15_9-F-1", mode="r+")
+        run_chunked(saturation.sw_archie, {"phi": well["PHIE"], "rt": well["RT"]},
+                    params=dict(rw=0.05, arch_a=1, arch_m=2, arch_n=2),
+                    out=well.create_curve("SW"), memory_limit=256 * 2**20)
+    """
+    params = dict(params or {})
+    lengths = {len(curve) for curve in curves.values()}
+    if len(lengths) != 1:
+        raise Exception("All curves must have the same number of samples")
+    size = lengths.pop()
+    outputs = len(out) if isinstance(out, dict) else 1
+    step = chunk_length(memory_limit, len(curves), outputs, temporaries, np.dtype(dtype).itemsize)
+
+    writers = None
+    try:
+        for start in range(0, size, step):
+            block = slice(start, min(start + step, size))
+            result = func(**{name: curve[block] for name, curve in curves.items()}, **params)
+            if writers is None:
+                writers = _writers(result, out, size, dtype)
+            if isinstance(writers, dict):
+                for key, writer in writers.items():
+                    writer.write(block, result[key])
+            else:
+                writers.write(block, result)
+            if progress is not None:
+                progress(block.stop, size)
+    except BaseException:
+        # Partly written .npy files would look like complete results, so they are deleted
+        if writers is not None:
+            _discard(writers.values() if isinstance(writers, dict) else [writers])
+        raise
+
+    if writers is None:
+        return {} if isinstance(out, dict) else np.empty(0, dtype=dtype)
+    if isinstance(writers, dict):
+        return {key: writer.close() for key, writer in writers.items()}
+    return writers.close()
@@ -15,11 +15,11 @@ def gr_clay_shale_vol(minvalue, maxvalue, inputvalue, method="linear", limit_res
 
     Parameters
     ----------
-    minvalue : float
+    minvalue : float or array-like
         Value representing a 100% clean interval.
-    maxvalue : float
+    maxvalue : float or array-like
         Value representing either 100% clay or 100% shale.
-    inputvalue : float
+    inputvalue : float or array-like
         Gamma ray value from log measurements.
     method : string
         Select method for calculating VClay or VShale:
@@ -42,7 +42,7 @@ def gr_clay_shale_vol(minvalue, maxvalue, inputvalue, method="linear", limit_res
 
     Returns
     -------
-    float
+    float or array-like
         Returns a VShale or VClay in decimal units.
     
     References
@@ -85,11 +85,11 @@ def sp_clay_shale_vol(minvalue, maxvalue, inputvalue, limit_result=False, low_li
 
     Parameters
     ----------
-     minvalue : float
+     minvalue : float or array-like
         Value representing a 100% clean interval.
-    maxvalue : float
+    maxvalue : float or array-like
         Value representing either 100% clay or 100% shale.
-    inputvalue : float
+    inputvalue : float or array-like
         Gamma ray value from log measurements.
     limit_result : bool, optional
         Apply limits to the result value.
@@ -103,7 +103,7 @@ def sp_clay_shale_vol(minvalue, maxvalue, inputvalue, limit_result=False, low_li
 
     Returns
     -------
-    float
+    float or array-like
         Returns a VShale or VClay in decimal units.
     
     References
@@ -124,14 +124,14 @@ def den_neu_shale_vol(neut_porosity, dens_porosity, neut_shale_porosity, dens_sh
 
     Parameters
     ----------
-    neut_porosity : float
+    neut_porosity : float or array-like
         Neutron porosity
-    dens_porosity : float
+    dens_porosity : float or array-like
         Density porosity
-    neut_shale_porosity : [type]
-        [description]
-    dens_shale_porosity : [type]
-        [description]
+    neut_shale_porosity : float or array-like
+        Neutron porosity of the shale point
+    dens_shale_porosity : float or array-like
+        Density porosity of the shale point
    limit_result : bool, optional
         Apply limits to the result value.
         By default False
@@ -144,7 +144,7 @@ def den_neu_shale_vol(neut_porosity, dens_porosity, neut_shale_porosity, dens_sh
 
     Returns
     -------
-    float
+    float or array-like
         Returns a shale volume in decimal units.
 
     References
@@ -165,14 +165,14 @@ def vshale_to_vclay(vshale, multiplier):
 
     Parameters
     ----------
-    vshale : float
+    vshale : float or array-like
         Shale volume
-    multiplier : float
+    multiplier : float or array-like
         Shale to clay multiplier (decimal)
 
     Returns
     -------
-    float
+    float or array-like
         Returns a clay volume.
 
      References
@@ -2,6 +2,11 @@
 Conversion functions
 """
 
+import fractions
+import functools
+
+import numpy as np
+
 # Depth and length conversions
 def ft_to_m(inputvalue):
     """
@@ -107,7 +112,7 @@ def temperature_convert(inputvalue, inputunits, outputunits):
 
     Parameters
     ----------
-    inputvalue : float
+    inputvalue : float or array-like
         Input temperature value
     inputunits : string
         Input temperature units:
@@ -122,33 +127,196 @@ def temperature_convert(inputvalue, inputunits, outputunits):
 
     Returns
     -------
-    float
+    float or array-like
         Returns temperature value in required units.
     """
-    if inputunits.lower() == "c":
-        if outputunits.lower() == "f":
-            return (9/5)*inputvalue+32
-        elif outputunits.lower() == "k":
-            return inputvalue + 273.15
-        elif outputunits.lower() == "c":
-            return inputvalue
-    
-    if inputunits.lower() == "f":
-        if outputunits.lower() == "c":
-            return (5/9)*inputvalue-32
-        elif outputunits.lower() == "k":
-            return (inputvalue-32) * (5/9)+273.15
-        elif outputunits.lower() == "f":
-            return inputvalue
-    
-    if inputunits.lower() == "k":
-        if outputunits.lower() == "c":
-            return inputvalue - 273.15
-        elif outputunits.lower() == "f":
-            return (inputvalue-273.15)*(9/5)+32
-        elif outputunits.lower() == "k":
-            return inputvalue
-    units = ["k", "c", "f"]
-    
-    if inputunits.lower() not in units or outputunits.lower() not in units:
-        raise Exception("Enter a valid temperature inputunit or outputunit value. Must be: c, f or k")
\ No newline at end of file
+    scale, offset, _ = _compile_temperature(inputunits, outputunits)
+    return inputvalue * scale + offset
+
+# Unit registry
+# Each unit is stored as (quantity, scale, offset), converting to the base unit of its
+# quantity as: base = value * scale + offset
+UNITS = {}
+
+# Conversion constants between quantities that are reciprocals of each other, in base units
+RECIPROCALS = {
+    ("slowness", "velocity"): 10**6,
+    ("velocity", "slowness"): 10**6,
+}
+
+# Units accepted by temperature_convert
+TEMPERATURE_UNITS = ("k", "c", "f")
+
+def register_unit(name, quantity, scale, offset=0, aliases=()):
+    """
+    Adds a unit to the unit registry.
+
+    Parameters
+    ----------
+    name : string
+        Unit name. Unit names are not case sensitive.
+    quantity : string
+        Quantity the unit measures, e.g. length.
+    scale : float or fractions.Fraction
+        Multiplier converting the unit to the base unit of the quantity.
+    offset : float or fractions.Fraction, optional
+        Offset added after scaling to convert to the base unit.
+        By default 0
+    aliases : list of string, optional
+        Other names for the unit.
+    """
+    for unit in (name,) + tuple(aliases):
+        UNITS[unit.lower()] = (quantity, fractions.Fraction(scale), fractions.Fraction(offset))
+    _clear_cache()
+
+def unit_quantity(units):
+    """
+    Returns the quantity measured by a unit.
+
+    Parameters
+    ----------
+    units : string
+        Unit name.
+
+    Returns
+    -------
+    string
+        Returns the quantity, e.g. length or temperature.
+    """
+    return _lookup(units)[0]
+
+def _lookup(units):
+    try:
+        return UNITS[units.lower()]
+    except KeyError:
+        raise Exception("Unknown unit: {}".format(units))
+
+@functools.lru_cache(maxsize=None)
+def _compile_conversion(inputunits, outputunits):
+    # Returns (scale, offset, reciprocal). Affine conversions are value * scale + offset,
+    # reciprocal conversions are scale / value.
+    in_quantity, in_scale, in_offset = _lookup(inputunits)
+    out_quantity, out_scale, out_offset = _lookup(outputunits)
+    # Combined exactly as fractions so that e.g. c -> f is exactly 1.8 and 32
+    if in_quantity == out_quantity:
+        return float(in_scale / out_scale), float((in_offset - out_offset) / out_scale), False
+    if (in_quantity, out_quantity) in RECIPROCALS:
+        return float(RECIPROCALS[(in_quantity, out_quantity)] / (in_scale * out_scale)), 0, True
+    raise Exception("Cannot convert {} ({}) to {} ({})".format(inputunits, in_quantity, outputunits, out_quantity))
+
+@functools.lru_cache(maxsize=None)
+def _compile_temperature(inputunits, outputunits):
+    # Validated once per pair of units, like the other conversions
+    if inputunits.lower() not in TEMPERATURE_UNITS or outputunits.lower() not in TEMPERATURE_UNITS:
+        raise Exception("Enter a valid temperature inputunit or outputunit value. Must be: c, f or k")
+    return _compile_conversion(inputunits, outputunits)
+
+def _clear_cache():
+    _compile_conversion.cache_clear()
+    _compile_temperature.cache_clear()
+
+def convert_units(inputvalue, inputunits, outputunits):
+    """
+    Converts values between units using the unit registry.
+
+    Each pair of units is compiled once into a scale and offset, so repeated conversions
+    involve no string handling. Input units may be given per sample to convert arrays
+    of mixed units in one pass.
+
+    Parameters
+    ----------
+    inputvalue : float or array-like
+        Input value.
+    inputunits : string or array-like
+        Input units, either one unit for all values or an array of units with the same
+        length as inputvalue.
+    outputunits : string
+        Output units.
+
+    Returns
+    -------
+    float or array-like
+        Returns the value in the output units.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if a unit is unknown or the units measure different quantities.
+    """
+    if isinstance(inputunits, str):
+        scale, offset, reciprocal = _compile_conversion(inputunits, outputunits)
+        if reciprocal:
+            return scale / inputvalue
+        return inputvalue * scale + offset if offset else inputvalue * scale
+
+    unique_units, inverse = np.unique(np.asarray(inputunits, dtype=str), return_inverse=True)
+    conversions = [_compile_conversion(units, outputunits) for units in unique_units]
+    if any(reciprocal for _, _, reciprocal in conversions):
+        raise Exception("Reciprocal conversions are not supported for arrays of mixed units")
+    scale = np.array([conversion[0] for conversion in conversions])[inverse]
+    offset = np.array([conversion[1] for conversion in conversions])[inverse]
+    return np.asarray(inputvalue, dtype=float) * scale + offset
+
+def convert_curves(curves, units, outputunits):
+    """
+    Converts a dictionary of curves to new units in place.
+
+    Parameters
+    ----------
+    curves : dict
+        Curve arrays keyed by curve name. Float arrays are converted in place, other
+        values are replaced in the dictionary.
+    units : dict
+        Units of each curve keyed by curve name. Updated with the new units. Curves
+        without units, or with units not in the registry, are left unchanged.
+    outputunits : dict
+        Target units keyed by curve name or by quantity (e.g. {"length": "m",
+        "temperature": "c"}). Curve names take precedence over quantities.
+
+    Returns
+    -------
+    dict
+        Returns the updated units.
+    """
+    for name, values in curves.items():
+        if name not in units or units[name].lower() not in UNITS:
+            continue
+        target = outputunits.get(name, outputunits.get(unit_quantity(units[name])))
+        if target is None or target.lower() == units[name].lower():
+            continue
+        scale, offset, reciprocal = _compile_conversion(units[name], target)
+        if isinstance(values, np.ndarray) and values.dtype.kind == "f" and values.flags.writeable:
+            if reciprocal:
+                np.divide(scale, values, out=values)
+            else:
+                values *= scale
+                values += offset
+        else:
+            curves[name] = convert_units(values, units[name], target)
+        units[name] = target
+    return units
+
+register_unit("m", "length", 1, aliases=["metre", "meter", "metres", "meters"])
+register_unit("ft", "length", fractions.Fraction("0.3048"), aliases=["feet", "foot"])
+register_unit("in", "length", fractions.Fraction("0.0254"), aliases=["inch", "inches"])
+register_unit("cm", "length", fractions.Fraction(1, 100))
+register_unit("mm", "length", fractions.Fraction(1, 1000))
+register_unit("km", "length", 1000)
+
+register_unit("us/ft", "slowness", 1, aliases=["usec/ft", "us/f"])
+register_unit("us/m", "slowness", fractions.Fraction("0.3048"), aliases=["usec/m"])
+register_unit("ft/s", "velocity", 1, aliases=["ft/sec", "f/s"])
+register_unit("m/s", "velocity", 1 / fractions.Fraction("0.3048"), aliases=["m/sec"])
+register_unit("km/s", "velocity", 1000 / fractions.Fraction("0.3048"))
+
+register_unit("c", "temperature", 1, aliases=["degc", "deg c"])
+register_unit("f", "temperature", fractions.Fraction(5, 9), fractions.Fraction(-160, 9), aliases=["degf", "deg f"])
+register_unit("k", "temperature", 1, fractions.Fraction("-273.15"), aliases=["degk", "deg k"])
+
+register_unit("g/cc", "density", 1, aliases=["g/cm3", "g/c3"])
+register_unit("kg/m3", "density", fractions.Fraction(1, 1000), aliases=["k/m3"])
+
+register_unit("ohmm", "resistivity", 1, aliases=["ohm.m", "ohm-m", "ohmm.m"])
+
+register_unit("decimal", "fraction", 1, aliases=["v/v", "dec", "frac"])
+register_unit("percent", "fraction", fractions.Fraction(1, 100), aliases=["%", "pu"])
@@ -0,0 +1,213 @@
+"""
+Density-neutron crossplot analysis
+"""
+
+import numpy as np
+
+class Crossplot:
+    """
+    Fixed-bin 2D histogram of neutron porosity (x) against density porosity (y).
+
+    Samples are binned with a single bincount, so building the histogram is linear in the
+    number of samples, and the memory used depends only on the number of bins. Histograms
+    with the same bins can be merged, e.g. to combine the wells of a field. The shale
+    point and clean line are estimated from the histogram counts.
+
+    Parameters
+    ----------
+    neutron_range : tuple, optional
+        Neutron porosity range (decimal) of the histogram.
+        By default (-0.15, 0.6)
+    density_range : tuple, optional
+        Density porosity range (decimal) of the histogram.
+        By default (-0.15, 0.6)
+    bins : int or tuple, optional
+        Number of bins along each axis, or (neutron bins, density bins).
+        By default 150
+    """
+    def __init__(self, neutron_range=(-0.15, 0.6), density_range=(-0.15, 0.6), bins=150):
+        self.neutron_range = tuple(neutron_range)
+        self.density_range = tuple(density_range)
+        self.bins = (bins, bins) if np.ndim(bins) == 0 else tuple(bins)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+
+    @property
+    def neutron_edges(self):
+        """Neutron porosity bin edges."""
+        return np.linspace(self.neutron_range[0], self.neutron_range[1], self.bins[0] + 1)
+
+    @property
+    def density_edges(self):
+        """Density porosity bin edges."""
+        return np.linspace(self.density_range[0], self.density_range[1], self.bins[1] + 1)
+
+    @property
+    def total(self):
+        """Number of samples in the histogram."""
+        return int(self.counts.sum())
+
+    def add(self, neut_porosity, dens_porosity):
+        """
+        Adds samples to the histogram. Samples with NaN values or outside the ranges
+        are ignored.
+
+        Parameters
+        ----------
+        neut_porosity : array-like
+            Neutron porosity (decimal)
+        dens_porosity : array-like
+            Density porosity (decimal)
+        """
+        x = self._bin_index(neut_porosity, self.neutron_range, self.bins[0])
+        y = self._bin_index(dens_porosity, self.density_range, self.bins[1])
+        valid = (x >= 0) & (y >= 0)
+        self.counts += np.bincount(x[valid] * self.bins[1] + y[valid],
+                                   minlength=self.bins[0] * self.bins[1]).reshape(self.bins)
+
+    def merge(self, other):
+        """
+        Adds the counts of another crossplot with the same bins.
+
+        Parameters
+        ----------
+        other : Crossplot
+            Crossplot to merge into this one.
+
+        Returns
+        -------
+        Crossplot
+            Returns this crossplot.
+        """
+        if (other.bins, other.neutron_range, other.density_range) != (self.bins, self.neutron_range, self.density_range):
+            raise Exception("Crossplots must have the same ranges and bins to be merged")
+        self.counts += other.counts
+        return self
+
+    def separation_percentile(self, percentile):
+        """
+        Estimates percentiles of the neutron-density separation (neutron minus density
+        porosity) of the samples.
+
+        Parameters
+        ----------
+        percentile : float or array-like
+            Percentile(s) between 0 and 100.
+
+        Returns
+        -------
+        float or array-like
+            Returns the separation at each percentile (decimal).
+        """
+        separation, counts = self._separation()
+        order = np.argsort(separation, kind="stable")
+        cumulative = np.cumsum(counts[order])
+        if cumulative[-1] == 0:
+            return np.full(np.shape(percentile), np.nan)[()]
+        index = np.searchsorted(cumulative, np.asarray(percentile) / 100 * cumulative[-1], side="left")
+        return separation[order][np.minimum(index, separation.size - 1)][()]
+
+    def shale_point(self, percentile=95):
+        """
+        Estimates the shale point.
+
+        The shale point is taken as the count weighted centre of the samples whose
+        neutron-density separation is at or above the given percentile.
+
+        Parameters
+        ----------
+        percentile : float, optional
+            Separation percentile that defines shale samples.
+            By default 95
+
+        Returns
+        -------
+        tuple
+            Returns (neut_shale_porosity, dens_shale_porosity), which can be passed to
+            clayshale.den_neu_shale_vol.
+        """
+        separation = self._separation()[0].reshape(self.bins)
+        weights = np.where(separation >= self.separation_percentile(percentile), self.counts, 0)
+        if weights.sum() == 0:
+            return np.nan, np.nan
+        x, y = self._centres()
+        return (float(np.sum(weights.sum(axis=1) * x) / weights.sum()),
+                float(np.sum(weights.sum(axis=0) * y) / weights.sum()))
+
+    def clean_line(self, percentile=5):
+        """
+        Estimates the clean line.
+
+        A line of density porosity against neutron porosity is fitted by count weighted
+        least squares to the samples whose neutron-density separation is at or below the
+        given percentile.
+
+        Parameters
+        ----------
+        percentile : float, optional
+            Separation percentile that defines clean samples.
+            By default 5
+
+        Returns
+        -------
+        tuple
+            Returns (slope, intercept) of dens_porosity = slope * neut_porosity + intercept.
+        """
+        separation = self._separation()[0].reshape(self.bins)
+        weights = np.where(separation <= self.separation_percentile(percentile), self.counts, 0).astype(float)
+        x, y = np.meshgrid(*self._centres(), indexing="ij")
+        total = weights.sum()
+        if total == 0:
+            return np.nan, np.nan
+        x_mean = np.sum(weights * x) / total
+        y_mean = np.sum(weights * y) / total
+        slope = np.sum(weights * (x - x_mean) * (y - y_mean)) / np.sum(weights * (x - x_mean)**2)
+        return float(slope), float(y_mean - slope * x_mean)
+
+    def _centres(self):
+        x = self.neutron_edges
+        y = self.density_edges
+        return (x[:-1] + x[1:]) / 2, (y[:-1] + y[1:]) / 2
+
+    def _separation(self):
+        x, y = self._centres()
+        return np.subtract.outer(x, y).ravel(), self.counts.ravel()
+
+    @staticmethod
+    def _bin_index(values, value_range, bins):
+        values = np.asarray(values, dtype=float).ravel()
+        low, high = value_range
+        inside = (values >= low) & (values <= high)
+        index = np.full(values.size, -1, dtype=np.int64)
+        index[inside] = np.minimum(((values[inside] - low) * (bins / (high - low))).astype(np.int64), bins - 1)
+        return index
+
+def crossplot_endpoints(neut_porosity, dens_porosity, shale_percentile=95, clean_percentile=5, **kwargs):
+    """
+    Estimates the density-neutron shale point and clean line of a set of samples.
+
+    Parameters
+    ----------
+    neut_porosity : array-like
+        Neutron porosity (decimal)
+    dens_porosity : array-like
+        Density porosity (decimal)
+    shale_percentile : float, optional
+        Separation percentile that defines shale samples.
+        By default 95
+    clean_percentile : float, optional
+        Separation percentile that defines clean samples.
+        By default 5
+    **kwargs
+        Histogram ranges and bins passed to Crossplot.
+
+    Returns
+    -------
+    dict
+        Returns neut_shale_porosity, dens_shale_porosity, clean_slope and clean_intercept.
+    """
+    plot = Crossplot(**kwargs)
+    plot.add(neut_porosity, dens_porosity)
+    neut_shale, dens_shale = plot.shale_point(shale_percentile)
+    slope, intercept = plot.clean_line(clean_percentile)
+    return {"neut_shale_porosity": neut_shale, "dens_shale_porosity": dens_shale,
+            "clean_slope": slope, "clean_intercept": intercept}
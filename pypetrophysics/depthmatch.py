@@ -0,0 +1,217 @@
+"""
+Depth matching by cross-correlation
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from . import resample
+
+def _depth_step(depth):
+    depth = np.asarray(depth, dtype=float)
+    steps = np.diff(depth)
+    if depth.size < 2 or not np.allclose(steps, steps[0], rtol=1e-6):
+        raise Exception("Depths must be regularly sampled. Use resample.depth_grid and resample.Resampler first.")
+    return steps[0]
+
+def _check_lengths(depth, reference, curve):
+    depth, reference, curve = [np.asarray(values, dtype=float) for values in (depth, reference, curve)]
+    if not depth.shape == reference.shape == curve.shape or depth.ndim != 1:
+        raise Exception("Curves and depths must be the same length")
+    return depth, reference, curve
+
+def _standardize(windows):
+    """Standardizes each row with its valid samples. Returns (values with NaN set to 0, valid mask)."""
+    valid = ~np.isnan(windows)
+    count = np.maximum(valid.sum(axis=1, keepdims=True), 1)
+    values = np.where(valid, windows, 0)
+    mean = values.sum(axis=1, keepdims=True) / count
+    values = np.where(valid, values - mean, 0)
+    std = np.sqrt((values**2).sum(axis=1, keepdims=True) / count)
+    values /= np.where(std > 0, std, 1)
+    return values, valid.astype(float)
+
+def _correlate(reference, curve, max_lag, min_overlap):
+    """
+    Cross-correlates each row of curve (length n) with the same row of reference
+    (length n + 2 * max_lag) using FFTs, for lags -max_lag to max_lag.
+
+    Returns (lags, correlations) with the sub-sample lag of the best match in each row.
+    """
+    reference, reference_valid = _standardize(reference)
+    curve, curve_valid = _standardize(curve)
+    size = 1 << int(np.ceil(np.log2(reference.shape[1] + 1)))
+
+    def correlation(a, b):
+        return np.fft.irfft(np.fft.rfft(a, size) * np.conj(np.fft.rfft(b, size)), size)[:, :2 * max_lag + 1]
+
+    total = correlation(reference, curve)
+    overlap = correlation(reference_valid, curve_valid)
+    required = min_overlap * curve_valid.sum(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.where((overlap > 0.5) & (overlap >= required), total / np.maximum(overlap, 1), -np.inf)
+
+    rows = np.arange(len(score))
+    best = np.argmax(score, axis=1)
+    peak = score[rows, best]
+    # Parabolic refinement of the peak position between neighbouring lags
+    inner = (best > 0) & (best < 2 * max_lag)
+    left = score[rows, np.maximum(best - 1, 0)]
+    right = score[rows, np.minimum(best + 1, 2 * max_lag)]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        curvature = left - 2 * peak + right
+        offset = np.where(inner & np.isfinite(left) & np.isfinite(right) & (curvature < 0),
+                          0.5 * (left - right) / curvature, 0)
+    lags = best - max_lag + offset
+    found = np.isfinite(peak)
+    return np.where(found, lags, np.nan), np.where(found, peak, np.nan)
+
+def bulk_shift(depth, reference, curve, max_shift, min_overlap=0.5):
+    """
+    Estimates a single depth shift between a curve and a reference curve.
+
+    The shift is found from the peak of the cross-correlation of the two curves, which
+    is calculated for all lags at once with FFTs rather than by scanning lags.
+
+    Parameters
+    ----------
+    depth : array-like
+        Regularly sampled depths of both curves.
+    reference : array-like
+        Reference curve, e.g. gamma ray from the base run.
+    curve : array-like
+        Curve to match, e.g. gamma ray from a repeat run.
+    max_shift : float
+        Largest shift to search for, in depth units.
+    min_overlap : float, optional
+        Fraction of the valid curve samples that must overlap valid reference samples
+        for a lag to be considered.
+        By default 0.5
+
+    Returns
+    -------
+    tuple
+        Returns (shift, correlation). The curve recorded at depth d belongs at depth
+        d + shift, and correlation is the correlation coefficient at that shift. Both
+        are NaN if no shift could be found.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if max_shift is not positive, the curves and depths differ
+        in length or the depths are not regularly sampled.
+    """
+    if max_shift <= 0:
+        raise Exception("Enter a valid max_shift value: greater than 0")
+    depth, reference, curve = _check_lengths(depth, reference, curve)
+    step = _depth_step(depth)
+    max_lag = int(np.ceil(max_shift / step))
+    padded = np.concatenate([np.full(max_lag, np.nan), reference, np.full(max_lag, np.nan)])
+    lags, peaks = _correlate(padded[None, :], curve[None, :], max_lag, min_overlap)
+    return float(lags[0] * step), float(peaks[0])
+
+def windowed_shifts(depth, reference, curve, window, max_shift, step=None, min_overlap=0.5):
+    """
+    Estimates depth shifts window by window, for curves whose depth error varies along the well.
+
+    All windows are cross-correlated together with batched FFTs.
+
+    Parameters
+    ----------
+    depth : array-like
+        Regularly sampled depths of both curves.
+    reference : array-like
+        Reference curve.
+    curve : array-like
+        Curve to match.
+    window : float
+        Window length, in depth units.
+    max_shift : float
+        Largest shift to search for in each window, in depth units.
+    step : float, optional
+        Distance between window centres, in depth units. By default half the window.
+    min_overlap : float, optional
+        Fraction of the valid curve samples in a window that must overlap valid reference
+        samples for a lag to be considered.
+        By default 0.5
+
+    Returns
+    -------
+    tuple
+        Returns (centre depths, shifts, correlations) of the windows. Windows where no
+        shift could be found are NaN.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if window, max_shift or step is not positive, the curves and
+        depths differ in length, the depths are not regularly sampled or the window is
+        longer than the curves.
+    """
+    if window <= 0 or max_shift <= 0 or (step is not None and step <= 0):
+        raise Exception("Enter valid window, max_shift and step values: greater than 0")
+    depth, reference, curve = _check_lengths(depth, reference, curve)
+    sample = _depth_step(depth)
+    length = max(int(round(window / sample)), 2)
+    stride = max(int(round((step if step is not None else window / 2) / sample)), 1)
+    max_lag = int(np.ceil(max_shift / sample))
+    if curve.size < length:
+        raise Exception("The window is longer than the curves")
+    padded = np.concatenate([np.full(max_lag, np.nan), reference, np.full(max_lag, np.nan)])
+
+    curve_windows = sliding_window_view(curve, length)[::stride]
+    reference_windows = sliding_window_view(padded, length + 2 * max_lag)[::stride]
+    lags, peaks = _correlate(reference_windows, curve_windows, max_lag, min_overlap)
+    centres = depth[np.arange(len(curve_windows)) * stride + (length - 1) // 2] + ((length - 1) % 2) * sample / 2
+    return centres, lags * sample, peaks
+
+def apply_shifts(depth, curves, shift, shift_depth=None, method="linear"):
+    """
+    Applies depth shifts to all the curves of a run.
+
+    Each curve is moved to its corrected depth (depth + shift) and resampled back onto
+    the original depths, with one set of resampling indices shared by all curves.
+
+    Parameters
+    ----------
+    depth : array-like
+        Depths of the curves, in increasing order.
+    curves : dict or array-like
+        Curves of the run, keyed by name, or a 1D or 2D array.
+    shift : float or array-like
+        A bulk shift, or shifts at shift_depth (e.g. from windowed_shifts), which are
+        linearly interpolated between and held constant beyond the end points. NaN shifts
+        are ignored.
+    shift_depth : array-like, optional
+        Depths of the shifts. Required if shift is an array.
+    method : string, optional
+        Resampling method passed to resample.Resampler.
+        By default linear
+
+    Returns
+    -------
+    dict or array-like
+        Returns the shifted curves on the original depths, in the same form as the input.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if there are no valid (non NaN) shifts or the shifts would
+        reverse the order of the samples.
+    """
+    depth = np.asarray(depth, dtype=float)
+    if np.ndim(shift) == 0:
+        if np.isnan(shift):
+            raise Exception("No valid shifts")
+        corrected = depth + shift
+    else:
+        if shift_depth is None:
+            raise Exception("Enter the depths of the shifts")
+        shift = np.asarray(shift, dtype=float)
+        known = ~np.isnan(shift)
+        if not known.any():
+            raise Exception("No valid shifts")
+        corrected = depth + np.interp(depth, np.asarray(shift_depth, dtype=float)[known], shift[known])
+    if np.any(np.diff(corrected) <= 0):
+        raise Exception("The shifts change faster than the sample spacing and would reverse the sample order")
+    return resample.Resampler(corrected, depth, method).apply(curves)
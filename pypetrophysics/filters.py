@@ -0,0 +1,176 @@
+"""
+Curve conditioning filters
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+def _check_window(window):
+    if window < 1 or window % 2 == 0:
+        raise Exception("Enter a valid window: a positive odd number of samples")
+    return window // 2
+
+def _window_median(windows):
+    """Median of each row, ignoring NaN. np.sort places NaN last, so the median is taken from the valid head of each row."""
+    ordered = np.sort(windows, axis=1)
+    count = windows.shape[1] - np.count_nonzero(np.isnan(ordered), axis=1)
+    rows = np.arange(len(ordered))
+    return (ordered[rows, np.maximum(count - 1, 0) // 2] + ordered[rows, count // 2]) / 2
+
+def _blocks(values, window, max_block_memory):
+    """
+    Yields (block, windows) with the centred windows of each block of samples, padded with NaN at the ends.
+
+    The number of samples per block is chosen so an array of all the windows of a block
+    (block length x window float64 values) fits in max_block_memory bytes.
+    """
+    half = _check_window(window)
+    padded = np.concatenate([np.full(half, np.nan), values, np.full(half, np.nan)])
+    block_size = max(1, int(max_block_memory // (window * 8)))
+    for start in range(0, values.size, block_size):
+        stop = min(start + block_size, values.size)
+        yield slice(start, stop), sliding_window_view(padded[start:stop + 2 * half], window)
+
+def running_median(values, window, max_block_memory=8 * 2**20):
+    """
+    Centred running median.
+
+    NaN values are ignored, and windows are truncated at the ends of the curve. The
+    windows of a block of samples are sorted together as one array operation, which for
+    the short windows used on log curves is much faster than updating a heap sample by
+    sample. The curve is processed in blocks sized so the windows of a block take about
+    max_block_memory bytes, so memory use does not depend on the length of the curve
+    or grow with the window length.
+
+    Parameters
+    ----------
+    values : array-like
+        Curve values.
+    window : int
+        Window length in samples (odd).
+    max_block_memory : int, optional
+        Approximate memory limit in bytes for the windows of each block of samples.
+        By default 8 MB
+
+    Returns
+    -------
+    array-like
+        Returns the filtered curve. NaN where a window has no valid values.
+    """
+    values = np.asarray(values, dtype=float)
+    result = np.empty(values.size)
+    for block, windows in _blocks(values, window, max_block_memory):
+        result[block] = _window_median(windows)
+    return result
+
+def moving_average(values, window):
+    """
+    Centred moving average calculated from prefix sums.
+
+    NaN values are ignored, and windows are truncated at the ends of the curve. The cost
+    does not depend on the window length.
+
+    Parameters
+    ----------
+    values : array-like
+        Curve values.
+    window : int
+        Window length in samples (odd).
+
+    Returns
+    -------
+    array-like
+        Returns the filtered curve. NaN where a window has no valid values.
+    """
+    values = np.asarray(values, dtype=float)
+    half = _check_window(window)
+    padded = np.concatenate([np.full(half, np.nan), values, np.full(half, np.nan)])
+    valid = ~np.isnan(padded)
+    sums = np.concatenate([[0], np.cumsum(np.where(valid, padded, 0))])
+    counts = np.concatenate([[0], np.cumsum(valid)])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (sums[window:] - sums[:-window]) / (counts[window:] - counts[:-window])
+
+def hampel(values, window, n_sigmas=3, return_mask=False, max_block_memory=8 * 2**20):
+    """
+    Hampel despiking filter.
+
+    A sample is a spike if it differs from the running median by more than n_sigmas
+    times the scaled median absolute deviation (1.4826 * MAD) of its window. Spikes are
+    replaced by the running median. NaN values are ignored and left unchanged.
+
+    Parameters
+    ----------
+    values : array-like
+        Curve values.
+    window : int
+        Window length in samples (odd).
+    n_sigmas : float, optional
+        Threshold in standard deviations.
+        By default 3
+    return_mask : bool, optional
+        Also return a boolean array marking the spikes.
+        By default False
+    max_block_memory : int, optional
+        Approximate memory limit in bytes for the windows of each block of samples.
+        By default 8 MB
+
+    Returns
+    -------
+    array-like or tuple
+        Returns the despiked curve, or (despiked curve, spike mask) if return_mask is True.
+
+    References
+    ----------
+    Pearson, R. K. (2002) 'Outliers in process modeling and identification', IEEE Transactions on Control Systems Technology, 10(1), pp. 55-63.
+    """
+    values = np.asarray(values, dtype=float)
+    result = values.copy()
+    spikes = np.zeros(values.size, dtype=bool)
+    for block, windows in _blocks(values, window, max_block_memory):
+        median = _window_median(windows)
+        mad = _window_median(np.abs(windows - median[:, None]))
+        with np.errstate(invalid="ignore"):
+            spike = np.abs(values[block] - median) > n_sigmas * 1.4826 * mad
+        spikes[block] = spike
+        result[block][spike] = median[spike]
+    if return_mask:
+        return result, spikes
+    return result
+
+def washout_mask(caliper, bit_size, threshold=1, pad=0):
+    """
+    Flags washed out hole from the caliper.
+
+    Parameters
+    ----------
+    caliper : array-like
+        Caliper (in)
+    bit_size : float or array-like
+        Bit size (in)
+    threshold : float, optional
+        Enlargement over bit size that counts as a washout (in).
+        By default 1
+    pad : int, optional
+        Number of samples flagged either side of each washout, to allow for the
+        vertical resolution of pad tools.
+        By default 0
+
+    Returns
+    -------
+    array-like
+        Returns a boolean array, True where the hole is washed out. Samples with a NaN
+        caliper are not flagged.
+
+    Examples
+    --------
+        rhob_clean = np.where(washout_mask(cali, 8.5), np.nan, rhob)
+    """
+    caliper = np.asarray(caliper, dtype=float)
+    with np.errstate(invalid="ignore"):
+        mask = caliper - bit_size > threshold
+    if pad > 0:
+        counts = np.concatenate([[0], np.cumsum(mask)])
+        index = np.arange(mask.size)
+        mask = counts[np.minimum(index + pad + 1, mask.size)] - counts[np.maximum(index - pad, 0)] > 0
+    return mask
@@ -0,0 +1,101 @@
+"""
+Fused multi-step calculations
+"""
+
+import numpy as np
+
+from . import clayshale, porosity, saturation
+
+FUSED_OUTPUTS = ("vsh", "phit", "phie", "sw")
+
+def _tile(value, block):
+    return value[block] if np.ndim(value) else value
+
+def sw_archie_from_logs(rhob, gr, rt, rhomatrix, rhofluid, gr_clean, gr_shale, phi_shale, rw, arch_a, arch_m, arch_n,
+                        vsh_method="linear", limit_result=True, out=None, block_size=32768):
+    """
+    Calculates shale volume, porosity and Archie water saturation from raw logs in a single pass.
+
+    Equivalent to chaining clayshale.gr_clay_shale_vol, porosity.porosity_density,
+    porosity.porosity_effective and saturation.sw_archie, but the chain is evaluated
+    tile by tile so intermediate results stay in cache. Apart from the outputs, memory
+    use depends on block_size and not on the length of the logs.
+
+    Parameters
+    ----------
+    rhob : array-like
+        Bulk density (g/cc)
+    gr : array-like
+        Gamma ray (API)
+    rt : array-like
+        True formation resistivity (ohm.m)
+    rhomatrix : float or array-like
+        Matrix density (g/cc)
+    rhofluid : float or array-like
+        Fluid density (g/cc)
+    gr_clean : float or array-like
+        Gamma ray value representing a 100% clean interval.
+    gr_shale : float or array-like
+        Gamma ray value representing 100% shale.
+    phi_shale : float or array-like
+        Shale porosity (decimal), used to convert total to effective porosity.
+    rw : float or array-like
+        Water resistivity (ohm.m)
+    arch_a : float or array-like
+        a - Archie Tortuosity Factor
+    arch_m : float or array-like
+        m - Archie Cementation Exponent
+    arch_n : float or array-like
+        n - Archie Saturation Exponent
+    vsh_method : string, optional
+        Shale volume method passed to clayshale.gr_clay_shale_vol.
+        By default linear
+    limit_result : bool, optional
+        Limit shale volume and water saturation to 0 - 1 and porosities to 0 - 0.6, as
+        with the limits of the individual functions.
+        By default True
+    out : dict, optional
+        Arrays to write the results into, keyed by any of vsh, phit, phie and sw. Only
+        the results given are written. By default new arrays are allocated for all four.
+    block_size : int, optional
+        Number of depth samples evaluated at a time.
+        By default 32768
+
+    Returns
+    -------
+    dict
+        Returns the vsh, phit, phie and sw curves (or only those given in out).
+
+    Raises
+    ------
+    Exception
+        Raise an exception if out contains an unknown key or an array of the wrong length.
+    """
+    rhob, gr, rt = [np.asarray(curve) for curve in (rhob, gr, rt)]
+    size = np.broadcast_shapes(rhob.shape, gr.shape, rt.shape)[0]
+    if out is None:
+        out = {name: np.empty(size) for name in FUSED_OUTPUTS}
+    for name, array in out.items():
+        if name not in FUSED_OUTPUTS:
+            raise Exception("Enter valid out keys: vsh, phit, phie, sw")
+        if len(array) != size:
+            raise Exception("out array {} has {} samples, expected {}".format(name, len(array), size))
+
+    params = [rhomatrix, rhofluid, gr_clean, gr_shale, phi_shale, rw, arch_a, arch_m, arch_n]
+    for start in range(0, size, block_size):
+        block = slice(start, min(start + block_size, size))
+        rhomatrix_t, rhofluid_t, gr_clean_t, gr_shale_t, phi_shale_t, rw_t, a_t, m_t, n_t = [_tile(p, block) for p in params]
+
+        vsh = clayshale.gr_clay_shale_vol(gr_clean_t, gr_shale_t, _tile(gr, block), vsh_method, limit_result=limit_result)
+        phit = porosity.porosity_density(rhomatrix_t, rhofluid_t, _tile(rhob, block), limit_result=limit_result)
+        phie = porosity.porosity_effective(phit, vsh, phi_shale_t)
+        if limit_result:
+            np.clip(phie, 0, 0.6, out=phie)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sw = saturation.sw_archie(phie, rw_t, _tile(rt, block), a_t, m_t, n_t, limit_result=limit_result)
+
+        for name, values in (("vsh", vsh), ("phit", phit), ("phie", phie), ("sw", sw)):
+            if name in out:
+                out[name][block] = values
+
+    return out
@@ -0,0 +1,172 @@
+"""
+LAS file reading
+"""
+
+import itertools
+
+import numpy as np
+
+def _parse_header_line(line):
+    # MNEM.UNIT  DATA : DESCRIPTION
+    mnemonic, _, rest = line.partition(".")
+    if rest.startswith(" "):
+        unit = ""
+    else:
+        unit, _, rest = rest.partition(" ")
+    if ":" in rest:
+        data, _, description = rest.rpartition(":")
+    else:
+        data, description = rest, ""
+    return mnemonic.strip(), unit.strip(), data.strip(), description.strip()
+
+def _read_header(las_file):
+    header = {"version": {}, "well": {}, "curves": [], "parameters": {}, "null": None, "wrap": False}
+    sections = {"V": "version", "W": "well", "P": "parameters"}
+    section = None
+    for line in las_file:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("~"):
+            section = line[1:2].upper()
+            if section == "A":
+                break
+            continue
+        mnemonic, unit, data, description = _parse_header_line(line)
+        if section == "C":
+            existing = [curve["mnemonic"].split(":")[0] for curve in header["curves"]]
+            if mnemonic in existing:
+                mnemonic = "{}:{}".format(mnemonic, existing.count(mnemonic) + 1)
+            header["curves"].append({"mnemonic": mnemonic, "unit": unit, "description": description})
+        elif section in sections:
+            header[sections[section]][mnemonic.upper()] = {"unit": unit, "value": data, "description": description}
+    else:
+        raise Exception("No ~A section found in LAS file")
+
+    version = header["version"].get("VERS", {}).get("value", "2.0")
+    if float(version) >= 3:
+        raise Exception("Only LAS 1.2 and 2.0 files are supported")
+    header["wrap"] = header["version"].get("WRAP", {}).get("value", "NO").upper() == "YES"
+    if "NULL" in header["well"]:
+        header["null"] = float(header["well"]["NULL"]["value"])
+    return header
+
+def read_las_header(filepath):
+    """
+    Reads the header sections of a LAS file without reading the data.
+
+    Parameters
+    ----------
+    filepath : string
+        Path to the LAS file.
+
+    Returns
+    -------
+    dict
+        Returns the header with the following keys:
+            version - ~V section items
+            well - ~W section items
+            curves - list of curve mnemonic, unit and description in column order
+            parameters - ~P section items
+            null - null value, or None if not defined
+            wrap - True if the data section is wrapped
+
+        Section items are keyed by upper-case mnemonic and hold the unit, value
+        and description.
+    """
+    with open(filepath, "r") as las_file:
+        return _read_header(las_file)
+
+def iter_las(filepath, chunk_size=10000, curves=None):
+    """
+    Reads the data section of a LAS file in depth chunks.
+
+    Only one chunk is held in memory at a time, which allows files larger than the
+    available memory to be processed. Null values are replaced with NaN. Each chunk
+    can be passed directly to the calculation functions, e.g:
+
+        for chunk in iter_las("well.las"):
+            phid = porosity.porosity_density(2.65, 1, chunk["RHOB"])
+
+    Parameters
+    ----------
+    filepath : string
+        Path to the LAS file.
+    chunk_size : int, optional
+        Number of depth samples per chunk.
+        By default 10000
+    curves : list of string, optional
+        Curve mnemonics to return. By default all curves are returned.
+
+    Yields
+    ------
+    dict
+        Curve arrays for each chunk keyed by curve mnemonic.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if a requested curve is not in the file, the number of
+        data values does not match the number of curves, or chunk_size is less than 1.
+    """
+    if chunk_size < 1:
+        raise Exception("Enter a valid chunk_size value: at least 1")
+    with open(filepath, "r") as las_file:
+        header = _read_header(las_file)
+        mnemonics = [curve["mnemonic"] for curve in header["curves"]]
+        if curves is None:
+            curves = mnemonics
+        missing = [curve for curve in curves if curve not in mnemonics]
+        if missing:
+            raise Exception("Curves not found in LAS file: {}".format(", ".join(missing)))
+        columns = [mnemonics.index(curve) for curve in curves]
+        ncurves = len(mnemonics)
+        null = header["null"]
+
+        leftover = np.empty(0)
+        while True:
+            raw_lines = list(itertools.islice(las_file, chunk_size))
+            # End of file is decided before comments are removed, as a chunk may hold only comments
+            end_of_file = not raw_lines
+            lines = [line for line in raw_lines if not line.lstrip().startswith("#")]
+            values = np.array(" ".join(lines).split(), dtype=float)
+            if leftover.size:
+                values = np.concatenate([leftover, values])
+            nrows = values.size // ncurves if end_of_file else (values.size // ncurves // chunk_size) * chunk_size
+            if end_of_file and values.size % ncurves:
+                raise Exception("Number of data values does not match the number of curves")
+            if nrows:
+                block = values[:nrows * ncurves].reshape(nrows, ncurves)[:, columns]
+                if null is not None:
+                    block[block == null] = np.nan
+                block = np.ascontiguousarray(block.T)
+                yield {curve: block[i] for i, curve in enumerate(curves)}
+            leftover = values[nrows * ncurves:]
+            if end_of_file:
+                break
+
+def read_las(filepath, curves=None, chunk_size=10000):
+    """
+    Reads the data section of a LAS file into memory.
+
+    Parameters
+    ----------
+    filepath : string
+        Path to the LAS file.
+    curves : list of string, optional
+        Curve mnemonics to return. By default all curves are returned.
+    chunk_size : int, optional
+        Number of depth samples read at a time.
+        By default 10000
+
+    Returns
+    -------
+    dict
+        Curve arrays keyed by curve mnemonic. Null values are replaced with NaN.
+    """
+    chunks = list(iter_las(filepath, chunk_size=chunk_size, curves=curves))
+    if curves is None:
+        curves = [curve["mnemonic"] for curve in read_las_header(filepath)["curves"]]
+    if not chunks:
+        return {curve: np.empty(0) for curve in curves}
+    return {curve: np.concatenate([chunk[curve] for chunk in chunks]) for curve in curves}
@@ -1,27 +1,27 @@
+import numpy as np
+
 def limit_vals(input_value, low_limit, high_limit):
     """
     Apply limits to an input value.
 
+    Works element-wise on NumPy arrays and pandas Series. NaN values are
+    passed through unchanged.
+
     Parameters
     ----------
-    input_value : float
+    input_value : float or array-like
         Input value.
-    low_limit : float
+    low_limit : float or array-like
         Low limit. If value falls below this limit it will be set to this value.
-    high_limit : float
+    high_limit : float or array-like
         High limit. If value falls above this limit it will be set to this value.
 
     Returns
     -------
-    float
+    float or array-like
         Returns input value unless it falls above or below the entered limits.
     """
-    if input_value < low_limit:
-        return low_limit
-    elif input_value > high_limit:
-        return high_limit
-    else:
-        return input_value
+    return np.clip(input_value, low_limit, high_limit)
 
 def dec_perc_convert(input_value, input_units):
     """
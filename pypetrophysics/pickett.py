@@ -0,0 +1,110 @@
+"""
+Pickett plot regression
+"""
+
+import collections
+
+import numpy as np
+
+PickettFit = collections.namedtuple("PickettFit", ["groups", "rw", "m", "r2", "n"])
+
+def pickett_fit(rt, phi, groups=None, arch_a=1, arch_m=None, mask=None):
+    """
+    Fits Pickett plot water lines for many groups of samples at once.
+
+    For water-bearing rock the Archie equation gives
+    log10(rt) = log10(arch_a * rw) - m * log10(phi), so a least squares line through
+    log10(rt) against log10(phi) gives m from the slope and rw from the intercept. All
+    groups are fitted together from grouped sums, without a loop over groups.
+
+    Parameters
+    ----------
+    rt : array-like
+        True formation resistivity (ohm.m)
+    phi : array-like
+        Porosity (decimal)
+    groups : array-like, optional
+        Group label of each sample, e.g. well names or zone indexes from
+        zones.ZoneTable.zone_index. Samples with negative (or NaN) numeric labels, such
+        as the -1 given to samples outside every zone, are ignored. By default all
+        samples are fitted as one group.
+    arch_a : float, optional
+        a - Archie Tortuosity Factor used to calculate rw from the intercept.
+        By default 1
+    arch_m : float, optional
+        Fix the cementation exponent and fit only rw. By default m is fitted.
+    mask : array-like of bool, optional
+        Samples to use, e.g. a water-bearing interval flag. Samples with NaN or non
+        positive rt or phi are always ignored.
+
+    Returns
+    -------
+    PickettFit
+        Returns a named tuple of arrays with one value per group: groups (the sorted
+        group labels), rw, m, r2 (coefficient of determination) and n (number of samples).
+        Groups with too few samples to fit are NaN.
+
+    References
+    ----------
+    Pickett, G. R. (1966) 'A review of current techniques for determination of water saturation from logs', Journal of Petroleum Technology, 18(11), pp. 1425-1433.
+    """
+    rt = np.asarray(rt, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    groups = np.zeros(rt.shape, dtype=int) if groups is None else np.asarray(groups)
+    valid = (rt > 0) & (phi > 0)
+    if groups.dtype.kind in "if":
+        valid &= groups >= 0
+    if mask is not None:
+        valid &= np.asarray(mask, dtype=bool)
+    labels, index = np.unique(groups[valid], return_inverse=True)
+    x = np.log10(phi[valid])
+    y = np.log10(rt[valid])
+
+    def group_sum(weights=None):
+        return np.bincount(index, weights=weights, minlength=labels.size)
+
+    n = group_sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = group_sum(x) / n
+        y_mean = group_sum(y) / n
+        dx = x - x_mean[index]
+        dy = y - y_mean[index]
+        sxx = group_sum(dx * dx)
+        syy = group_sum(dy * dy)
+        sxy = group_sum(dx * dy)
+
+        if arch_m is None:
+            slope = np.where(n >= 2, sxy / sxx, np.nan)
+            r2 = sxy**2 / (sxx * syy)
+        else:
+            slope = np.full(labels.size, -float(arch_m))
+            residual = group_sum((dy - slope[index] * dx)**2)
+            r2 = 1 - residual / syy
+        intercept = y_mean - slope * x_mean
+        rw = 10**intercept / arch_a
+
+    return PickettFit(labels, rw, -slope, r2, n.astype(int))
+
+def pickett_curves(fit, groups):
+    """
+    Expands the rw and m of a Pickett fit to per-sample curves.
+
+    Parameters
+    ----------
+    fit : PickettFit
+        Result of pickett_fit.
+    groups : array-like
+        Group label of each sample.
+
+    Returns
+    -------
+    dict
+        Returns rw and m curves, ready to pass to saturation.sw_archie. Samples whose
+        group was not fitted are NaN.
+    """
+    groups = np.asarray(groups)
+    if len(fit.groups) == 0:
+        return {"rw": np.full(groups.shape, np.nan), "m": np.full(groups.shape, np.nan)}
+    index = np.minimum(np.searchsorted(fit.groups, groups), len(fit.groups) - 1)
+    found = fit.groups[index] == groups
+    return {"rw": np.where(found, fit.rw[index], np.nan), "m": np.where(found, fit.m[index], np.nan)}
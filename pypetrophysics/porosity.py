@@ -10,16 +10,16 @@ def porosity_density(rhomatrix, rhofluid, rhobulk, limit_result=False, low_limit
 
     Parameters
     ----------
-    rhomatrix : float
+    rhomatrix : float or array-like
         Matrix density. 
         
         Typical values:
             Sandstone: 2.65 g/cc
             Limestone: 2.71 g/cc
             Dolomite: 2.80 - 2.85 g/cc
-    rhofluid : float
+    rhofluid : float or array-like
         Fluid density.
-    rhobulk : float
+    rhobulk : float or array-like
         Bulk density from log measurements
     limit_result : bool, optional
         Apply limits to the result value.
@@ -33,7 +33,7 @@ def porosity_density(rhomatrix, rhofluid, rhobulk, limit_result=False, low_limit
 
     Returns
     -------
-        float
+        float or array-like
         Density porosity value in decimal units.
     """
     porosity = (rhomatrix - rhobulk)/(rhobulk - rhofluid)
@@ -50,16 +50,16 @@ def porosity_sonic(dtmatrix, dtfluid, dtlog, method="wyllie", limit_result=False
 
     Parameters
     ----------
-    dtmatrix : float
+    dtmatrix : float or array-like
         Matrix slowness.
 
         Typical values:
             Sandstone: 52-55 us/ft
             Limestone: 47 us/ft
             Dolomite: 43 us/ft
-    dtfluid : float
+    dtfluid : float or array-like
         Fluid slowness.
-    dtlog : [type]
+    dtlog : float or array-like
         Slowness (DT) from log measurements.
     method : string
         Select a method for calculating sonic porosity:
@@ -77,7 +77,7 @@ def porosity_sonic(dtmatrix, dtfluid, dtlog, method="wyllie", limit_result=False
 
     Returns
     -------
-    float
+    float or array-like
         Sonic porosity value in decimal units.
 
     Raises
@@ -109,16 +109,16 @@ def porosity_effective(phit, vclay, phitclay):
 
     Parameters
     ----------
-    phit : float
+    phit : float or array-like
         Total porosity (decima)
-    vclay : float
+    vclay : float or array-like
         Volume of clay (decimal)
-    phitclay : float
+    phitclay : float or array-like
         Clay porosity - taken from a shale interval (decimal)
 
     Returns
     -------
-    float
+    float or array-like
         Returns effective porosity (decimal)
     """
     return phit - vclay * phitclay
@@ -129,16 +129,16 @@ def porosity_total(phie, vclay, phiclay):
 
     Parameters
     ----------
-    phie : float
+    phie : float or array-like
         Effective porosity (decimal)
-    vclay : float
+    vclay : float or array-like
         Volume of clay (decimal)
-    phiclay : float
+    phiclay : float or array-like
         Clay porosity - taken from a shale interval (decimal)
 
     Returns
     -------
-    float
+    float or array-like
         Returns total porosity (decimal)
     """
     return phie + vclay * phiclay
@@ -149,16 +149,16 @@ def porosity_shale(dens_dry_shale, dens_wet_shale, dens_water):
 
     Parameters
     ----------
-    dens_dry_shale : float
+    dens_dry_shale : float or array-like
         Dry shale density (g/cc)
-    dens_wet_shale : float
+    dens_wet_shale : float or array-like
         Wet shale density (g/cc)
-    dens_water : float
+    dens_water : float or array-like
         Water density (g/cc)
 
     Returns
     -------
-    float
+    float or array-like
         Returns shale porosity (decimal).
     """
     return (dens_dry_shale - dens_wet_shale) / dens_water
\ No newline at end of file
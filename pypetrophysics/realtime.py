@@ -0,0 +1,223 @@
+"""
+Incremental evaluation of streaming (LWD) data
+"""
+
+import numpy as np
+
+from . import autopick, fused
+
+class _GrowingArray:
+    """Append-only array with amortized constant cost per appended sample."""
+    def __init__(self, capacity=1024):
+        self.data = np.empty(capacity)
+        self.size = 0
+
+    def append(self, values):
+        end = self.size + len(values)
+        if end > self.data.size:
+            grown = np.empty(max(end, 2 * self.data.size))
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = values
+        self.size = end
+
+    def values(self):
+        return self.data[:self.size]
+
+class IncrementalEvaluator:
+    """
+    Shale volume, porosity and Archie water saturation for data that arrives a few
+    samples at a time, e.g. while drilling.
+
+    Each push evaluates only the new samples, so the cost of an update depends on the
+    number of new samples and not on the length of the well. Running state is kept
+    between updates:
+
+    - Gamma ray endpoints can be picked automatically from a streaming quantile sketch
+      of all the gamma ray received so far. Samples are evaluated with the endpoints at
+      the time they arrive; earlier samples are not recalculated.
+    - Gamma ray can be smoothed with a trailing moving average, which only needs the
+      last window - 1 samples.
+
+    Parameters
+    ----------
+    rhomatrix : float
+        Matrix density (g/cc)
+    rhofluid : float
+        Fluid density (g/cc)
+    rw : float
+        Water resistivity (ohm.m)
+    arch_a : float
+        a - Archie Tortuosity Factor
+    arch_m : float
+        m - Archie Cementation Exponent
+    arch_n : float
+        n - Archie Saturation Exponent
+    gr_clean : float, optional
+        Gamma ray clean endpoint. If gr_clean or gr_shale is not given, both are picked
+        automatically.
+    gr_shale : float, optional
+        Gamma ray shale endpoint.
+    phi_shale : float, optional
+        Shale porosity (decimal).
+        By default 0
+    vsh_method : string, optional
+        Shale volume method passed to clayshale.gr_clay_shale_vol.
+        By default linear
+    clean_percentile : float, optional
+        Percentile used as the automatic clean endpoint.
+        By default 5
+    shale_percentile : float, optional
+        Percentile used as the automatic shale endpoint.
+        By default 95
+    min_samples : int, optional
+        Number of gamma ray samples needed before automatic endpoints are used. Earlier
+        samples have NaN results.
+        By default 100
+    gr_window : int, optional
+        Length of the trailing moving average applied to gamma ray. 1 for no smoothing.
+        By default 1
+    keep_history : bool, optional
+        Keep all inputs and results so they can be returned by history().
+        By default True
+
+    Examples
+    --------
+        evaluator = IncrementalEvaluator(2.65, 1.0, 0.05, 1, 2, 2, gr_window=5)
+        for packet in telemetry:
+            new = evaluator.push(packet["DEPT"], packet["GR"], packet["RHOB"], packet["RT"])
+    """
+    INPUTS = ("depth", "gr", "rhob", "rt")
+    OUTPUTS = ("vsh", "phit", "phie", "sw")
+
+    def __init__(self, rhomatrix, rhofluid, rw, arch_a, arch_m, arch_n, gr_clean=None, gr_shale=None, phi_shale=0,
+                 vsh_method="linear", clean_percentile=5, shale_percentile=95, min_samples=100, gr_window=1,
+                 keep_history=True):
+        self.params = dict(rhomatrix=rhomatrix, rhofluid=rhofluid, phi_shale=phi_shale, rw=rw,
+                           arch_a=arch_a, arch_m=arch_m, arch_n=arch_n)
+        self.vsh_method = vsh_method
+        self.auto_pick = gr_clean is None or gr_shale is None
+        self.gr_clean = gr_clean
+        self.gr_shale = gr_shale
+        self.picker = autopick.EndpointPicker(clean_percentile, shale_percentile) if self.auto_pick else None
+        self.min_samples = min_samples
+        if gr_window < 1:
+            raise Exception("gr_window must be at least 1")
+        self.gr_window = gr_window
+        self._gr_tail = np.empty(0)
+        self.samples = 0
+        self._callbacks = []
+        self._history = {name: _GrowingArray() for name in self.INPUTS + self.OUTPUTS} if keep_history else None
+
+    def subscribe(self, callback):
+        """
+        Registers a function called with the results of every push.
+
+        Parameters
+        ----------
+        callback : function
+            Called as callback(results), with the dict returned by push.
+        """
+        self._callbacks.append(callback)
+
+    def endpoints(self):
+        """
+        Returns the current gamma ray endpoints.
+
+        Returns
+        -------
+        tuple
+            Returns (gr_clean, gr_shale), NaN if automatic endpoints are not yet available.
+        """
+        if not self.auto_pick:
+            return self.gr_clean, self.gr_shale
+        if len(self.picker.sketches[0]) < self.min_samples:
+            return np.nan, np.nan
+        return self.picker.endpoints()
+
+    def _smooth(self, gr):
+        if self.gr_window == 1:
+            return gr
+        values = np.concatenate([self._gr_tail, gr])
+        self._gr_tail = values[max(values.size - (self.gr_window - 1), 0):]
+        valid = ~np.isnan(values)
+        sums = np.concatenate([[0], np.cumsum(np.where(valid, values, 0))])
+        counts = np.concatenate([[0], np.cumsum(valid)])
+        end = np.arange(values.size - gr.size, values.size) + 1
+        start = np.maximum(end - self.gr_window, 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (sums[end] - sums[start]) / (counts[end] - counts[start])
+
+    def push(self, depth, gr, rhob, rt):
+        """
+        Evaluates newly received samples.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depth of the new samples.
+        gr : float or array-like
+            Gamma ray (API)
+        rhob : float or array-like
+            Bulk density (g/cc)
+        rt : float or array-like
+            True formation resistivity (ohm.m)
+
+        Returns
+        -------
+        dict
+            Returns depth, vsh, phit, phie and sw arrays for the new samples only.
+        """
+        depth, gr, rhob, rt = [np.atleast_1d(np.asarray(values, dtype=float)) for values in (depth, gr, rhob, rt)]
+        if not depth.size == gr.size == rhob.size == rt.size:
+            raise Exception("depth, gr, rhob and rt must have the same number of samples")
+
+        gr = self._smooth(gr)
+        if self.auto_pick:
+            self.picker.update(gr)
+        gr_clean, gr_shale = self.endpoints()
+
+        results = fused.sw_archie_from_logs(rhob, gr, rt, gr_clean=gr_clean, gr_shale=gr_shale,
+                                            vsh_method=self.vsh_method, **self.params)
+        results["depth"] = depth
+        self.samples += depth.size
+
+        if self._history is not None:
+            for name, values in zip(self.INPUTS, (depth, gr, rhob, rt)):
+                self._history[name].append(values)
+            for name in self.OUTPUTS:
+                self._history[name].append(results[name])
+        for callback in self._callbacks:
+            callback(results)
+        return results
+
+    def history(self):
+        """
+        Returns all the samples received so far and their results.
+
+        Returns
+        -------
+        dict
+            Returns depth, gr (smoothed), rhob, rt, vsh, phit, phie and sw arrays.
+        """
+        if self._history is None:
+            raise Exception("History is not kept. Create the evaluator with keep_history=True.")
+        return {name: array.values().copy() for name, array in self._history.items()}
+
+    async def stream(self, source):
+        """
+        Evaluates samples from an asynchronous source as they arrive.
+
+        Parameters
+        ----------
+        source : async iterable
+            Yields dicts with depth, gr, rhob and rt for each batch of new samples,
+            e.g. read from a websocket or an asyncio.Queue.
+
+        Yields
+        ------
+        dict
+            The results of push for each batch.
+        """
+        async for batch in source:
+            yield self.push(batch["depth"], batch["gr"], batch["rhob"], batch["rt"])
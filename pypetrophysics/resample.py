@@ -0,0 +1,238 @@
+"""
+Depth resampling and alignment
+"""
+
+import numpy as np
+
+RESAMPLE_METHODS = ("linear", "nearest", "average")
+
+def depth_grid(start, stop, step):
+    """
+    Creates a regular depth grid.
+
+    Unlike np.arange, the grid includes stop when (stop - start) is a multiple of step,
+    regardless of floating point error, and depths are calculated from start rather than
+    accumulated.
+
+    Parameters
+    ----------
+    start : float
+        First depth.
+    stop : float
+        Last depth.
+    step : float
+        Depth increment.
+
+    Returns
+    -------
+    array-like
+        Returns the depths.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if step is not positive.
+    """
+    if not step > 0:
+        raise Exception("Enter a valid step value: greater than 0")
+    return start + step * np.arange(int(np.floor((stop - start) / step + 1e-9)) + 1)
+
+def _split(curves):
+    """Returns (names, list of 1D curves, output shape) for a dict, 1D or 2D array of curves."""
+    if isinstance(curves, dict):
+        return list(curves), [np.asarray(curve, dtype=float) for curve in curves.values()], None
+    curves = np.asarray(curves, dtype=float)
+    return None, list(curves.reshape(-1, curves.shape[-1])), curves.shape[:-1]
+
+class Resampler:
+    """
+    Resamples curves from one depth sampling to another.
+
+    The interpolation indices and weights are calculated once from the depths, and then
+    applied to any number of curves, so the cost per curve is a gather and a few in-place
+    array operations with no searching.
+
+    Methods:
+        linear - linear interpolation between the neighbouring samples
+        nearest - value of the nearest sample
+        average - mean of the samples within half a target step of each target depth,
+            for resampling to a coarser grid
+
+    NaN values are not interpolated across: a linear result is NaN if either neighbour
+    is NaN (unless the target depth coincides with a sample), and NaN samples are left
+    out of averages. Target depths outside the source depths are NaN.
+
+    Parameters
+    ----------
+    source_depth : array-like
+        Depths of the input curves, in increasing order.
+    target_depth : array-like
+        Depths to resample to, in increasing order.
+    method : string, optional
+        Resampling method: linear, nearest or average.
+        By default linear
+    max_gap : float, optional
+        Gaps in the source depths longer than this are not interpolated across. For the
+        nearest method, samples further than max_gap / 2 from the target depth are not
+        used. Ignored by the average method, which does not interpolate: target depths
+        with no samples within half a target step are NaN.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if the method is not valid or the depths are not increasing.
+    """
+    def __init__(self, source_depth, target_depth, method="linear", max_gap=None):
+        if method not in RESAMPLE_METHODS:
+            raise Exception("Enter a valid method value: linear, nearest, average")
+        source = np.asarray(source_depth, dtype=float)
+        target = np.asarray(target_depth, dtype=float)
+        if source.size < 2 or np.any(np.diff(source) <= 0) or np.any(np.diff(target) < 0):
+            raise Exception("Depths must be in increasing order, with at least two source samples")
+        self.source_depth = source
+        self.target_depth = target
+        self.method = method
+        self.max_gap = max_gap
+
+        inside = (target >= source[0]) & (target <= source[-1])
+        if method == "linear":
+            self.index = np.clip(np.searchsorted(source, target, side="right") - 1, 0, source.size - 2)
+            self.weight = (target - source[self.index]) / (source[self.index + 1] - source[self.index])
+            # Targets on a source sample take its value directly, so a NaN neighbour is not used
+            self.exact = np.flatnonzero(self.weight == 0)
+            self.exact_upper = np.flatnonzero(self.weight == 1)
+            if max_gap is not None:
+                inside &= (source[self.index + 1] - source[self.index] <= max_gap) | (self.weight == 0) | (self.weight == 1)
+        elif method == "nearest":
+            upper = np.clip(np.searchsorted(source, target), 1, source.size - 1)
+            closer_below = target - source[upper - 1] <= source[upper] - target
+            self.index = np.where(closer_below, upper - 1, upper)
+            if max_gap is not None:
+                inside &= np.abs(source[self.index] - target) <= max_gap / 2
+        else:
+            half_steps = np.diff(target) / 2
+            if target.size > 1:
+                edges = np.concatenate([[target[0] - half_steps[0]], target[:-1] + half_steps, [target[-1] + half_steps[-1]]])
+            else:
+                edges = np.array([target[0], target[0]])
+            self.start = np.searchsorted(source, edges[:-1], side="left")
+            self.stop = np.searchsorted(source, edges[1:], side="left")
+            inside = self.stop > self.start
+        self.outside = np.flatnonzero(~inside)
+
+    def __call__(self, curves):
+        return self.apply(curves)
+
+    def apply(self, curves):
+        """
+        Resamples curves.
+
+        Parameters
+        ----------
+        curves : dict or array-like
+            A dict of curves keyed by name, a single curve, or a 2D array with one curve
+            per row, sampled at source_depth.
+
+        Returns
+        -------
+        dict or array-like
+            Returns the curves at target_depth, in the same form as the input.
+        """
+        names, values, shape = _split(curves)
+        result = np.empty((len(values), self.target_depth.size))
+        for curve, out in zip(values, result):
+            if curve.shape != self.source_depth.shape:
+                raise Exception("Curves have {} samples, expected {}".format(curve.size, self.source_depth.size))
+            self._resample(curve, out)
+            out[self.outside] = np.nan
+        if names is not None:
+            return dict(zip(names, result))
+        return result.reshape(shape + (self.target_depth.size,))
+
+    def _resample(self, curve, out):
+        if self.method == "linear":
+            np.take(curve, self.index, out=out)
+            upper = np.take(curve, self.index + 1)
+            upper -= out
+            upper *= self.weight
+            out += upper
+            out[self.exact] = curve[self.index[self.exact]]
+            out[self.exact_upper] = curve[self.index[self.exact_upper] + 1]
+        elif self.method == "nearest":
+            np.take(curve, self.index, out=out)
+        else:
+            valid = ~np.isnan(curve)
+            sums = np.concatenate([[0], np.cumsum(np.where(valid, curve, 0))])
+            counts = np.concatenate([[0], np.cumsum(valid)])
+            with np.errstate(invalid="ignore", divide="ignore"):
+                np.divide(sums[self.stop] - sums[self.start], counts[self.stop] - counts[self.start], out=out)
+
+def resample_curves(curves, source_depth, target_depth, method="linear", max_gap=None):
+    """
+    Resamples curves to new depths. See Resampler.
+
+    Parameters
+    ----------
+    curves : dict or array-like
+        A dict of curves keyed by name, a single curve, or a 2D array with one curve per row.
+    source_depth : array-like
+        Depths of the input curves, in increasing order.
+    target_depth : array-like
+        Depths to resample to, in increasing order.
+    method : string, optional
+        Resampling method: linear, nearest or average.
+        By default linear
+    max_gap : float, optional
+        Gaps in the source depths longer than this are not interpolated across (linear
+        and nearest methods). See Resampler.
+
+    Returns
+    -------
+    dict or array-like
+        Returns the curves at target_depth, in the same form as the input.
+    """
+    return Resampler(source_depth, target_depth, method, max_gap).apply(curves)
+
+def align_runs(runs, step, start=None, stop=None, method="linear", max_gap=None):
+    """
+    Puts the curves of several logging runs onto one regular depth grid.
+
+    Parameters
+    ----------
+    runs : list of tuple
+        (depth, curves) for each run, where curves is a dict of curves keyed by name.
+    step : float
+        Depth increment of the common grid.
+    start : float, optional
+        First depth of the grid. By default the shallowest depth of any run.
+    stop : float, optional
+        Last depth of the grid. By default the deepest depth of any run.
+    method : string, optional
+        Resampling method: linear, nearest or average.
+        By default linear
+    max_gap : float, optional
+        Gaps in the source depths longer than this are not interpolated across (linear
+        and nearest methods). See Resampler.
+
+    Returns
+    -------
+    tuple
+        Returns (depth, curves) with the grid depths and a dict of all the resampled
+        curves. Each run is NaN outside its own depth range.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if a curve name appears in more than one run.
+    """
+    runs = [(np.asarray(depth, dtype=float), curves) for depth, curves in runs]
+    start = min(depth[0] for depth, _ in runs) if start is None else start
+    stop = max(depth[-1] for depth, _ in runs) if stop is None else stop
+    grid = depth_grid(start, stop, step)
+    merged = {}
+    for depth, curves in runs:
+        duplicates = set(curves) & set(merged)
+        if duplicates:
+            raise Exception("Curves appear in more than one run: {}".format(", ".join(sorted(duplicates))))
+        merged.update(Resampler(depth, grid, method, max_gap).apply(curves))
+    return grid, merged
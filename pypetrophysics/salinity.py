@@ -2,6 +2,8 @@
 Salinity related calculations
 """
 
+import numpy as np
+
 def chlorides_to_NaCl(salinity_chlorides):
     """
     Converts salinity value from ppm Chlorides to ppm NaCl equivalent.
@@ -66,3 +68,181 @@ def rw_at_form_temp(rw, rw_temperature, temperature_units, new_temperature):
         return rw * ((rw_temperature + 21.5) / (new_temperature + 21.5))
     else:
         raise Exception("Incorrect units. Enter 'f' for farenheit or 'c' for celsius.")
+
+
+def _to_fahrenheit(temperature, temperature_units):
+    if temperature_units.lower() == 'f':
+        return temperature
+    elif temperature_units.lower() == 'c':
+        return temperature * 9 / 5 + 32
+    else:
+        raise Exception("Incorrect units. Enter 'f' for farenheit or 'c' for celsius.")
+
+def rw_from_salinity(salinity_NaCl, temperature, temperature_units='f'):
+    """
+    Calculates water resistivity from salinity and temperature.
+
+    Rw at 75 degF is calculated from the Bateman and Konen fit to the Schlumberger
+    GEN-9 chart, Rw75 = 0.0123 + 3647.5 / ppm^0.955, and converted to the required
+    temperature with the Arps equation.
+
+    Parameters
+    ----------
+    salinity_NaCl : float or array-like
+        Water Salinity (ppm NaCl equivalent)
+    temperature : float or array-like
+        Temperature
+    temperature_units : string, optional
+        Enter f for degrees farenheit or c for degrees celsius.
+        By default f
+
+    Returns
+    -------
+    float or array-like
+        Returns water resistivity (ohmm) at the temperature.
+
+    References
+    ----------
+    Bateman, R. M. and Konen, C. E. (1977) 'The log analyst and the programmable pocket calculator', The Log Analyst, 18(5).
+    """
+    rw75 = 0.0123 + 3647.5 / salinity_NaCl**0.955
+    return rw_at_form_temp(rw75, 75, 'f', _to_fahrenheit(temperature, temperature_units))
+
+def salinity_from_rw(rw, temperature, temperature_units='f'):
+    """
+    Calculates the equivalent NaCl salinity of a water resistivity, e.g. from Rwa.
+
+    Inverse of rw_from_salinity.
+
+    Parameters
+    ----------
+    rw : float or array-like
+        Water Resistivity (ohmm)
+    temperature : float or array-like
+        Temperature rw applies at.
+    temperature_units : string, optional
+        Enter f for degrees farenheit or c for degrees celsius.
+        By default f
+
+    Returns
+    -------
+    float or array-like
+        Returns water salinity (ppm NaCl equivalent). NaN if rw is too low for any salinity.
+    """
+    rw75 = rw_at_form_temp(rw, _to_fahrenheit(temperature, temperature_units), 'f', 75)
+    excess = np.asarray(rw75 - 0.0123, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(excess > 0, (3647.5 / excess)**(1 / 0.955), np.nan)
+    return result[()]
+
+class RwGrid:
+    """
+    Precomputed lookup grids of water resistivity against salinity and temperature.
+
+    The forward grid holds rw_from_salinity on log spaced salinity nodes and evenly
+    spaced temperature nodes, and the inverse grid holds the equivalent salinity on log
+    spaced Rw nodes. Both are bilinearly interpolated with the node index calculated
+    directly from the value, so converting a whole curve is a single gather and a few
+    multiply-adds per sample, for either direction. Values outside the grids are NaN.
+
+    Any Rw model can be tabulated. For rw_from_salinity itself NumPy already evaluates
+    the equation as a vectorized operation, so the grid is most useful for models that
+    are expensive to evaluate or are digitized charts, and for the inverse.
+
+    Parameters
+    ----------
+    salinity_range : tuple, optional
+        Salinity range (ppm NaCl equivalent).
+        By default (100, 300000)
+    temperature_range : tuple, optional
+        Temperature range (deg F).
+        By default (32, 450)
+    points : int, optional
+        Number of salinity (and Rw) nodes.
+        By default 512
+    temperature_points : int, optional
+        Number of temperature nodes.
+        By default 256
+    model : function, optional
+        Function of (salinity_NaCl, temperature in deg F) returning Rw, which must
+        decrease with salinity. By default rw_from_salinity.
+    """
+    def __init__(self, salinity_range=(100, 300000), temperature_range=(32, 450), points=512, temperature_points=256,
+                 model=None):
+        model = rw_from_salinity if model is None else model
+        self.salinity = np.geomspace(salinity_range[0], salinity_range[1], points)
+        self.temperature = np.linspace(temperature_range[0], temperature_range[1], temperature_points)
+        self.values = model(self.salinity[:, None], self.temperature[None, :])
+
+        self.rw_nodes = np.geomspace(self.values.min(), self.values.max(), points)
+        self.salinity_values = np.column_stack([
+            np.interp(np.log(self.rw_nodes), np.log(column[::-1]), self.salinity[::-1], left=np.nan, right=np.nan)
+            for column in self.values.T])
+
+    def _temperature_position(self, temperature, temperature_units):
+        temperature = _to_fahrenheit(np.asarray(temperature, dtype=float), temperature_units)
+        return (temperature - self.temperature[0]) / (self.temperature[1] - self.temperature[0])
+
+    @staticmethod
+    def _log_position(values, nodes):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (np.log(values) - np.log(nodes[0])) / (np.log(nodes[1]) - np.log(nodes[0]))
+
+    @staticmethod
+    def _bilinear(table, row, column):
+        row, column = np.broadcast_arrays(row, column)
+        rows, columns = table.shape
+        inside = (row >= 0) & (row <= rows - 1) & (column >= 0) & (column <= columns - 1)
+        i = np.clip(np.where(inside, row, 0).astype(np.intp), 0, rows - 2)
+        j = np.clip(np.where(inside, column, 0).astype(np.intp), 0, columns - 2)
+        row_weight = row - i
+        column_weight = column - j
+        k = i * columns + j
+        flat = table.ravel()
+        result = ((1 - row_weight) * ((1 - column_weight) * flat[k] + column_weight * flat[k + 1])
+                  + row_weight * ((1 - column_weight) * flat[k + columns] + column_weight * flat[k + columns + 1]))
+        return np.where(inside, result, np.nan)[()]
+
+    def rw(self, salinity_NaCl, temperature, temperature_units='f'):
+        """
+        Interpolates water resistivity from salinity and temperature.
+
+        Parameters
+        ----------
+        salinity_NaCl : float or array-like
+            Water Salinity (ppm NaCl equivalent)
+        temperature : float or array-like
+            Temperature
+        temperature_units : string, optional
+            Enter f for degrees farenheit or c for degrees celsius.
+            By default f
+
+        Returns
+        -------
+        float or array-like
+            Returns water resistivity (ohmm) at the temperature.
+        """
+        return self._bilinear(self.values, self._log_position(salinity_NaCl, self.salinity),
+                              self._temperature_position(temperature, temperature_units))
+
+    def salinity_from_rw(self, rw, temperature, temperature_units='f'):
+        """
+        Interpolates the equivalent NaCl salinity of a water resistivity, e.g. from Rwa.
+
+        Parameters
+        ----------
+        rw : float or array-like
+            Water Resistivity (ohmm)
+        temperature : float or array-like
+            Temperature rw applies at.
+        temperature_units : string, optional
+            Enter f for degrees farenheit or c for degrees celsius.
+            By default f
+
+        Returns
+        -------
+        float or array-like
+            Returns water salinity (ppm NaCl equivalent), or NaN outside the grid.
+        """
+        return self._bilinear(self.salinity_values, self._log_position(rw, self.rw_nodes),
+                              self._temperature_position(temperature, temperature_units))
@@ -2,6 +2,11 @@
 Saturation Calculations
 """
 
+import collections
+import sys
+
+import numpy as np
+
 from pypetrophysics import miscfuncs
 
 def formation_factor(arch_a, phi, arch_m):
@@ -10,16 +15,16 @@ def formation_factor(arch_a, phi, arch_m):
 
     Parameters
     ----------
-    arch_a : float
+    arch_a : float or array-like
         Archie Tortuosity Factor - a
-    phi : [type]
+    phi : float or array-like
         Porosity (decimal)
-    arch_m : float
+    arch_m : float or array-like
         Archie Cementation Exponent - m
 
     Returns
     -------
-    float
+    float or array-like
         Returns Archie Formation Factor
     """
     return arch_a / phi ** arch_m
@@ -30,14 +35,14 @@ def ro(formation_factor, rw):
 
     Parameters
     ----------
-    formation_factor : float
+    formation_factor : float or array-like
         Archie Formation Factor
-    rw : float
+    rw : float or array-like
         Resistivity of formation water (ohm.m)
 
     Returns
     -------
-    float
+    float or array-like
         Returns resistivity of water saturation formation (ohm.m)
     """
     return formation_factor * rw
@@ -48,14 +53,14 @@ def resistivity_index(rt, ro):
 
     Parameters
     ----------
-    rt : float
+    rt : float or array-like
         True formation resistivity (ohm.m)
-    ro : float
+    ro : float or array-like
         Resistivity of water saturated formation (ohm.m)
 
     Returns
     -------
-    float
+    float or array-like
         Returns Archie resistivity index (I)
     """
     return rt/ro
@@ -66,17 +71,17 @@ def sw_archie(phi, rw, rt, arch_a, arch_m, arch_n, limit_result=False, low_limit
 
     Parameters
     ----------
-    phi : float
+    phi : float or array-like
         Porosity (decimal)
-    rw : float
+    rw : float or array-like
         Water resistivity (ohmm.m)
-    rt : float
+    rt : float or array-like
         True formation resistivity (ohmm.m)
-    arch_a : float
+    arch_a : float or array-like
         a - Archie Tortuosity Factor
-    arch_m : float
+    arch_m : float or array-like
         m - Archie Cementation Exponent
-    arch_n : float
+    arch_n : float or array-like
         n - Archie Saturation Exponent
     limit_result : bool, optional
         Apply limits to the result value.
@@ -89,7 +94,7 @@ def sw_archie(phi, rw, rt, arch_a, arch_m, arch_n, limit_result=False, low_limit
         By default: 1
     Returns
     -------
-    float
+    float or array-like
         Returns water saturation computed using the Archie equation in decimal units.
     """
     sw = ((arch_a / phi ** arch_m) * (rw/rt))**(1/arch_n)
@@ -99,12 +104,176 @@ def sw_archie(phi, rw, rt, arch_a, arch_m, arch_n, limit_result=False, low_limit
     else:
         return sw
 
-def sw_simandoux():
-    # TODO
-    pass
+def _series_index(values):
+    # Index of the first pandas Series input. pandas is only looked up if it is already
+    # imported, since a Series input means it must be.
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        for val in values:
+            if isinstance(val, pd.Series):
+                return val.index
+    return None
+
+def _broadcast_float(*values):
+    index = _series_index(values)
+    values = [np.asarray(val, dtype=float) for val in values]
+    return values, np.broadcast_shapes(*[val.shape for val in values]), index
+
+def _archie_conductance(phi, rw, arch_a, arch_m, out):
+    # phi**m / (a * rw), the clean-sand conductance term shared by the shaly-sand models
+    np.power(phi, arch_m, out=out)
+    out /= rw
+    out /= arch_a
+    return out
+
+def _simandoux_root(sand_term, shale_term, rt, out, work):
+    # Positive root of sand_term * sw**2 + shale_term * sw - 1 / rt = 0
+    np.divide(sand_term, rt, out=out)
+    out *= 4
+    np.multiply(shale_term, shale_term, out=work)
+    out += work
+    np.sqrt(out, out=out)
+    out -= shale_term
+    out /= sand_term
+    out /= 2
+    return out
+
+def _indonesian(sand_term, rt, rshale, vclay, arch_n, out, work):
+    # sw = ((vclay**(1 - vclay/2) / rshale**0.5 + sand_term**0.5)**2 * rt)**(-1/n)
+    np.subtract(2, vclay, out=work)
+    np.power(vclay, work, out=work)
+    work /= rshale
+    np.sqrt(work, out=work)
+    np.sqrt(sand_term, out=out)
+    out += work
+    np.square(out, out=out)
+    out *= rt
+    np.divide(-1, arch_n, out=work)
+    np.power(out, work, out=out)
+    return out
+
+def _shaped(result, shape, index=None):
+    # Scalars for scalar inputs, and a Series with the input index for Series inputs
+    if index is not None and shape == (len(index),):
+        return sys.modules["pandas"].Series(result, index=index)
+    return result if shape else result.item()
+
+def sw_simandoux(rw, rt, rshale, vclay, phi, arch_a, arch_m, limit_result=False, low_limit=0, high_limit=1):
+    """
+    Calculates water saturation using Simandoux (1963).
 
+    The Simandoux equation is designed for determining water saturation in shaly sands.
+    It is solved as a quadratic in water saturation, which assumes a saturation 
+    exponent (n) of 2:
 
-def sw_indonesian(rw, rt, rshale, vclay, phi, archie_m, archie_n):
+        1/rt = (phi**m / (a * rw)) * sw**2 + (vclay / rshale) * sw
+
+    Parameters
+    ----------
+    rw : float or array-like
+        Water resistivity (ohm.m)
+    rt : float or array-like
+        Formation resistivity (ohm.m)
+    rshale : float or array-like
+        Shale resistivity (ohm.m)
+    vclay : float or array-like
+        Volume of clay (decimal)
+    phi : float or array-like
+        Porosity (decimal)
+    arch_a : float or array-like
+        a - Archie Tortuosity Factor
+    arch_m : float or array-like
+        m - Archie Cementation Exponent
+    limit_result : bool, optional
+        Apply limits to the result value.
+        By default False
+    low_limit : int, optional
+        Low limit. If value falls below this limit it will be set to this value. 
+        By default 0
+    high_limit : float, optional
+        High limit. If value falls above this limit it will be set to this value.
+        By default: 1
+
+    Returns
+    -------
+    float or array-like
+        Returns water saturation computed using the Simandoux equation in decimal units.
+
+    References
+    ----------
+    Simandoux, P. (1963) ‘Dielectric measurements on porous media application to the measurement 
+    of water saturations: study of the behaviour of argillaceous formations’, Revue de l'Institut 
+    Français du Pétrole, vol. 18, supplementary issue, pp. 193–215.
+    """
+    (rw, rt, rshale, vclay, phi, arch_a, arch_m), shape, index = _broadcast_float(rw, rt, rshale, vclay, phi, arch_a, arch_m)
+    sand_term = _archie_conductance(phi, rw, arch_a, arch_m, np.empty(shape))
+    shale_term = np.divide(vclay, rshale)
+    sw = _simandoux_root(sand_term, shale_term, rt, np.empty(shape), np.empty(shape))
+
+    if limit_result is True:
+        return _shaped(miscfuncs.limit_vals(sw, low_limit, high_limit), shape, index)
+    else:
+        return _shaped(sw, shape, index)
+
+def sw_modified_simandoux(rw, rt, rshale, vclay, phi, arch_a, arch_m, limit_result=False, low_limit=0, high_limit=1):
+    """
+    Calculates water saturation using the modified Simandoux equation (Bardon and Pied, 1969).
+
+    Differs from the original Simandoux equation by scaling the clean-sand term by 
+    the sand fraction (1 - vclay). It is solved as a quadratic in water saturation, 
+    which assumes a saturation exponent (n) of 2:
+
+        1/rt = (phi**m / (a * rw * (1 - vclay))) * sw**2 + (vclay / rshale) * sw
+
+    Parameters
+    ----------
+    rw : float or array-like
+        Water resistivity (ohm.m)
+    rt : float or array-like
+        Formation resistivity (ohm.m)
+    rshale : float or array-like
+        Shale resistivity (ohm.m)
+    vclay : float or array-like
+        Volume of clay (decimal)
+    phi : float or array-like
+        Porosity (decimal)
+    arch_a : float or array-like
+        a - Archie Tortuosity Factor
+    arch_m : float or array-like
+        m - Archie Cementation Exponent
+    limit_result : bool, optional
+        Apply limits to the result value.
+        By default False
+    low_limit : int, optional
+        Low limit. If value falls below this limit it will be set to this value. 
+        By default 0
+    high_limit : float, optional
+        High limit. If value falls above this limit it will be set to this value.
+        By default: 1
+
+    Returns
+    -------
+    float or array-like
+        Returns water saturation computed using the modified Simandoux equation in decimal units.
+
+    References
+    ----------
+    Bardon, C. and Pied, B. (1969) ‘Formation water saturation in shaly sands’, 
+    SPWLA 10th Annual Logging Symposium, pp. 1–19.
+    """
+    (rw, rt, rshale, vclay, phi, arch_a, arch_m), shape, index = _broadcast_float(rw, rt, rshale, vclay, phi, arch_a, arch_m)
+    sand_term = _archie_conductance(phi, rw, arch_a, arch_m, np.empty(shape))
+    work = np.subtract(1, vclay, out=np.empty(shape))
+    sand_term /= work
+    shale_term = np.divide(vclay, rshale)
+    sw = _simandoux_root(sand_term, shale_term, rt, np.empty(shape), work)
+
+    if limit_result is True:
+        return _shaped(miscfuncs.limit_vals(sw, low_limit, high_limit), shape, index)
+    else:
+        return _shaped(sw, shape, index)
+
+def sw_indonesian(rw, rt, rshale, vclay, phi, archie_m, archie_n, archie_a=1):
     """
     Calculates water saturation using Poupon-Leveaux (1971) - Indonesian.
 
@@ -112,24 +281,27 @@ def sw_indonesian(rw, rt, rshale, vclay, phi, archie_m, archie_n):
 
     Parameters
     ----------
-    rw : float
+    rw : float or array-like
         Water resistivity (ohm.m)
-    rt : float
+    rt : float or array-like
         Formation resistivity (ohm.m)
-    rshale : float
+    rshale : float or array-like
         Shale resistivity (ohm.m)
-    vclay : float
+    vclay : float or array-like
         Volume of clay (decimal)
-    phi : float
+    phi : float or array-like
         Porosity (decimal)
-    archie_m : float
+    archie_m : float or array-like
         m - Archie cementation exponent
-    archie_n : float
+    archie_n : float or array-like
         n - Archie saturation exponent
+    archie_a : float or array-like, optional
+        a - Archie tortuosity factor
+        By default 1
 
     Returns
     -------
-    float
+    float or array-like
         Returns water saturation computed using the Poupon-Leveaux (Indonesian) equation.
 
       References
@@ -139,43 +311,62 @@ def sw_indonesian(rw, rt, rshale, vclay, phi, archie_m, archie_n):
 
     PetroWiki (2020), Water Saturation Determination, https://petrowiki.org/Water_saturation_determination
     """
-    part_a = ((vclay**(2-vclay))/rshale)**0.5
-    part_b = (phi**archie_m / rw)**0.5
-    part_c = (part_a + part_b)**2 * rt
-    result = part_c**(-1/archie_n)
-    
-    return result
+    (rw, rt, rshale, vclay, phi, archie_m, archie_n, archie_a), shape, index = _broadcast_float(
+        rw, rt, rshale, vclay, phi, archie_m, archie_n, archie_a)
+    sand_term = _archie_conductance(phi, rw, archie_a, archie_m, np.empty(shape))
+    result = _indonesian(sand_term, rt, rshale, vclay, archie_n, sand_term, np.empty(shape))
+
+    return _shaped(result, shape, index)
+
+WaxmanSmitsResult = collections.namedtuple("WaxmanSmitsResult", ["sw", "iterations", "residual", "converged"])
 
-def sw_waxsmit(rw, rt, b, qv, a, phit, m_star, n_star):
+def sw_waxsmit(rw, rt, b, qv, a, phit, m_star, n_star, tolerance=1e-6, max_iterations=50, diagnostics=False):
     """
     Calculates Water Saturation using Waxman-Smits (1968).
 
     W-S equation is designed for determining water saturation in shaly sand.
     To solve the equation a number of iterations need to be executed.
 
+    All samples are solved together using Newton's method, safeguarded by a
+    bracket between zero and the Archie saturation. Samples are removed from the
+    working set as soon as they converge, so the cost of each iteration falls as
+    the solution progresses.
+
     Parameters
     ----------
-    rw : float
+    rw : float or array-like
         Water resistivity (ohm.m)
-    rt : float
+    rt : float or array-like
         Formation resistivity (ohm.m)
-    b : float
+    b : float or array-like
         Equivalent Conductivity of Exchange Cations
-    qv : float
+    qv : float or array-like
         Cation Exchange Capacity Per Unit Pore Volume (meq-ml-1)
-    a : float
+    a : float or array-like
         a - Archie Tortuosity Factor
-    phit : float
+    phit : float or array-like
         Total Porosity (decimal)
-    m_star : float
+    m_star : float or array-like
         m-star - Shaly sand cementation exponent
-    n_star : float
+    n_star : float or array-like
         n-star - Shaley sand saturation exponent
+    tolerance : float, optional
+        Change in water saturation between iterations below which a sample is 
+        treated as converged.
+        By default 1e-6
+    max_iterations : int, optional
+        Maximum number of iterations.
+        By default 50
+    diagnostics : bool, optional
+        Return a WaxmanSmitsResult holding the water saturation, the iterations
+        used per sample, the final residual per sample and a converged mask.
+        By default False
 
     Returns
     -------
-    float
+    float or array-like
         Returns water saturation computed using the Waxman-Smits equation in decimal units.
+        Samples with invalid inputs are returned as NaN.
             
     References
     ----------
@@ -185,22 +376,168 @@ def sw_waxsmit(rw, rt, b, qv, a, phit, m_star, n_star):
     Freedman, R., Formation, F. and Consultants, E. (1985) ‘THE WAXMAN-SMITS EQUATION FOR SHALY SANDS : I . SIMPLE METHODS OF SOLUTION ; 
     11 . ERROR ANALYSIS’, no. March 1985.
     """
-    swt = sw_archie(a, m_star, n_star, phit, rw, rt)
-    difference = 0.001
-    x = True
-    count = 0
-    while x:
-        swt_prev = swt
-        part_a = rt * (1 + rw * b * qv / swt)
-        part_b = a * phit**(-m_star) * rw
-        swt = (part_a / part_b) ** (-1 / n_star)
-        if abs(swt - swt_prev) <= difference:
-            x = False
-        count += 1
-        #print(count, swt)
-    
-    return swt
+    index = _series_index((rw, rt, b, qv, a, phit, m_star, n_star))
+    rw, rt, b, qv, a, phit, m_star, n_star = np.broadcast_arrays(
+        *[np.asarray(val, dtype=float) for val in (rw, rt, b, qv, a, phit, m_star, n_star)])
+    shape = rt.shape
+    n_star = n_star.ravel()
+
+    # Rearranged as g(sw) = sw**n + bqv_rw * sw**(n-1) - sw_arch**n = 0,
+    # where sw_arch is the Archie saturation, which is also the upper bound.
+    bqv_rw = (rw * b * qv).ravel()
+    sw_arch_n = (a * phit**(-m_star) * rw / rt).ravel()
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        swt = sw_arch_n ** (1 / n_star)
+    lower = np.zeros_like(swt)
+    upper = swt.copy()
+    iterations = np.zeros(swt.shape, dtype=int)
+    converged = np.zeros(swt.shape, dtype=bool)
+    valid = np.isfinite(swt) & np.isfinite(bqv_rw) & (swt > 0) & (bqv_rw >= 0)
+    active = np.flatnonzero(valid)
+    swt[~valid] = np.nan
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        sw_act = swt[active]
+        n_act = n_star[active]
+        c_act = bqv_rw[active]
+        sw_pow = sw_act ** (n_act - 1)
+        g = sw_pow * (sw_act + c_act) - sw_arch_n[active]
+        g_prime = sw_pow * (n_act + (n_act - 1) * c_act / sw_act)
+
+        low_act = np.where(g < 0, sw_act, lower[active])
+        up_act = np.where(g > 0, sw_act, upper[active])
+        lower[active] = low_act
+        upper[active] = up_act
+
+        sw_new = sw_act - g / g_prime
+        outside = ~((sw_new >= low_act) & (sw_new <= up_act))
+        sw_new[outside] = 0.5 * (low_act[outside] + up_act[outside])
+
+        swt[active] = sw_new
+        iterations[active] += 1
+        done = (np.abs(sw_new - sw_act) <= tolerance) | (g == 0)
+        converged[active[done]] = True
+        active = active[~done]
+
+    if not diagnostics:
+        return _shaped(swt.reshape(shape), shape, index)
+
+    residual = (swt ** n_star + bqv_rw * swt ** (n_star - 1)) / sw_arch_n - 1
+    return WaxmanSmitsResult(*[_shaped(val.reshape(shape), shape, index) for val in (swt, iterations, residual, converged)])
+
+
+SHALY_SAND_MODELS = ("simandoux", "modified-simandoux", "indonesian", "waxman-smits")
+
+def sw_shaly_sand(rw, rt, rshale, vclay, phi, arch_a=1, arch_m=2, arch_n=2, b=None, qv=None, m_star=None, n_star=None, models=None, 
+                  limit_result=False, low_limit=0, high_limit=1):
+    """
+    Calculates water saturation with several shaly-sand models in a single pass.
+
+    Intended for comparing models over full curves. The clean-sand conductance term
+    (phi**m / (a * rw)) is computed once and shared between models, and the closed-form
+    models are evaluated in place in a small set of work buffers, so memory use does
+    not grow with the number of intermediate expressions.
+
+    Simandoux and modified Simandoux assume a saturation exponent of 2.
+
+    Parameters
+    ----------
+    rw : float or array-like
+        Water resistivity (ohm.m)
+    rt : float or array-like
+        Formation resistivity (ohm.m)
+    rshale : float or array-like
+        Shale resistivity (ohm.m)
+    vclay : float or array-like
+        Volume of clay (decimal)
+    phi : float or array-like
+        Porosity (decimal). Total porosity is used for Waxman-Smits.
+    arch_a : float or array-like, optional
+        a - Archie Tortuosity Factor
+        By default 1
+    arch_m : float or array-like, optional
+        m - Archie Cementation Exponent
+        By default 2
+    arch_n : float or array-like, optional
+        n - Archie Saturation Exponent. Used by Indonesian.
+        By default 2
+    b : float or array-like, optional
+        Equivalent Conductivity of Exchange Cations. Required for Waxman-Smits.
+    qv : float or array-like, optional
+        Cation Exchange Capacity Per Unit Pore Volume (meq-ml-1). Required for Waxman-Smits.
+    m_star : float or array-like, optional
+        Waxman-Smits cementation exponent. By default the value of arch_m.
+    n_star : float or array-like, optional
+        Waxman-Smits saturation exponent. By default the value of arch_n.
+    models : list of string, optional
+        Models to evaluate:
+        - simandoux
+        - modified-simandoux
+        - indonesian
+        - waxman-smits
+
+            By default all models, with waxman-smits only included when b and qv are given.
+    limit_result : bool, optional
+        Apply limits to the result values.
+        By default False
+    low_limit : int, optional
+        Low limit. If value falls below this limit it will be set to this value. 
+        By default 0
+    high_limit : float, optional
+        High limit. If value falls above this limit it will be set to this value.
+        By default: 1
+
+    Returns
+    -------
+    dict
+        Returns water saturation (decimal) for each requested model, keyed by model name.
 
+    Raises
+    ------
+    Exception
+        Raise an exception if a model is not recognised, or waxman-smits is requested without b and qv.
+    """
+    if models is None:
+        models = [model for model in SHALY_SAND_MODELS if model != "waxman-smits" or (b is not None and qv is not None)]
+    for model in models:
+        if model not in SHALY_SAND_MODELS:
+            raise Exception("Enter valid model values: simandoux, modified-simandoux, indonesian, waxman-smits")
+    if "waxman-smits" in models and (b is None or qv is None):
+        raise Exception("b and qv are required for the waxman-smits model")
+
+    (rw, rt, rshale, vclay, phi, arch_a, arch_m, arch_n), shape, index = _broadcast_float(
+        rw, rt, rshale, vclay, phi, arch_a, arch_m, arch_n)
+    sand_term = _archie_conductance(phi, rw, arch_a, arch_m, np.empty(shape))
+    work = np.empty(shape)
+    results = {}
+
+    if "simandoux" in models or "modified-simandoux" in models:
+        shale_term = np.divide(vclay, rshale, out=np.empty(shape))
+        if "simandoux" in models:
+            results["simandoux"] = _simandoux_root(sand_term, shale_term, rt, np.empty(shape), work)
+        if "modified-simandoux" in models:
+            # Scaled in a separate buffer so sand_term is left intact for the other models
+            mod_sand_term = np.subtract(1, vclay, out=np.empty(shape))
+            np.divide(sand_term, mod_sand_term, out=mod_sand_term)
+            results["modified-simandoux"] = _simandoux_root(mod_sand_term, shale_term, rt, np.empty(shape), work)
+
+    if "indonesian" in models:
+        results["indonesian"] = _indonesian(sand_term, rt, rshale, vclay, arch_n, np.empty(shape), work)
+
+    if "waxman-smits" in models:
+        results["waxman-smits"] = np.asarray(sw_waxsmit(rw, rt, b, qv, arch_a, phi,
+                                                        arch_m if m_star is None else m_star,
+                                                        arch_n if n_star is None else n_star))
+
+    for model, sw in results.items():
+        if limit_result is True:
+            np.clip(sw, low_limit, high_limit, out=sw)
+        results[model] = _shaped(sw, shape, index)
+
+    return {model: results[model] for model in models}
 
 def excess_cond_bqv(b, qv):
     return b * qv
@@ -214,14 +551,14 @@ def equiv_cond_echange_cations_B(temp, rw):
 
     Parameters
     ----------
-    temp : float
+    temp : float or array-like
         Temperature (deg C)
-    rw : float
+    rw : float or array-like
         Water Resistivity (ohmm.m)
 
     Returns
     -------
-    float
+    float or array-like
         B - Equivalent Conductivity of Exchange Cations
     """
     part_a = (-1.28 + 0.225 * temp - 0.0004059 * temp**2)
@@ -240,18 +577,18 @@ def qv_juhasz(vclay_dry, density_dry_clay, cec_dry_clay, phit):
 
     Parameters
     ----------
-    vclay_dry : float
+    vclay_dry : float or array-like
         Volume of dry clay (decimal)
-    density_dry_clay : float
+    density_dry_clay : float or array-like
         Density of dry clay (g/cc)
-    cec_dry_clay : float
+    cec_dry_clay : float or array-like
         Cation Exchange Capacity of the average clay minerals present (meq/g)
-    phit : float
+    phit : float or array-like
         Total porosity
 
     Returns
     -------
-    float
+    float or array-like
         Returns Qv - Cation Exchange Capacity per unit total pore volume.
     
     References
@@ -270,16 +607,16 @@ def vol_dry_clay(phi_n, phi_d, HI_dry_clay):
 
     Parameters
     ----------
-    phi_n : float
+    phi_n : float or array-like
         Neutron porosity (decimal)
-    phi_d : float
+    phi_d : float or array-like
         Density porosity (decimal)
-    HI_dry_clay : float
+    HI_dry_clay : float or array-like
         Hydrogen Index of the average dry clay-mineral mixture within the formation (decimal)
 
     Returns
     -------
-    float
+    float or array-like
         Returns volume of dry clay (decimal)
     
     References
@@ -298,14 +635,14 @@ def bvw(sw, phi):
 
     Parameters
     ----------
-    sw : float
+    sw : float or array-like
         Water saturation (dec)
-    phi : float
+    phi : float or array-like
         Porosity (dec)
 
     Returns
     -------
-    float
+    float or array-like
         Bulk volume water (dec)
     """
     return sw * phi
\ No newline at end of file
@@ -2,6 +2,10 @@
 Temperature related calculations
 """
 
+import numpy as np
+
+from . import salinity
+
 def temp_gradient(bottom_hole_temperature, surface_temperature, bottom_hole_depth):
     """
     Temperature gradient calculation.
@@ -44,4 +48,92 @@ def formation_temperature(surface_temperature, gradient, depth):
     form_temp = surface_temperature + gradient * depth
     return form_temp
 
-print(formation_temperature(60, 0.01125, 8000))
\ No newline at end of file
+class TemperatureProfile:
+    """
+    Piecewise linear temperature profile through a set of measured temperatures.
+
+    The gradient between each pair of neighbouring control points is constant. Above the
+    shallowest and below the deepest point the nearest gradient is extrapolated.
+
+    Parameters
+    ----------
+    depths : array-like
+        Depths of the measured temperatures, e.g. bottom hole temperatures from several
+        logging runs (ft or m)
+    temperatures : array-like
+        Measured temperatures (deg F or deg C)
+    surface_temperature : float, optional
+        Surface temperature, added as a control point at depth 0.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if there are fewer than two control points or a depth is repeated.
+
+    Examples
+    --------
+        profile = TemperatureProfile([4500, 8000, 11200], [118, 150, 196], surface_temperature=60)
+        rw_curve = profile.rw_at_depth(depth, rw=0.05, rw_temperature=75, temperature_units="f")
+    """
+    def __init__(self, depths, temperatures, surface_temperature=None):
+        depths = np.atleast_1d(np.asarray(depths, dtype=float))
+        temperatures = np.atleast_1d(np.asarray(temperatures, dtype=float))
+        if depths.shape != temperatures.shape:
+            raise Exception("Enter one temperature for each depth")
+        if surface_temperature is not None:
+            depths = np.append(0.0, depths)
+            temperatures = np.append(float(surface_temperature), temperatures)
+        order = np.argsort(depths, kind="stable")
+        self.depths = depths[order]
+        self.temperatures = temperatures[order]
+        if self.depths.size < 2:
+            raise Exception("A temperature profile needs at least two control points")
+        if np.any(np.diff(self.depths) == 0):
+            raise Exception("Control point depths must be unique")
+
+    @property
+    def gradients(self):
+        """Temperature gradient of each interval between control points (degF/ft or degC/m)."""
+        return np.diff(self.temperatures) / np.diff(self.depths)
+
+    def temperature(self, depth):
+        """
+        Calculates formation temperature.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depth at which temperature is required (ft or m)
+
+        Returns
+        -------
+        float or array-like
+            Returns formation temperature at each depth.
+        """
+        depth = np.asarray(depth, dtype=float)
+        segment = np.clip(np.searchsorted(self.depths, depth, side="right") - 1, 0, self.depths.size - 2)
+        result = self.temperatures[segment] + self.gradients[segment] * (depth - self.depths[segment])
+        return result[()]
+
+    def rw_at_depth(self, depth, rw, rw_temperature, temperature_units):
+        """
+        Converts water resistivity from a known temperature to the formation temperature at each depth.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depths (ft or m)
+        rw : float or array-like
+            Water Resistivity (ohmm)
+        rw_temperature : float or array-like
+            Temperature Rw was measured at.
+        temperature_units : string
+            Temperature units of the profile and rw_temperature.
+            Enter f for degrees farenheit or c for degrees celsius.
+
+        Returns
+        -------
+        float or array-like
+            Returns water resistivity at formation temperature for each depth.
+        """
+        return salinity.rw_at_form_temp(rw, rw_temperature, temperature_units, self.temperature(depth))
@@ -0,0 +1,539 @@
+"""
+Uncertainty analysis
+"""
+
+import numpy as np
+
+from . import clayshale, porosity, saturation
+
+def sample_distribution(distribution, size, rng=None):
+    """
+    Draws random samples from a parameter distribution.
+
+    Parameters
+    ----------
+    distribution : float or tuple
+        A fixed value, or a tuple describing the distribution:
+            ("normal", mean, standard deviation)
+            ("lognormal", mean, standard deviation) - of the natural log of the value
+            ("uniform", low, high)
+            ("triangular", low, mode, high)
+    size : int
+        Number of samples.
+    rng : numpy.random.Generator, optional
+        Random number generator. By default a new unseeded generator.
+
+    Returns
+    -------
+    array-like
+        Returns the samples.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if the distribution type is not recognised.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if not isinstance(distribution, (tuple, list)):
+        return np.full(size, distribution, dtype=float)
+    kind, args = distribution[0], distribution[1:]
+    if kind == "normal":
+        return rng.normal(*args, size=size)
+    elif kind == "lognormal":
+        return rng.lognormal(*args, size=size)
+    elif kind == "uniform":
+        return rng.uniform(*args, size=size)
+    elif kind == "triangular":
+        return rng.triangular(*args, size=size)
+    else:
+        raise Exception("Enter a valid distribution: normal, lognormal, uniform or triangular")
+
+class PercentileAccumulator:
+    """
+    Streaming per-sample percentile estimates for a curve over many realizations.
+
+    Each depth sample keeps a fixed-bin histogram of the values added to it, so memory
+    use depends on the number of depth samples and bins but not on the number of
+    realizations. Percentiles are interpolated within bins, giving a resolution of
+    (high - low) / bins. Values outside the range are counted in the end bins and NaN
+    values are ignored.
+
+    Parameters
+    ----------
+    size : int
+        Number of depth samples.
+    low : float, optional
+        Lower edge of the histogram range.
+        By default 0
+    high : float, optional
+        Upper edge of the histogram range.
+        By default 1
+    bins : int, optional
+        Number of histogram bins.
+        By default 100
+    """
+    def __init__(self, size, low=0, high=1, bins=100):
+        self.size = size
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.counts = np.zeros((size, bins), dtype=np.int64)
+
+    def add(self, values):
+        """
+        Adds a block of realizations.
+
+        Parameters
+        ----------
+        values : array-like
+            Array of shape (realizations, size).
+        """
+        values = np.asarray(values, dtype=float)
+        valid = np.isfinite(values)
+        bin_index = np.floor((values - self.low) * (self.bins / (self.high - self.low)))
+        bin_index[~valid] = 0
+        bin_index = np.clip(bin_index, 0, self.bins - 1, out=bin_index).astype(np.int64)
+        bin_index += np.arange(self.size) * self.bins
+        self.counts += np.bincount(bin_index[valid], minlength=self.size * self.bins).reshape(self.size, self.bins)
+
+    def merge(self, other):
+        """Adds the counts of another accumulator with the same size and bins."""
+        if other.counts.shape != self.counts.shape or (other.low, other.high) != (self.low, self.high):
+            raise Exception("Accumulators must have the same size, range and bins to be merged")
+        self.counts += other.counts
+
+    def percentile(self, percentile):
+        """
+        Estimates a percentile for each depth sample.
+
+        Parameters
+        ----------
+        percentile : float
+            Percentile (0 - 100).
+
+        Returns
+        -------
+        array-like
+            Returns the percentile curve. Samples without any values are NaN.
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        total = cumulative[:, -1]
+        target = total * (percentile / 100)
+        bin_index = np.minimum((cumulative < target[:, None]).sum(axis=1), self.bins - 1)
+        rows = np.arange(self.size)
+        below = np.where(bin_index > 0, cumulative[rows, bin_index - 1], 0)
+        in_bin = self.counts[rows, bin_index]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.where(in_bin > 0, (target - below) / in_bin, 0.5)
+            result = self.low + (bin_index + fraction) * ((self.high - self.low) / self.bins)
+        result[total == 0] = np.nan
+        return result
+
+def monte_carlo_sw(rhob, gr, rt, rhomatrix, rhofluid, gr_clean, gr_shale, rw, arch_a, arch_m, arch_n,
+                   vsh_method="linear", phi_shale=0, realizations=1000, percentiles=(10, 50, 90),
+                   phi_cutoff=None, vsh_cutoff=None, sw_cutoff=None, sample_thickness=1,
+                   max_block_memory=64 * 2**20, bins=100, seed=None):
+    """
+    Monte Carlo uncertainty analysis of porosity, shale volume and water saturation.
+
+    Parameters are sampled from their distributions for each realization, and
+    porosity_density, gr_clay_shale_vol and sw_archie are evaluated over blocks of
+    (realizations x depth). Percentile curves are built with PercentileAccumulator and
+    net pay is reduced to one value per realization, so only one block of realizations
+    is held in memory at a time.
+
+    Porosity used for saturation is effective porosity: density porosity - vsh * phi_shale.
+
+    Parameters
+    ----------
+    rhob : array-like
+        Bulk density curve (g/cc)
+    gr : array-like
+        Gamma ray curve (API)
+    rt : array-like
+        True formation resistivity curve (ohm.m)
+    rhomatrix, rhofluid, gr_clean, gr_shale, rw, arch_a, arch_m, arch_n, phi_shale : float or tuple
+        Parameter values or distributions. See sample_distribution for the distribution format.
+    vsh_method : string, optional
+        Method passed to clayshale.gr_clay_shale_vol.
+        By default linear
+    realizations : int, optional
+        Number of realizations.
+        By default 1000
+    percentiles : list of float, optional
+        Percentiles to return (cumulative convention: P10 is the 10th percentile, which
+        is the P90 of the exceedance convention used for reserves).
+        By default (10, 50, 90)
+    phi_cutoff, vsh_cutoff, sw_cutoff : float, optional
+        Net pay cutoffs. A sample is pay when porosity >= phi_cutoff, vsh <= vsh_cutoff
+        and sw <= sw_cutoff. Cutoffs left as None are not applied.
+    sample_thickness : float or array-like, optional
+        Thickness represented by each depth sample, used to sum net pay.
+        By default 1
+    max_block_memory : int, optional
+        Approximate memory limit in bytes for each block of realizations.
+        By default 64 MB
+    bins : int, optional
+        Number of histogram bins per sample used for the percentile estimates.
+        By default 100
+    seed : int, optional
+        Random seed.
+
+    Returns
+    -------
+    dict
+        Returns:
+            phi, vsh, sw - dicts of percentile curves keyed "P10", "P50", ...
+            net_pay - net pay for each realization
+            net_pay_percentiles - net pay percentiles keyed "P10", "P50", ...
+
+    Raises
+    ------
+    Exception
+        Raise an exception if realizations is less than 1 or the curves are empty.
+    """
+    if realizations < 1:
+        raise Exception("Enter a valid realizations value: at least 1")
+    rhob, gr, rt = [np.atleast_1d(np.asarray(curve, dtype=float)) for curve in (rhob, gr, rt)]
+    size = np.broadcast_shapes(rhob.shape, gr.shape, rt.shape)[0]
+    if size < 1:
+        raise Exception("Enter valid curves: at least one depth sample")
+    rng = np.random.default_rng(seed)
+    params = {"rhomatrix": rhomatrix, "rhofluid": rhofluid, "gr_clean": gr_clean, "gr_shale": gr_shale, "rw": rw,
+              "arch_a": arch_a, "arch_m": arch_m, "arch_n": arch_n, "phi_shale": phi_shale}
+    samples = {name: sample_distribution(dist, realizations, rng)[:, None] for name, dist in params.items()}
+
+    accumulators = {curve: PercentileAccumulator(size, 0, 1, bins) for curve in ("phi", "vsh", "sw")}
+    net_pay = np.zeros(realizations)
+    # Roughly six full size temporaries are live while a block is evaluated
+    block = int(max(1, min(realizations, max_block_memory // (size * 8 * 6))))
+
+    for start in range(0, realizations, block):
+        p = {name: values[start:start + block] for name, values in samples.items()}
+        vsh = clayshale.gr_clay_shale_vol(p["gr_clean"], p["gr_shale"], gr, vsh_method, limit_result=True)
+        phi = porosity.porosity_density(p["rhomatrix"], p["rhofluid"], rhob)
+        phi -= vsh * p["phi_shale"]
+        np.clip(phi, 0, 1, out=phi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sw = saturation.sw_archie(phi, p["rw"], rt, p["arch_a"], p["arch_m"], p["arch_n"], limit_result=True)
+
+        accumulators["phi"].add(phi)
+        accumulators["vsh"].add(vsh)
+        accumulators["sw"].add(sw)
+
+        pay = np.isfinite(sw) & np.isfinite(phi)
+        if phi_cutoff is not None:
+            pay &= phi >= phi_cutoff
+        if vsh_cutoff is not None:
+            pay &= vsh <= vsh_cutoff
+        if sw_cutoff is not None:
+            pay &= sw <= sw_cutoff
+        net_pay[start:start + block] = (pay * sample_thickness).sum(axis=1)
+
+    result = {curve: {"P{:g}".format(pct): acc.percentile(pct) for pct in percentiles} for curve, acc in accumulators.items()}
+    result["net_pay"] = net_pay
+    result["net_pay_percentiles"] = {"P{:g}".format(pct): np.percentile(net_pay, pct) for pct in percentiles}
+    return result
+
+def first_order_std(derivatives, std=None, covariance=None):
+    """
+    Propagates input uncertainties to a result using first-order (linearised) error propagation.
+
+    The variance of the result is J C J^T, where J holds the partial derivatives of the
+    result with respect to each input and C is the input covariance matrix.
+
+    Parameters
+    ----------
+    derivatives : dict
+        Partial derivatives of the result keyed by input name, e.g. from sw_archie_derivatives.
+    std : dict, optional
+        Standard deviations (float or array-like) of uncorrelated inputs keyed by input name.
+    covariance : tuple, optional
+        (names, matrix) giving the covariance matrix of correlated inputs, with rows and
+        columns in the order of names. An input must not appear in both std and covariance.
+
+    Returns
+    -------
+    float or array-like
+        Returns the standard deviation of the result.
+
+    Raises
+    ------
+    Exception
+        Raise an exception if an input name is not one of the derivatives, or is given in
+        both std and covariance.
+    """
+    std = std or {}
+    names, matrix = covariance if covariance is not None else ([], np.zeros((0, 0)))
+    matrix = np.asarray(matrix, dtype=float)
+    unknown = [name for name in list(std) + list(names) if name not in derivatives]
+    if unknown:
+        raise Exception("Unknown inputs: {}. Enter one of: {}".format(", ".join(unknown), ", ".join(derivatives)))
+    repeated = [name for name in std if name in names]
+    if repeated:
+        raise Exception("Inputs given in both std and covariance: {}".format(", ".join(repeated)))
+
+    variance = 0
+    for name, sigma in std.items():
+        variance = variance + (derivatives[name] * sigma)**2
+    for i, name_i in enumerate(names):
+        for j, name_j in enumerate(names):
+            if matrix[i, j] != 0:
+                variance = variance + derivatives[name_i] * derivatives[name_j] * matrix[i, j]
+    return np.sqrt(variance)
+
+def formation_factor_derivatives(arch_a, phi, arch_m):
+    """
+    Archie Formation Factor and its partial derivatives.
+
+    Parameters
+    ----------
+    arch_a : float or array-like
+        Archie Tortuosity Factor - a
+    phi : float or array-like
+        Porosity (decimal)
+    arch_m : float or array-like
+        Archie Cementation Exponent - m
+
+    Returns
+    -------
+    tuple
+        Returns the formation factor and a dict of partial derivatives keyed by argument name.
+    """
+    ff = saturation.formation_factor(arch_a, phi, arch_m)
+    return ff, {"arch_a": ff / arch_a, "phi": -arch_m * ff / phi, "arch_m": -ff * np.log(phi)}
+
+def sw_archie_derivatives(phi, rw, rt, arch_a, arch_m, arch_n):
+    """
+    Archie water saturation and its partial derivatives.
+
+    Parameters
+    ----------
+    phi : float or array-like
+        Porosity (decimal)
+    rw : float or array-like
+        Water resistivity (ohmm.m)
+    rt : float or array-like
+        True formation resistivity (ohmm.m)
+    arch_a : float or array-like
+        a - Archie Tortuosity Factor
+    arch_m : float or array-like
+        m - Archie Cementation Exponent
+    arch_n : float or array-like
+        n - Archie Saturation Exponent
+
+    Returns
+    -------
+    tuple
+        Returns the water saturation and a dict of partial derivatives keyed by argument name.
+    """
+    sw = saturation.sw_archie(phi, rw, rt, arch_a, arch_m, arch_n)
+    sw_n = sw / arch_n
+    return sw, {"phi": -arch_m * sw_n / phi, "rw": sw_n / rw, "rt": -sw_n / rt, "arch_a": sw_n / arch_a,
+                "arch_m": -sw_n * np.log(phi), "arch_n": -sw_n * np.log(sw)}
+
+def porosity_density_derivatives(rhomatrix, rhofluid, rhobulk):
+    """
+    Density porosity and its partial derivatives.
+
+    Parameters
+    ----------
+    rhomatrix : float or array-like
+        Matrix density.
+    rhofluid : float or array-like
+        Fluid density.
+    rhobulk : float or array-like
+        Bulk density from log measurements
+
+    Returns
+    -------
+    tuple
+        Returns the density porosity and a dict of partial derivatives keyed by argument name.
+    """
+    phi = porosity.porosity_density(rhomatrix, rhofluid, rhobulk)
+    denominator = rhobulk - rhofluid
+    return phi, {"rhomatrix": 1 / denominator,
+                 "rhofluid": phi / denominator,
+                 "rhobulk": -(rhomatrix - rhofluid) / denominator**2}
+
+def porosity_sonic_derivatives(dtmatrix, dtfluid, dtlog, method="wyllie"):
+    """
+    Sonic porosity and its partial derivatives.
+
+    Parameters
+    ----------
+    dtmatrix : float or array-like
+        Matrix slowness.
+    dtfluid : float or array-like
+        Fluid slowness.
+    dtlog : float or array-like
+        Slowness (DT) from log measurements.
+    method : string
+        Sonic porosity method, "wyllie" or "raymer". See porosity.porosity_sonic.
+
+    Returns
+    -------
+    tuple
+        Returns the sonic porosity and a dict of partial derivatives keyed by argument name.
+    """
+    phi = porosity.porosity_sonic(dtmatrix, dtfluid, dtlog, method)
+    if method == "wyllie":
+        span = dtfluid - dtmatrix
+        return phi, {"dtmatrix": (dtlog - dtfluid) / span**2, "dtfluid": -phi / span, "dtlog": 1 / span}
+    alpha = (dtmatrix / (2 * dtfluid)) - 1
+    root = -alpha - phi
+    d_alpha = -1 - alpha / root
+    return phi, {"dtmatrix": d_alpha / (2 * dtfluid) - 1 / (2 * root * dtlog),
+                 "dtfluid": -d_alpha * dtmatrix / (2 * dtfluid**2),
+                 "dtlog": dtmatrix / (2 * root * dtlog**2)}
+
+def gr_clay_shale_vol_derivatives(minvalue, maxvalue, inputvalue, method="linear"):
+    """
+    Gamma ray clay or shale volume and its partial derivatives.
+
+    Parameters
+    ----------
+    minvalue : float or array-like
+        Value representing a 100% clean interval.
+    maxvalue : float or array-like
+        Value representing either 100% clay or 100% shale.
+    inputvalue : float or array-like
+        Gamma ray value from log measurements.
+    method : string
+        VClay or VShale method. See clayshale.gr_clay_shale_vol.
+
+    Returns
+    -------
+    tuple
+        Returns the clay or shale volume and a dict of partial derivatives keyed by argument name.
+    """
+    vol = clayshale.gr_clay_shale_vol(minvalue, maxvalue, inputvalue, method)
+    span = maxvalue - minvalue
+    igr = (inputvalue - minvalue) / span
+
+    if method == "linear":
+        d_igr = 1
+    elif method == "larionov-young":
+        d_igr = 0.083 * 3.71 * np.log(2) * 2**(3.71 * igr)
+    elif method == "larionov-old":
+        d_igr = 0.33 * 2 * np.log(2) * 2**(2 * igr)
+    elif method == "steiber":
+        d_igr = 3 / (3 - 2 * igr)**2
+    elif method == "clavier":
+        d_igr = (igr + 0.7) / (3.38 - (igr + 0.7)**2)**0.5
+
+    return vol, {"minvalue": d_igr * (inputvalue - maxvalue) / span**2,
+                 "maxvalue": -d_igr * igr / span,
+                 "inputvalue": d_igr / span}
+
+def sw_archie_uncertainty(phi, rw, rt, arch_a, arch_m, arch_n, std=None, covariance=None):
+    """
+    Archie water saturation with its first-order standard deviation.
+
+    Parameters
+    ----------
+    phi, rw, rt, arch_a, arch_m, arch_n : float or array-like
+        Inputs to saturation.sw_archie.
+    std : dict, optional
+        Standard deviations of uncorrelated inputs keyed by argument name, e.g.
+        {"phi": 0.02, "rw": 0.005, "arch_m": 0.1}. Curves of standard deviation may be
+        given, such as the result of porosity_density_uncertainty.
+    covariance : tuple, optional
+        (names, matrix) covariance of correlated inputs. See first_order_std.
+
+    Returns
+    -------
+    tuple
+        Returns the water saturation and its standard deviation.
+    """
+    sw, derivatives = sw_archie_derivatives(phi, rw, rt, arch_a, arch_m, arch_n)
+    return sw, first_order_std(derivatives, std, covariance)
+
+def formation_factor_uncertainty(arch_a, phi, arch_m, std=None, covariance=None):
+    """
+    Archie Formation Factor with its first-order standard deviation.
+
+    Parameters
+    ----------
+    arch_a, phi, arch_m : float or array-like
+        Inputs to saturation.formation_factor.
+    std : dict, optional
+        Standard deviations of uncorrelated inputs keyed by argument name.
+    covariance : tuple, optional
+        (names, matrix) covariance of correlated inputs. See first_order_std.
+
+    Returns
+    -------
+    tuple
+        Returns the formation factor and its standard deviation.
+    """
+    ff, derivatives = formation_factor_derivatives(arch_a, phi, arch_m)
+    return ff, first_order_std(derivatives, std, covariance)
+
+def porosity_density_uncertainty(rhomatrix, rhofluid, rhobulk, std=None, covariance=None):
+    """
+    Density porosity with its first-order standard deviation.
+
+    Parameters
+    ----------
+    rhomatrix, rhofluid, rhobulk : float or array-like
+        Inputs to porosity.porosity_density.
+    std : dict, optional
+        Standard deviations of uncorrelated inputs keyed by argument name.
+    covariance : tuple, optional
+        (names, matrix) covariance of correlated inputs. See first_order_std.
+
+    Returns
+    -------
+    tuple
+        Returns the density porosity and its standard deviation.
+    """
+    phi, derivatives = porosity_density_derivatives(rhomatrix, rhofluid, rhobulk)
+    return phi, first_order_std(derivatives, std, covariance)
+
+def porosity_sonic_uncertainty(dtmatrix, dtfluid, dtlog, method="wyllie", std=None, covariance=None):
+    """
+    Sonic porosity with its first-order standard deviation.
+
+    Parameters
+    ----------
+    dtmatrix, dtfluid, dtlog : float or array-like
+        Inputs to porosity.porosity_sonic.
+    method : string
+        Sonic porosity method, "wyllie" or "raymer".
+    std : dict, optional
+        Standard deviations of uncorrelated inputs keyed by argument name.
+    covariance : tuple, optional
+        (names, matrix) covariance of correlated inputs. See first_order_std.
+
+    Returns
+    -------
+    tuple
+        Returns the sonic porosity and its standard deviation.
+    """
+    phi, derivatives = porosity_sonic_derivatives(dtmatrix, dtfluid, dtlog, method)
+    return phi, first_order_std(derivatives, std, covariance)
+
+def gr_clay_shale_vol_uncertainty(minvalue, maxvalue, inputvalue, method="linear", std=None, covariance=None):
+    """
+    Gamma ray clay or shale volume with its first-order standard deviation.
+
+    Parameters
+    ----------
+    minvalue, maxvalue, inputvalue : float or array-like
+        Inputs to clayshale.gr_clay_shale_vol.
+    method : string
+        VClay or VShale method.
+    std : dict, optional
+        Standard deviations of uncorrelated inputs keyed by argument name.
+    covariance : tuple, optional
+        (names, matrix) covariance of correlated inputs. See first_order_std.
+
+    Returns
+    -------
+    tuple
+        Returns the clay or shale volume and its standard deviation.
+    """
+    vol, derivatives = gr_clay_shale_vol_derivatives(minvalue, maxvalue, inputvalue, method)
+    return vol, first_order_std(derivatives, std, covariance)
@@ -0,0 +1,384 @@
+"""
+Memory-mapped well storage
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+
+from . import las
+
+HEADER_FILE = "header.json"
+
+def _safe_name(name):
+    # File and directory names are limited to portable characters, and never "." or ".."
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", str(name))
+    return safe if safe.strip(".") else "_" + safe
+
+def _curve_filename(mnemonic, used=()):
+    # Mnemonics that sanitize to the same name (e.g. "GR/1" and "GR:1") get numbered
+    # files. Compared case-insensitively for case-insensitive file systems.
+    base = _safe_name(mnemonic)
+    used = {filename.lower() for filename in used}
+    filename = base + ".bin"
+    count = 1
+    while filename.lower() in used:
+        filename = "{}_{}.bin".format(base, count)
+        count += 1
+    return filename
+
+class Well:
+    """
+    A single well in a WellStore.
+
+    Each curve is held in its own file as a contiguous binary array and is memory-mapped
+    when accessed, so curves can be passed to the calculation functions without being
+    read into memory. The header holds the index curve, units, null value and the number
+    of samples.
+
+    Wells should be opened with WellStore.open_well rather than created directly.
+
+    Parameters
+    ----------
+    path : string
+        Path to the well directory.
+    mode : string, optional
+        "r" for read only access, "r+" to also allow curves to be written.
+        By default "r"
+    """
+    def __init__(self, path, mode="r"):
+        if mode not in ("r", "r+"):
+            raise Exception("Enter a valid mode value: r or r+")
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, HEADER_FILE), "r") as header_file:
+            self.header = json.load(header_file)
+
+    def __repr__(self):
+        return "Well({!r}, {} samples, curves={})".format(self.name, self.size, self.curves)
+
+    def __contains__(self, mnemonic):
+        return mnemonic in self.header["curves"]
+
+    def __getitem__(self, mnemonic):
+        return self.read_curve(mnemonic)
+
+    def __setitem__(self, mnemonic, values):
+        self.write_curve(mnemonic, values)
+
+    @property
+    def name(self):
+        return self.header["name"]
+
+    @property
+    def size(self):
+        return self.header["size"]
+
+    @property
+    def curves(self):
+        return list(self.header["curves"])
+
+    @property
+    def index(self):
+        """Returns the depth index curve."""
+        return self.read_curve(self.header["index"])
+
+    @property
+    def null(self):
+        return self.header["null"]
+
+    def unit(self, mnemonic):
+        """Returns the units of a curve."""
+        return self._curve_info(mnemonic)["unit"]
+
+    def _curve_info(self, mnemonic):
+        if mnemonic not in self.header["curves"]:
+            raise Exception("Curve {} not found in well {}".format(mnemonic, self.name))
+        return self.header["curves"][mnemonic]
+
+    def _save_header(self):
+        tmp_path = os.path.join(self.path, HEADER_FILE + ".tmp")
+        with open(tmp_path, "w") as header_file:
+            json.dump(self.header, header_file, indent=2)
+        os.replace(tmp_path, os.path.join(self.path, HEADER_FILE))
+
+    def _curve_file(self, mnemonic):
+        # An existing curve keeps its file, a new curve gets a file no other curve uses
+        if mnemonic in self.header["curves"]:
+            return self.header["curves"][mnemonic]["file"]
+        return _curve_filename(mnemonic, [info["file"] for info in self.header["curves"].values()])
+
+    def _check_writable(self):
+        if self.mode != "r+":
+            raise Exception("Well {} is open read only. Open with mode='r+' to write curves".format(self.name))
+
+    def read_curve(self, mnemonic):
+        """
+        Memory-maps a curve.
+
+        Parameters
+        ----------
+        mnemonic : string
+            Curve mnemonic.
+
+        Returns
+        -------
+        array-like
+            Returns the curve as a memory-mapped array. The array is read only unless
+            the well was opened with mode "r+".
+        """
+        info = self._curve_info(mnemonic)
+        if self.size == 0:
+            return np.empty(0, dtype=info["dtype"])
+        return np.memmap(os.path.join(self.path, info["file"]), dtype=info["dtype"], mode=self.mode, shape=(self.size,))
+
+    def create_curve(self, mnemonic, unit="", dtype="float64", description=""):
+        """
+        Creates a new curve file and memory-maps it for writing.
+
+        Results can be written straight into the returned array, e.g. with
+        numpy ufuncs' out argument or by slice assignment, without holding a
+        second copy of the curve in memory. An existing curve with the same
+        mnemonic is overwritten.
+
+        Parameters
+        ----------
+        mnemonic : string
+            Curve mnemonic.
+        unit : string, optional
+            Curve units.
+        dtype : string, optional
+            Curve data type.
+            By default float64
+        description : string, optional
+            Curve description.
+
+        Returns
+        -------
+        array-like
+            Returns a writable memory-mapped array filled with NaN (or zero for integer types).
+        """
+        self._check_writable()
+        filename = self._curve_file(mnemonic)
+        self.header["curves"][mnemonic] = {"unit": unit, "dtype": np.dtype(dtype).str, "file": filename, "description": description}
+        self._save_header()
+        if self.size == 0:
+            open(os.path.join(self.path, filename), "wb").close()
+            return np.empty(0, dtype=dtype)
+        curve = np.memmap(os.path.join(self.path, filename), dtype=dtype, mode="w+", shape=(self.size,))
+        if curve.dtype.kind == "f":
+            curve[:] = np.nan
+        return curve
+
+    def write_curve(self, mnemonic, values, unit="", description=""):
+        """
+        Writes a curve to the well.
+
+        Parameters
+        ----------
+        mnemonic : string
+            Curve mnemonic.
+        values : array-like
+            Curve values. Must have the same number of samples as the well.
+        unit : string, optional
+            Curve units.
+        description : string, optional
+            Curve description.
+        """
+        self._check_writable()
+        values = np.asarray(values)
+        if values.shape != (self.size,):
+            raise Exception("Curve {} has {} samples, expected {}".format(mnemonic, values.size, self.size))
+        filename = self._curve_file(mnemonic)
+        values.tofile(os.path.join(self.path, filename))
+        self.header["curves"][mnemonic] = {"unit": unit, "dtype": values.dtype.str, "file": filename, "description": description}
+        self._save_header()
+
+    def delete_curve(self, mnemonic):
+        """
+        Deletes a curve from the well.
+
+        Parameters
+        ----------
+        mnemonic : string
+            Curve mnemonic.
+        """
+        self._check_writable()
+        if mnemonic == self.header["index"]:
+            raise Exception("The index curve cannot be deleted")
+        info = self._curve_info(mnemonic)
+        del self.header["curves"][mnemonic]
+        self._save_header()
+        os.remove(os.path.join(self.path, info["file"]))
+
+class WellStore:
+    """
+    A directory of wells stored as memory-mapped curve arrays.
+
+    Each well is a sub-directory containing a header.json file and one binary file per
+    curve. Directory and file names are the well names and curve mnemonics with
+    characters other than letters, digits, "_", "." and "-" replaced by "_". Multiple
+    processes can open the same well and share the mapped pages rather than each
+    reading the data into memory.
+
+    Parameters
+    ----------
+    root : string
+        Path to the store directory. Created if it does not exist.
+    """
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def __repr__(self):
+        return "WellStore({!r})".format(self.root)
+
+    def __contains__(self, name):
+        return os.path.isfile(os.path.join(self._well_path(name), HEADER_FILE))
+
+    def wells(self):
+        """Returns the directory names of the wells in the store, which can be passed to open_well."""
+        return sorted(name for name in os.listdir(self.root) if name in self)
+
+    def open_well(self, name, mode="r"):
+        """
+        Opens a well.
+
+        Parameters
+        ----------
+        name : string
+            Well name.
+        mode : string, optional
+            "r" for read only access, "r+" to also allow curves to be written.
+            By default "r"
+
+        Returns
+        -------
+        Well
+        """
+        if name not in self:
+            raise Exception("Well {} not found in {}".format(name, self.root))
+        return Well(self._well_path(name), mode=mode)
+
+    def create_well(self, name, index, index_name="DEPT", index_unit="", null=None):
+        """
+        Creates a new well from a depth index.
+
+        Parameters
+        ----------
+        name : string
+            Well name.
+        index : array-like
+            Depth index.
+        index_name : string, optional
+            Index curve mnemonic.
+            By default DEPT
+        index_unit : string, optional
+            Index units.
+        null : float, optional
+            Null value used in the source data.
+
+        Returns
+        -------
+        Well
+            Returns the new well opened with mode "r+".
+        """
+        path = self._new_well_path(name)
+        index = np.asarray(index, dtype=float)
+        self._write_header(path, name, index_name, index.size, null)
+        well = Well(path, mode="r+")
+        well.write_curve(index_name, index, unit=index_unit)
+        return well
+
+    def import_las(self, filepath, name=None, chunk_size=10000):
+        """
+        Imports a LAS file into the store.
+
+        The LAS file is read in chunks and appended to the curve files, so files larger
+        than the available memory can be imported. Null values are stored as NaN.
+
+        Parameters
+        ----------
+        filepath : string
+            Path to the LAS file.
+        name : string, optional
+            Well name. By default the WELL value from the LAS header, or the file name if
+            the header does not define one.
+        chunk_size : int, optional
+            Number of depth samples read at a time.
+            By default 10000
+
+        Returns
+        -------
+        Well
+            Returns the imported well opened with mode "r".
+        """
+        header = las.read_las_header(filepath)
+        if not header["curves"]:
+            raise Exception("LAS file {} has no curves".format(filepath))
+        if name is None:
+            name = header["well"].get("WELL", {}).get("value") or os.path.splitext(os.path.basename(filepath))[0]
+        path = self._new_well_path(name)
+
+        curves = {}
+        files = {}
+        size = 0
+        try:
+            try:
+                for curve in header["curves"]:
+                    filename = _curve_filename(curve["mnemonic"], [info["file"] for info in curves.values()])
+                    curves[curve["mnemonic"]] = {"unit": curve["unit"], "dtype": np.dtype(float).str, "file": filename,
+                                                 "description": curve["description"]}
+                    files[curve["mnemonic"]] = open(os.path.join(path, filename), "wb")
+                for chunk in las.iter_las(filepath, chunk_size=chunk_size):
+                    for mnemonic, values in chunk.items():
+                        values.tofile(files[mnemonic])
+                    size += values.size
+            finally:
+                for curve_file in files.values():
+                    curve_file.close()
+            self._write_header(path, name, header["curves"][0]["mnemonic"], size, header["null"], curves)
+        except BaseException:
+            # Remove the partial well so it does not look like a complete import
+            self._remove_well_files(path, [info["file"] for info in curves.values()])
+            raise
+        return Well(path, mode="r")
+
+    def delete_well(self, name):
+        """
+        Deletes a well and all of its curves.
+
+        Parameters
+        ----------
+        name : string
+            Well name.
+        """
+        well = self.open_well(name)
+        self._remove_well_files(well.path, [info["file"] for info in well.header["curves"].values()])
+
+    def _remove_well_files(self, path, filenames):
+        # Only the files of the well are removed, so the directory is left if anything else is in it
+        for filename in filenames + [HEADER_FILE, HEADER_FILE + ".tmp"]:
+            if os.path.exists(os.path.join(path, filename)):
+                os.remove(os.path.join(path, filename))
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+
+    def _well_path(self, name):
+        return os.path.join(self.root, _safe_name(name))
+
+    def _new_well_path(self, name):
+        if name in self:
+            raise Exception("Well {} already exists in {}".format(name, self.root))
+        path = self._well_path(name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _write_header(self, path, name, index_name, size, null, curves=None):
+        header = {"name": name, "index": index_name, "size": int(size), "null": null, "curves": curves or {}}
+        with open(os.path.join(path, HEADER_FILE), "w") as header_file:
+            json.dump(header, header_file, indent=2)
@@ -0,0 +1,203 @@
+"""
+Lazy interpretation workflows
+"""
+
+class Workflow:
+    """
+    A lazily evaluated graph of petrophysical calculations.
+
+    Each node wraps one calculation function. Node arguments are either taken from
+    other nodes (inputs) or are fixed parameter values (params). Nodes are only
+    evaluated when their result, or a result that depends on them, is requested, and
+    results are cached until an input or parameter they depend on is changed.
+
+    Examples
+    --------
+        wf = Workflow()
+        wf.add_input("GR", gr)
+        wf.add_input("RHOB", rhob)
+        wf.add_input("RT", rt)
+        wf.add_node("VSH", clayshale.gr_clay_shale_vol, inputs={"inputvalue": "GR"},
+                    params={"minvalue": 20, "maxvalue": 120, "limit_result": True})
+        wf.add_node("PHIT", porosity.porosity_density, inputs={"rhobulk": "RHOB"},
+                    params={"rhomatrix": 2.65, "rhofluid": 1.0})
+        wf.add_node("PHIE", porosity.porosity_effective, inputs={"phit": "PHIT", "vclay": "VSH"},
+                    params={"phitclay": 0.1})
+        wf.add_node("SW", saturation.sw_archie, inputs={"phi": "PHIE", "rt": "RT"},
+                    params={"rw": 0.05, "arch_a": 1, "arch_m": 2, "arch_n": 2})
+        sw = wf["SW"]
+        wf.set_params("VSH", minvalue=25)  # Only VSH, PHIE and SW are recomputed
+        sw = wf["SW"]
+    """
+    def __init__(self):
+        self._inputs = {}
+        self._nodes = {}
+        self._dependents = {}
+        self._cache = {}
+
+    def __repr__(self):
+        return "Workflow(inputs={}, nodes={})".format(list(self._inputs), list(self._nodes))
+
+    def __contains__(self, name):
+        return name in self._inputs or name in self._nodes
+
+    def __getitem__(self, name):
+        return self.evaluate(name)
+
+    def add_input(self, name, value):
+        """
+        Adds an input curve or value, or replaces the value of an existing input.
+
+        Parameters
+        ----------
+        name : string
+            Input name.
+        value : float or array-like
+            Input value.
+        """
+        if name in self._nodes:
+            raise Exception("{} is already a calculation node".format(name))
+        self._dependents.setdefault(name, set())
+        self._invalidate(name)
+        self._inputs[name] = value
+
+    def add_node(self, name, func, inputs=None, params=None):
+        """
+        Adds a calculation node.
+
+        Parameters
+        ----------
+        name : string
+            Node name.
+        func : function
+            Calculation function, called with the inputs and params as keyword arguments.
+        inputs : dict, optional
+            Maps function argument names to the names of existing inputs or nodes.
+        params : dict, optional
+            Maps function argument names to fixed values.
+        """
+        if name in self:
+            raise Exception("{} already exists in the workflow".format(name))
+        inputs = dict(inputs or {})
+        missing = [source for source in inputs.values() if source not in self]
+        if missing:
+            raise Exception("Unknown inputs for node {}: {}".format(name, ", ".join(missing)))
+        self._nodes[name] = {"func": func, "inputs": inputs, "params": dict(params or {})}
+        self._dependents[name] = set()
+        for source in inputs.values():
+            self._dependents[source].add(name)
+
+    def set_params(self, name, **params):
+        """
+        Updates parameter values of a node.
+
+        The cached results of the node and every node that depends on it are discarded.
+
+        Parameters
+        ----------
+        name : string
+            Node name.
+        **params
+            Parameter values to update.
+        """
+        if name not in self._nodes:
+            raise Exception("Node {} not found in the workflow".format(name))
+        self._nodes[name]["params"].update(params)
+        self._invalidate(name)
+
+    def params(self, name):
+        """Returns a copy of the parameter values of a node."""
+        return dict(self._nodes[name]["params"])
+
+    def is_cached(self, name):
+        """Returns True if the result of a node is cached."""
+        return name in self._cache
+
+    def dependents(self, name):
+        """Returns the names of all nodes that depend on an input or node."""
+        found = set()
+        stack = [name]
+        while stack:
+            for dependent in self._dependents[stack.pop()]:
+                if dependent not in found:
+                    found.add(dependent)
+                    stack.append(dependent)
+        return found
+
+    def evaluate(self, name):
+        """
+        Evaluates a node, along with any nodes it depends on that are not cached.
+
+        Parameters
+        ----------
+        name : string
+            Input or node name.
+
+        Returns
+        -------
+        float or array-like
+            Returns the result of the node.
+        """
+        if name in self._inputs:
+            return self._inputs[name]
+        if name not in self._nodes:
+            raise Exception("{} not found in the workflow".format(name))
+        if name not in self._cache:
+            node = self._nodes[name]
+            kwargs = {arg: self.evaluate(source) for arg, source in node["inputs"].items()}
+            kwargs.update(node["params"])
+            self._cache[name] = node["func"](**kwargs)
+        return self._cache[name]
+
+    def results(self, names=None):
+        """
+        Evaluates several nodes.
+
+        Parameters
+        ----------
+        names : list of string, optional
+            Node names. By default all nodes are evaluated.
+
+        Returns
+        -------
+        dict
+            Returns the result of each node keyed by node name.
+        """
+        if names is None:
+            names = list(self._nodes)
+        return {name: self.evaluate(name) for name in names}
+
+    def run(self, inputs, names=None):
+        """
+        Replaces the workflow inputs and evaluates several nodes.
+
+        Allows one workflow to be applied to many wells, e.g. as the recipe for
+        batch.run_batch.
+
+        Parameters
+        ----------
+        inputs : dict
+            Values for every workflow input keyed by input name. Other keys are ignored.
+        names : list of string, optional
+            Node names. By default all nodes are evaluated.
+
+        Returns
+        -------
+        dict
+            Returns the result of each node keyed by node name.
+        """
+        missing = [name for name in self._inputs if name not in inputs]
+        if missing:
+            raise Exception("Missing workflow inputs: {}".format(", ".join(missing)))
+        for name in self._inputs:
+            self.add_input(name, inputs[name])
+        return self.results(names)
+
+    def clear_cache(self):
+        """Discards all cached results."""
+        self._cache.clear()
+
+    def _invalidate(self, name):
+        self._cache.pop(name, None)
+        for dependent in self.dependents(name):
+            self._cache.pop(dependent, None)
@@ -0,0 +1,205 @@
+"""
+Zone based interpretation parameters
+"""
+
+import inspect
+
+import numpy as np
+
+class ZoneTable:
+    """
+    Interpretation parameters that vary by formation zone.
+
+    Every depth sample is mapped to its zone with a single sorted search over the zone
+    tops, and zone parameters are expanded to per-sample curves by indexing. The
+    expanded parameters can be passed straight to the vectorized calculation functions,
+    so there is no loop over zones however many zones there are.
+
+    Parameters
+    ----------
+    tops : array-like
+        Zone top depths, in increasing order.
+    bases : array-like, optional
+        Zone base depths. By default each zone extends to the top of the next zone, and
+        the last zone extends to infinite depth. A base may be above the next top to
+        leave a gap between zones.
+    names : list of string, optional
+        Zone names. By default the zones are named by number.
+    **parameters
+        Parameter columns, with one value per zone, e.g. minvalue=[20, 25, 30].
+
+    Raises
+    ------
+    Exception
+        Raise an exception if zones are not in depth order, overlap, or a parameter column
+        does not have one value per zone.
+
+    Examples
+    --------
+        zones = ZoneTable(tops=[1000, 1250, 1600], names=["A", "B", "C"],
+                          minvalue=[20, 25, 30], maxvalue=[120, 140, 135])
+        vsh = zones.apply(clayshale.gr_clay_shale_vol, depth, inputvalue=gr)
+    """
+    def __init__(self, tops, bases=None, names=None, **parameters):
+        self.tops = np.asarray(tops, dtype=float)
+        if bases is None:
+            bases = np.append(self.tops[1:], np.inf)
+        self.bases = np.asarray(bases, dtype=float)
+        self.names = list(names) if names is not None else [str(i) for i in range(len(self.tops))]
+
+        if self.bases.shape != self.tops.shape or len(self.names) != len(self.tops):
+            raise Exception("tops, bases and names must have one value per zone")
+        if np.any(np.diff(self.tops) <= 0):
+            raise Exception("Zone tops must be in increasing depth order")
+        if np.any(self.bases <= self.tops) or np.any(self.bases[:-1] > self.tops[1:]):
+            raise Exception("Zone bases must be below their tops and must not overlap the next zone")
+
+        self.parameters = {}
+        for name, values in parameters.items():
+            self.add_parameter(name, values)
+
+    def __repr__(self):
+        return "ZoneTable({} zones, parameters={})".format(len(self), list(self.parameters))
+
+    def __len__(self):
+        return len(self.tops)
+
+    def add_parameter(self, name, values):
+        """
+        Adds or replaces a parameter column.
+
+        Parameters
+        ----------
+        name : string
+            Parameter name.
+        values : array-like
+            One value per zone.
+        """
+        values = np.asarray(values)
+        if values.shape != self.tops.shape:
+            raise Exception("Parameter {} must have one value per zone".format(name))
+        self.parameters[name] = values
+
+    def zone_index(self, depth):
+        """
+        Finds the zone of each depth sample.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depths.
+
+        Returns
+        -------
+        int or array-like
+            Returns the index of the zone containing each sample, or -1 for samples that
+            are outside every zone (or NaN).
+        """
+        depth = np.asarray(depth, dtype=float)
+        index = np.searchsorted(self.tops, depth, side="right") - 1
+        inside = (index >= 0) & (depth < self.bases[np.maximum(index, 0)])
+        return np.where(inside, index, -1)[()]
+
+    def zone_names(self, depth, outside=""):
+        """
+        Returns the zone name of each depth sample.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depths.
+        outside : string, optional
+            Name given to samples outside every zone.
+
+        Returns
+        -------
+        array-like
+            Returns an array of zone names.
+        """
+        return np.array(self.names + [outside])[self.zone_index(depth)]
+
+    def parameter(self, name, depth, default=np.nan):
+        """
+        Expands a zone parameter to a curve.
+
+        Parameters
+        ----------
+        name : string
+            Parameter name.
+        depth : float or array-like
+            Depths.
+        default : float, optional
+            Value for samples outside every zone.
+            By default NaN
+
+        Returns
+        -------
+        array-like
+            Returns the parameter value at each depth sample.
+        """
+        return self._expand(name, self.zone_index(depth), default)
+
+    def curves(self, depth, names=None, default=np.nan):
+        """
+        Expands several zone parameters to curves.
+
+        Parameters
+        ----------
+        depth : float or array-like
+            Depths.
+        names : list of string, optional
+            Parameter names. By default all parameters.
+        default : float, optional
+            Value for samples outside every zone.
+            By default NaN
+
+        Returns
+        -------
+        dict
+            Returns the parameter curves keyed by parameter name.
+        """
+        index = self.zone_index(depth)
+        names = self.parameters if names is None else names
+        return {name: self._expand(name, index, default) for name in names}
+
+    def apply(self, func, depth, columns=None, default=np.nan, **kwargs):
+        """
+        Calls a calculation function with zone parameters expanded to curves.
+
+        Any parameter column with the same name as an argument of func is expanded and
+        passed to it, unless that argument is given in kwargs.
+
+        Parameters
+        ----------
+        func : function
+            Calculation function, e.g. clayshale.gr_clay_shale_vol.
+        depth : array-like
+            Depth of each sample.
+        columns : dict, optional
+            Maps function argument names to parameter names that differ from them,
+            e.g. {"minvalue": "gr_clean"}.
+        default : float, optional
+            Parameter value for samples outside every zone.
+            By default NaN
+        **kwargs
+            Other arguments for func, such as the input curves.
+
+        Returns
+        -------
+        float or array-like
+            Returns the result of func.
+        """
+        columns = dict(columns or {})
+        for argument in inspect.signature(func).parameters:
+            if argument not in columns and argument in self.parameters:
+                columns[argument] = argument
+        index = self.zone_index(depth)
+        for argument, name in columns.items():
+            if argument not in kwargs:
+                kwargs[argument] = self._expand(name, index, default)
+        return func(**kwargs)
+
+    def _expand(self, name, index, default):
+        if name not in self.parameters:
+            raise Exception("Parameter {} not found in the zone table".format(name))
+        return np.append(self.parameters[name], default)[index]
@@ -6,6 +6,8 @@ setup(
     author='Andy McDonald',
     email='andymcdonaldpetro@gmail.com',
     packages=['pypetrophysics'],
+    install_requires=['numpy>=1.20'],
+    python_requires='>=3.7',
     version='0.2.0',
     description='A library of petrophysical calculations',
     long_description=open('README.md').read()
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, fused, porosity, saturation
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pypetrophysics.accessor")
+
+def make_frame():
+    rng = np.random.default_rng(5)
+    return pd.DataFrame({
+        "DEPT": np.arange(100) * 0.5,
+        "GR": rng.uniform(10, 150, 100),
+        "RHOZ": rng.uniform(2.0, 2.65, 100),
+        "AT90": rng.uniform(1, 200, 100),
+        "NPHI": rng.uniform(0.1, 0.4, 100),
+    })
+
+def test_workflow_matches_functions():
+    df = make_frame()
+    df.petro.set_curves(RHOB="RHOZ", RT="AT90")
+    df.petro.gr_clay_shale_vol(minvalue=20, maxvalue=130, limit_result=True)
+    df.petro.porosity_density(rhomatrix=2.65, rhofluid=1, limit_result=True)
+    df.petro.porosity_effective(phitclay=0.1)
+    result = df.petro.sw_archie(rw=0.05, arch_a=1, arch_m=2, arch_n=2)
+    assert result is df
+
+    vsh = clayshale.gr_clay_shale_vol(20, 130, df["GR"].to_numpy(), limit_result=True)
+    phit = porosity.porosity_density(2.65, 1, df["RHOZ"].to_numpy(), limit_result=True)
+    phie = porosity.porosity_effective(phit, vsh, 0.1)
+    np.testing.assert_allclose(df["VSH"], vsh)
+    np.testing.assert_allclose(df["PHIT"], phit)
+    np.testing.assert_allclose(df["SW"], saturation.sw_archie(phie, 0.05, df["AT90"].to_numpy(), 1, 2, 2))
+
+def test_mapping_survives_copy_and_output_name():
+    df = make_frame()
+    df.petro.set_curves(RHOB="RHOZ", PHIT="PHID")
+    copy = df.copy()
+    copy.petro.porosity_density(rhomatrix=2.71, rhofluid=1)
+    assert "PHID" in copy.columns
+    copy.petro.porosity_density(output="PHID_SS", rhomatrix=2.65, rhofluid=1)
+    assert "PHID_SS" in copy.columns
+    assert "PHID" not in df.columns
+
+def test_call_overrides():
+    df = make_frame()
+    df["DPHI"] = df["NPHI"] - 0.05
+    df.petro.den_neu_shale_vol(neut_shale_porosity=0.35, dens_shale_porosity=0.1)
+    np.testing.assert_allclose(df["VSH"], 0.05 / 0.25)
+    df.petro.sw_archie(curves={"phi": "NPHI", "rt": "AT90"}, rw=pd.Series(np.full(100, 0.1)), arch_a=1, arch_m=2, arch_n=2)
+    np.testing.assert_allclose(df["SW"], saturation.sw_archie(df["NPHI"], 0.1, df["AT90"], 1, 2, 2))
+
+def test_dict_results():
+    df = make_frame().rename(columns={"RHOZ": "RHOB", "AT90": "RT"})
+    df.petro.sw_archie_from_logs(rhomatrix=2.65, rhofluid=1, gr_clean=20, gr_shale=130, phi_shale=0.1, rw=0.05,
+                                 arch_a=1, arch_m=2, arch_n=2)
+    expected = fused.sw_archie_from_logs(df["RHOB"], df["GR"], df["RT"], 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2)
+    for key, column in (("vsh", "VSH"), ("phit", "PHIT"), ("phie", "PHIE"), ("sw", "SW")):
+        np.testing.assert_allclose(df[column], expected[key])
+
+    df["PHIE"] = df["PHIE"] + 0.05
+    df["VSH"] = df["VSH"].clip(upper=0.9)
+    df.petro.sw_shaly_sand(rw=0.05, rshale=4, models=["simandoux", "modified-simandoux"])
+    assert {"SW_SIMANDOUX", "SW_MODIFIED_SIMANDOUX"} <= set(df.columns)
+    df.petro.sw_shaly_sand(rw=0.05, rshale=4, models=["indonesian"], output="SWX")
+    np.testing.assert_allclose(df["SWX_INDONESIAN"], saturation.sw_indonesian(0.05, df["RT"], 4, df["VSH"], df["PHIE"], 2, 2))
+
+def test_scalar_result_broadcast():
+    df = make_frame()
+    df["PHIE"] = 0.2
+    df["SW"] = 0.5
+    df.petro.bvw()
+    np.testing.assert_allclose(df["BVW"], 0.1)
+
+def test_errors():
+    df = make_frame()
+    with pytest.raises(Exception):
+        df.petro.porosity_density(rhomatrix=2.65, rhofluid=1)
+    with pytest.raises(Exception):
+        df.petro.gr_clay_shale_vol(minvalue=20, maxvalue=130, not_an_argument=1)
+    with pytest.raises(Exception):
+        df.petro.calculate("not_a_calculation")
+    with pytest.raises(AttributeError):
+        df.petro.not_a_calculation
+    assert "sw_archie" in dir(df.petro)
@@ -0,0 +1,84 @@
+import pickle
+
+import numpy as np
+import pytest
+from pypetrophysics import autopick, zones
+
+rng = np.random.default_rng(1)
+gr = rng.normal(75, 25, 200000)
+
+def rank_error(values, estimate, percentile):
+    return abs(np.mean(values <= estimate) - percentile / 100)
+
+@pytest.mark.parametrize('percentile', [1, 5, 50, 95, 99])
+def test_sketch_percentile(percentile):
+    sketch = autopick.QuantileSketch(seed=0)
+    for chunk in np.array_split(gr, 37):
+        sketch.update(chunk)
+    assert len(sketch) == gr.size
+    assert rank_error(gr, sketch.percentile(percentile), percentile) < 0.01
+    assert sum(items.size for items in sketch.levels) < 200 * len(sketch.levels)
+
+def test_sketch_exact_when_small():
+    sketch = autopick.QuantileSketch(k=200)
+    sketch.update([5, np.nan, 1, 3, 2, 4])
+    assert len(sketch) == 5
+    np.testing.assert_array_equal(sketch.percentile([0, 40, 100]), [1, 2, 5])
+    assert np.isnan(autopick.QuantileSketch().percentile(50))
+
+def test_sketch_odd_leftover_is_random():
+    leftovers = set()
+    for seed in range(20):
+        sketch = autopick.QuantileSketch(k=4, seed=seed)
+        sketch.update(np.arange(5.0))
+        assert sketch.levels[0].size == 1
+        leftovers.add(sketch.levels[0][0])
+    assert len(leftovers) > 1
+
+def test_sketch_merge():
+    parts = [autopick.QuantileSketch(seed=i) for i in range(4)]
+    for part, chunk in zip(parts, np.array_split(gr, 4)):
+        part.update(chunk)
+    parts = [pickle.loads(pickle.dumps(part)) for part in parts]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert len(merged) == gr.size
+    for percentile in (5, 95):
+        assert rank_error(gr, merged.percentile(percentile), percentile) < 0.01
+
+def test_pick_endpoints():
+    clean, shale = autopick.pick_endpoints(gr, seed=0)
+    assert isinstance(clean, float)
+    assert abs(clean - np.percentile(gr, 5)) < 1.5
+    assert abs(shale - np.percentile(gr, 95)) < 1.5
+
+def test_pick_endpoints_by_zone():
+    depth = np.arange(gr.size) * 0.1
+    curve = np.where(depth < 10000, gr, gr + 50)
+    table = zones.ZoneTable(tops=[0, 10000, 30000], names=["upper", "lower", "empty"])
+    clean, shale = autopick.pick_endpoints(curve, 10, 90, depth=depth, zones=table, chunk_size=7000, seed=0)
+    upper, lower = curve[depth < 10000], curve[depth >= 10000]
+    assert abs(clean[0] - np.percentile(upper, 10)) < 1.5
+    assert abs(shale[1] - np.percentile(lower, 90)) < 1.5
+    assert np.isnan(clean[2])
+
+def test_picker_merge_and_add_to_zones():
+    depth = np.arange(gr.size) * 0.1
+    table = zones.ZoneTable(tops=[0, 10000])
+    pickers = [autopick.EndpointPicker(zones=table, seed=i) for i in range(2)]
+    for picker, block in zip(pickers, np.array_split(np.arange(gr.size), 2)):
+        picker.update(gr[block], depth[block])
+    pickers[0].merge(pickers[1]).add_to_zones(table)
+    np.testing.assert_array_equal(table.parameters["minvalue"], pickers[0].endpoints()[0])
+    assert "maxvalue" in table.parameters
+
+def test_picker_errors():
+    with pytest.raises(Exception):
+        autopick.EndpointPicker(clean_percentile=-1)
+    with pytest.raises(Exception):
+        autopick.EndpointPicker(zones=zones.ZoneTable(tops=[0])).update(gr)
+    with pytest.raises(Exception):
+        autopick.EndpointPicker().merge(autopick.EndpointPicker(zones=zones.ZoneTable(tops=[0, 1])))
+    with pytest.raises(Exception):
+        autopick.pick_endpoints(gr, chunk_size=0)
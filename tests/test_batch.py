@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+import pytest
+from pypetrophysics import batch, porosity, saturation
+from pypetrophysics.workflow import Workflow
+
+las_text = """~VERSION INFORMATION
+ VERS.                  2.0 :   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                  NO  :   ONE LINE PER DEPTH STEP
+~WELL INFORMATION
+NULL    .              -999.25                  :NULL VALUE
+~CURVE INFORMATION
+DEPT   .FT                  :   DEPTH
+RHOB   .G/C3                :   BULK DENSITY
+RT     .OHMM                :   RESISTIVITY
+~A
+1000.0 2.45 20
+1000.5 2.35 8
+"""
+
+def archie_recipe(curves):
+    phi = porosity.porosity_density(2.65, 1, curves["RHOB"])
+    return saturation.sw_archie(phi, 0.05, curves["RT"], 1, 2, 2)
+
+def failing_recipe(curves):
+    if curves["RT"][0] < 0:
+        raise ValueError("negative resistivity")
+    return archie_recipe(curves)
+
+def unpicklable_recipe(curves):
+    if curves["RT"][0] < 0:
+        return lambda: None
+    return archie_recipe(curves)
+
+def crashing_recipe(curves):
+    if curves["RT"][0] < 0:
+        os._exit(1)
+    return archie_recipe(curves)
+
+in_memory_wells = [{"RHOB": np.array([2.45, 2.3]), "RT": np.array([rt, rt / 2])} for rt in (2, 5, 10, 20, 50, -1)]
+
+@pytest.mark.parametrize('max_workers, chunksize', [(1, 1), (2, 1), (2, 4)])
+def test_run_batch_order(max_workers, chunksize):
+    results = batch.run_batch(in_memory_wells[:-1], archie_recipe, max_workers=max_workers, chunksize=chunksize)
+    assert len(results) == 5
+    for well, result in zip(in_memory_wells, results):
+        assert result.error is None
+        np.testing.assert_allclose(result.result, archie_recipe(well))
+
+def test_run_batch_error_isolation():
+    results = batch.run_batch(in_memory_wells, failing_recipe, max_workers=2)
+    assert all(result.error is None for result in results[:-1])
+    assert "negative resistivity" in results[-1].error
+    assert results[-1].result is None
+
+def test_run_batch_unpicklable_result():
+    results = batch.run_batch(in_memory_wells, unpicklable_recipe, max_workers=2)
+    assert all(result.error is None for result in results[:-1])
+    assert results[-1].result is None
+    assert results[-1].error is not None
+
+def test_run_batch_worker_crash():
+    results = batch.run_batch(in_memory_wells, crashing_recipe, max_workers=2)
+    assert len(results) == len(in_memory_wells)
+    assert "BrokenProcessPool" in results[-1].error
+    assert results[-1].result is None
+
+def test_run_batch_raise_errors():
+    with pytest.raises(Exception):
+        batch.run_batch(in_memory_wells, failing_recipe, max_workers=1, raise_errors=True)
+
+def test_run_batch_invalid_chunksize():
+    with pytest.raises(Exception, match="chunksize"):
+        batch.run_batch(in_memory_wells, archie_recipe, max_workers=1, chunksize=0)
+
+def test_run_batch_progress():
+    calls = []
+    batch.run_batch(in_memory_wells, failing_recipe, max_workers=1, chunksize=4, progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(4, 6), (6, 6)]
+
+def test_run_batch_las_files_with_workflow(tmp_path):
+    paths = []
+    for i in range(3):
+        filepath = tmp_path / "well_{}.las".format(i)
+        filepath.write_text(las_text)
+        paths.append(str(filepath))
+    wf = Workflow()
+    wf.add_input("RHOB", None)
+    wf.add_input("RT", None)
+    wf.add_node("PHIT", porosity.porosity_density, inputs={"rhobulk": "RHOB"}, params={"rhomatrix": 2.65, "rhofluid": 1})
+    wf.add_node("SW", saturation.sw_archie, inputs={"phi": "PHIT", "rt": "RT"},
+                params={"rw": 0.05, "arch_a": 1, "arch_m": 2, "arch_n": 2})
+    results = batch.run_batch(paths, wf.run, max_workers=2, curves=["RHOB", "RT"])
+    assert [result.well for result in results] == paths
+    expected = archie_recipe({"RHOB": np.array([2.45, 2.35]), "RT": np.array([20, 8])})
+    for result in results:
+        np.testing.assert_allclose(result.result["SW"], expected)
@@ -0,0 +1,32 @@
+import json
+import pytest
+from benchmarks import run_benchmarks
+
+def test_every_public_function_has_a_case():
+    missing = set(run_benchmarks.public_functions()) - set(run_benchmarks.CASES) - run_benchmarks.SKIPPED
+    assert missing == set()
+
+@pytest.mark.parametrize('name', list(run_benchmarks.CASES))
+def test_benchmark_cases_run(name):
+    sizes = (10,) if name in run_benchmarks.CURVE_ONLY else ("scalar", 10)
+    for size in sizes:
+        result = run_benchmarks.run_benchmark(name, size, min_time=0)
+        assert result["seconds"] >= 0
+        assert result["peak_memory"] >= 0
+
+def test_compare():
+    baseline = {"results": [{"name": "porosity.porosity_density", "size": 1000, "seconds": 1.0},
+                            {"name": "saturation.sw_archie", "size": 1000, "seconds": 1.0}]}
+    results = {"results": [{"name": "porosity.porosity_density", "size": 1000, "seconds": 1.1},
+                           {"name": "saturation.sw_archie", "size": 1000, "seconds": 2.0}]}
+    regressions = run_benchmarks.compare(results, baseline, tolerance=0.25)
+    assert [regression["name"] for regression in regressions] == ["saturation.sw_archie"]
+
+def test_main(tmp_path):
+    output = str(tmp_path / "results.json")
+    assert run_benchmarks.main(["--sizes", "scalar", "100", "--filter", "porosity_density", "--min-time", "0", "--output", output]) == 0
+    with open(output) as results_file:
+        results = json.load(results_file)
+    assert [result["size"] for result in results["results"]] == ["scalar", 100]
+    assert run_benchmarks.main(["--sizes", "100", "--filter", "porosity_density", "--min-time", "0", "--baseline", output,
+                                "--tolerance", "1000"]) == 0
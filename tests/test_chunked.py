@@ -0,0 +1,97 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+from pypetrophysics import chunked, fused, porosity, saturation, wellstore
+
+rng = np.random.default_rng(6)
+size = 100001
+phi = rng.uniform(0.05, 0.35, size)
+rt = rng.uniform(1, 200, size)
+archie = dict(rw=0.05, arch_a=1, arch_m=2, arch_n=2)
+
+def test_chunk_length():
+    assert chunked.chunk_length(2**20, 2) == 2**20 // 88
+    assert chunked.chunk_length(10, 2) == 1
+
+def test_run_chunked_in_memory():
+    calls = []
+    result = chunked.run_chunked(saturation.sw_archie, {"phi": phi, "rt": rt}, params=archie,
+                                 memory_limit=11 * 8 * 1000, progress=lambda done, total: calls.append(done))
+    np.testing.assert_allclose(result, saturation.sw_archie(phi, 0.05, rt, 1, 2, 2))
+    assert len(calls) == 101
+    assert calls[-1] == size
+
+def test_run_chunked_npy_output(tmp_path):
+    np.save(tmp_path / "dt.npy", rng.uniform(55, 120, size))
+    dtlog = np.load(tmp_path / "dt.npy", mmap_mode="r")
+    result = chunked.run_chunked(porosity.porosity_sonic, {"dtlog": dtlog}, params=dict(dtmatrix=55.5, dtfluid=189, method="raymer"),
+                                 out=tmp_path / "phi.npy", memory_limit=2**16, dtype="float32")
+    assert isinstance(result, np.memmap)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(np.load(tmp_path / "phi.npy"), porosity.porosity_sonic(55.5, 189, np.asarray(dtlog), "raymer"), rtol=1e-6)
+
+def test_run_chunked_wellstore(tmp_path):
+    store = wellstore.WellStore(tmp_path)
+    well = store.create_well("W1", np.arange(size) * 0.1)
+    well.write_curve("PHIE", phi)
+    well.write_curve("RT", rt)
+    chunked.run_chunked(saturation.sw_archie, {"phi": well["PHIE"], "rt": well["RT"]}, params=archie,
+                        out=well.create_curve("SW"), memory_limit=2**18)
+    reopened = store.open_well("W1")
+    np.testing.assert_allclose(reopened["SW"], saturation.sw_archie(phi, 0.05, rt, 1, 2, 2))
+
+def test_run_chunked_dict_result(tmp_path):
+    curves = {"rhob": rng.uniform(2.0, 2.65, size), "gr": rng.uniform(10, 150, size), "rt": rt}
+    params = dict(rhomatrix=2.65, rhofluid=1, gr_clean=20, gr_shale=130, phi_shale=0.1, rw=0.05, arch_a=1, arch_m=2, arch_n=2)
+    sw = np.zeros(size)
+    result = chunked.run_chunked(fused.sw_archie_from_logs, curves, params=params, out={"sw": sw, "vsh": tmp_path / "vsh.npy"},
+                                 memory_limit=2**18)
+    expected = fused.sw_archie_from_logs(**curves, **params)
+    assert set(result) == {"sw", "vsh"}
+    assert result["sw"] is sw
+    np.testing.assert_allclose(sw, expected["sw"])
+    np.testing.assert_allclose(result["vsh"], expected["vsh"])
+    with pytest.raises(Exception):
+        chunked.run_chunked(fused.sw_archie_from_logs, curves, params=params, out=tmp_path / "all.npy")
+
+def test_run_chunked_failure_removes_outputs(tmp_path):
+    def failing(phi, rt):
+        if phi[0] > 0.3:
+            raise ValueError("bad chunk")
+        return {"sw": saturation.sw_archie(phi, 0.05, rt, 1, 2, 2), "bvw": phi}
+    values = np.full(1000, 0.2)
+    values[600:] = 0.35
+    with pytest.raises(ValueError):
+        chunked.run_chunked(failing, {"phi": values, "rt": np.full(1000, 20.0)},
+                            out={"sw": tmp_path / "sw.npy", "bvw": tmp_path / "bvw.npy"}, memory_limit=11 * 8 * 100)
+    assert list(tmp_path.iterdir()) == []
+
+def test_run_chunked_failed_output_removes_opened_files(tmp_path):
+    curves = {"rhob": np.full(10, 2.3), "gr": np.full(10, 50.0), "rt": np.full(10, 20.0)}
+    params = dict(rhomatrix=2.65, rhofluid=1, gr_clean=20, gr_shale=130, phi_shale=0, rw=0.05, arch_a=1, arch_m=2, arch_n=2)
+    with pytest.raises(Exception):
+        chunked.run_chunked(fused.sw_archie_from_logs, curves, params=params,
+                            out={"sw": tmp_path / "sw.npy", "vsh": tmp_path / "missing" / "vsh.npy"})
+    assert list(tmp_path.iterdir()) == []
+
+def test_run_chunked_flat_memory(tmp_path):
+    length = 2 * 10**6
+    np.save(tmp_path / "phi.npy", np.full(length, 0.2))
+    np.save(tmp_path / "rt.npy", np.full(length, 20.0))
+    curves = {"phi": np.load(tmp_path / "phi.npy", mmap_mode="r"), "rt": np.load(tmp_path / "rt.npy", mmap_mode="r")}
+    limit = 2**20
+    tracemalloc.start()
+    chunked.run_chunked(saturation.sw_archie, curves, params=archie, out=tmp_path / "sw.npy", memory_limit=limit)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < limit
+    assert np.load(tmp_path / "sw.npy", mmap_mode="r")[-1] == pytest.approx(0.25)
+
+def test_run_chunked_errors():
+    with pytest.raises(Exception):
+        chunked.run_chunked(saturation.sw_archie, {"phi": phi, "rt": rt[:10]}, params=archie)
+    with pytest.raises(Exception):
+        chunked.run_chunked(saturation.sw_archie, {"phi": phi, "rt": rt}, params=archie, out=np.zeros(10))
+    with pytest.raises(Exception):
+        chunked.run_chunked(saturation.sw_archie, {"phi": phi, "rt": rt}, params=archie, out={"sw": np.zeros(size)})
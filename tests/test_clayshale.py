@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pypetrophysics import clayshale
 
@@ -40,4 +41,34 @@ def test_sp_clay_shale_vol():
     assert clayshale.sp_clay_shale_vol(-122, -75, -95) == pytest.approx(0.5744, abs=0.001)
 
 def test_den_neu_shale_vol():
-    assert clayshale.den_neu_shale_vol(0.28, 0.12, 0.3, 0.03) == pytest.approx(0.592, abs=0.001)
\ No newline at end of file
+    assert clayshale.den_neu_shale_vol(0.28, 0.12, 0.3, 0.03) == pytest.approx(0.592, abs=0.001)
+
+# Testing array inputs give the same result as scalar inputs
+gr_curve = np.array([5, 30, 50, 80, 110, 125])
+
+@pytest.mark.parametrize('method', ["linear", "larionov-young", "larionov-old", "steiber", "clavier"])
+def test_gr_clay_shale_vol_array(method):
+    result = clayshale.gr_clay_shale_vol(10, 120, gr_curve, method, limit_result=True)
+    expected = [clayshale.gr_clay_shale_vol(10, 120, gr, method, limit_result=True) for gr in gr_curve]
+    np.testing.assert_allclose(result, expected)
+
+def test_gr_clay_shale_vol_series():
+    pd = pytest.importorskip("pandas")
+    gr = pd.Series(gr_curve, index=np.arange(1000, 1006) * 0.5)
+    result = clayshale.gr_clay_shale_vol(10, 120, gr, limit_result=True)
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(gr.index)
+    np.testing.assert_allclose(result, clayshale.gr_clay_shale_vol(10, 120, gr_curve, limit_result=True))
+
+def test_sp_clay_shale_vol_array():
+    sp = np.array([-130, -95, -60])
+    result = clayshale.sp_clay_shale_vol(-122, -75, sp, limit_result=True)
+    expected = [clayshale.sp_clay_shale_vol(-122, -75, val, limit_result=True) for val in sp]
+    np.testing.assert_allclose(result, expected)
+
+def test_den_neu_shale_vol_array():
+    nphi = np.array([0.28, 0.15, 0.35])
+    dphi = np.array([0.12, 0.16, 0.05])
+    result = clayshale.den_neu_shale_vol(nphi, dphi, 0.3, 0.03, limit_result=True)
+    expected = [clayshale.den_neu_shale_vol(n, d, 0.3, 0.03, limit_result=True) for n, d in zip(nphi, dphi)]
+    np.testing.assert_allclose(result, expected)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pypetrophysics import convert
@@ -8,4 +9,85 @@ def test_ft_to_m():
 
 def test_m_to_ft():
     result = convert.m_to_ft(10)
-    assert result == pytest.approx(32.8084, abs=0.01)
\ No newline at end of file
+    assert result == pytest.approx(32.8084, abs=0.01)
+
+temperature_params = [
+    (212, "f", "c", 100),
+    (100, "c", "f", 212),
+    (0, "c", "k", 273.15),
+    (32, "F", "K", 273.15),
+    (373.15, "k", "f", 212),
+    (50, "c", "c", 50),
+]
+
+@pytest.mark.parametrize('inputval, inputunits, outputunits, expected', temperature_params)
+def test_temperature_convert(inputval, inputunits, outputunits, expected):
+    assert convert.temperature_convert(inputval, inputunits, outputunits) == pytest.approx(expected)
+
+def test_temperature_convert_exception():
+    with pytest.raises(Exception):
+        convert.temperature_convert(50, "c", "r")
+
+units_params = [
+    (10, "ft", "m", 3.048),
+    (100, "us/ft", "us/m", 328.084),
+    (100, "us/ft", "ft/s", 10000),
+    (3048, "m/s", "us/ft", 100),
+    (2650, "kg/m3", "g/cc", 2.65),
+    (55, "percent", "decimal", 0.55),
+    (0.42, "v/v", "pu", 42),
+    (1, "OHMM", "ohm.m", 1),
+]
+
+@pytest.mark.parametrize('inputval, inputunits, outputunits, expected', units_params)
+def test_convert_units(inputval, inputunits, outputunits, expected):
+    assert convert.convert_units(inputval, inputunits, outputunits) == pytest.approx(expected, rel=1e-5)
+
+def test_convert_units_array():
+    result = convert.convert_units(np.array([32, 212, 50]), "f", "c")
+    np.testing.assert_allclose(result, [0, 100, 10])
+
+def test_convert_units_mixed_units():
+    result = convert.convert_units(np.array([10, 10, 1000]), ["ft", "m", "cm"], "m")
+    np.testing.assert_allclose(result, [3.048, 10, 10])
+
+def test_convert_units_exceptions():
+    with pytest.raises(Exception):
+        convert.convert_units(10, "ft", "c")
+    with pytest.raises(Exception):
+        convert.convert_units(10, "furlong", "m")
+
+def test_convert_curves():
+    depth = np.array([1000.0, 1000.5])
+    curves = {"DEPT": depth, "DT": np.array([100.0, 80.0]), "NPHI": np.array([20, 30]), "TEMP": np.array([212.0, 32.0]), "RT": np.array([1.0, 2.0])}
+    units = {"DEPT": "FT", "DT": "US/FT", "NPHI": "PU", "TEMP": "DEGF", "RT": "OHMM"}
+    new_units = convert.convert_curves(curves, units, {"length": "m", "slowness": "us/m", "NPHI": "v/v", "temperature": "c"})
+    assert new_units == {"DEPT": "m", "DT": "us/m", "NPHI": "v/v", "TEMP": "c", "RT": "OHMM"}
+    assert curves["DEPT"] is depth
+    np.testing.assert_allclose(depth, [304.8, 304.9524])
+    np.testing.assert_allclose(curves["DT"], [328.084, 262.467], rtol=1e-5)
+    np.testing.assert_allclose(curves["NPHI"], [0.2, 0.3])
+    np.testing.assert_allclose(curves["TEMP"], [100, 0])
+    np.testing.assert_allclose(curves["RT"], [1.0, 2.0])
+
+@pytest.fixture
+def unit_registry():
+    # Units registered by a test are removed afterwards, and the removal is checked
+    original = dict(convert.UNITS)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(convert, "UNITS", dict(convert.UNITS))
+        yield convert.UNITS
+    convert._clear_cache()
+    assert convert.UNITS == original
+    for name in ("kft", "KFT"):
+        with pytest.raises(Exception):
+            convert.convert_units(2, name, "ft")
+
+def test_register_unit(unit_registry):
+    convert.register_unit("kft", "length", 304.8)
+    assert "kft" in unit_registry
+    assert convert.convert_units(2, "kft", "ft") == pytest.approx(2000)
+
+def test_temperature_convert_array():
+    result = convert.temperature_convert(np.array([32.0, 212.0]), "F", "c")
+    np.testing.assert_allclose(result, [0, 100])
\ No newline at end of file
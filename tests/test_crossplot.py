@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, crossplot
+
+rng = np.random.default_rng(2)
+n = 100000
+phi = rng.uniform(0.05, 0.3, n)
+vsh = np.where(rng.random(n) < 0.15, 1, rng.uniform(0, 0.6, n) * (rng.random(n) < 0.5))
+nphi = phi * (1 - vsh) + vsh * 0.35 + rng.normal(0, 0.005, n)
+dphi = phi * (1 - vsh) + vsh * 0.10 + rng.normal(0, 0.005, n)
+nphi[:10] = np.nan
+
+def test_histogram_counts():
+    plot = crossplot.Crossplot(bins=(75, 50))
+    plot.add(nphi, dphi)
+    expected = np.histogram2d(nphi[10:], dphi[10:], bins=[plot.neutron_edges, plot.density_edges])[0]
+    np.testing.assert_array_equal(plot.counts, expected)
+    assert plot.total == n - 10
+
+def test_out_of_range_ignored():
+    plot = crossplot.Crossplot()
+    plot.add([0.1, 0.7, -0.2, 0.6], [0.1, 0.1, 0.1, 0.6])
+    assert plot.total == 2
+    assert plot.counts[-1, -1] == 1
+
+def test_merge():
+    whole = crossplot.Crossplot()
+    whole.add(nphi, dphi)
+    parts = [crossplot.Crossplot() for _ in range(3)]
+    for part, block in zip(parts, np.array_split(np.arange(n), 3)):
+        part.add(nphi[block], dphi[block])
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    with pytest.raises(Exception):
+        merged.merge(crossplot.Crossplot(bins=100))
+
+def test_endpoints():
+    result = crossplot.crossplot_endpoints(nphi, dphi, shale_percentile=90, clean_percentile=20)
+    assert result["neut_shale_porosity"] == pytest.approx(0.35, abs=0.01)
+    assert result["dens_shale_porosity"] == pytest.approx(0.10, abs=0.01)
+    assert result["clean_slope"] == pytest.approx(1, abs=0.05)
+    assert result["clean_intercept"] == pytest.approx(0, abs=0.01)
+
+    estimate = clayshale.den_neu_shale_vol(nphi, dphi, result["neut_shale_porosity"], result["dens_shale_porosity"])
+    assert np.nanmean(np.abs(estimate - vsh)) < 0.05
+
+def test_separation_percentile():
+    plot = crossplot.Crossplot(bins=300)
+    plot.add(nphi, dphi)
+    separation = nphi - dphi
+    expected = np.nanpercentile(separation, [10, 50, 90])
+    np.testing.assert_allclose(plot.separation_percentile([10, 50, 90]), expected, atol=0.005)
+
+def test_empty_crossplot():
+    plot = crossplot.Crossplot()
+    assert np.all(np.isnan(plot.shale_point()))
+    assert np.all(np.isnan(plot.clean_line()))
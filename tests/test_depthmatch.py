@@ -0,0 +1,104 @@
+import warnings
+
+import numpy as np
+import pytest
+from pypetrophysics import depthmatch
+
+rng = np.random.default_rng(0)
+knots = np.arange(900, 1101, 0.5)
+signal = rng.normal(size=knots.size)
+depth = np.arange(1000, 1050.001, 0.1)
+
+def log(d):
+    return np.interp(d, knots, signal)
+
+def test_bulk_shift():
+    reference = log(depth)
+    curve = log(depth + 1.3)
+    shift, correlation = depthmatch.bulk_shift(depth, reference, curve, max_shift=3)
+    assert shift == pytest.approx(1.3, abs=0.05)
+    assert correlation > 0.9
+
+def test_bulk_shift_with_nan():
+    reference = log(depth)
+    curve = log(depth - 0.8)
+    curve[100:150] = np.nan
+    reference[300:320] = np.nan
+    shift, _ = depthmatch.bulk_shift(depth, reference, curve, max_shift=2)
+    assert shift == pytest.approx(-0.8, abs=0.05)
+
+def test_bulk_shift_matches_lag_scan():
+    reference = log(depth)
+    curve = log(depth + 0.6)
+    shift, _ = depthmatch.bulk_shift(depth, reference, curve, max_shift=2)
+    lags = np.arange(-20, 21)
+    scores = [np.corrcoef(reference[max(lag, 0):reference.size + min(lag, 0)],
+                          curve[max(-lag, 0):curve.size + min(-lag, 0)])[0, 1] for lag in lags]
+    assert shift == pytest.approx(lags[np.argmax(scores)] * 0.1, abs=0.05)
+
+def test_windowed_shifts():
+    reference = log(depth)
+    true_shift = 0.5 + 0.02 * (depth - 1000)
+    curve = log(depth + true_shift)
+    centres, shifts, correlations = depthmatch.windowed_shifts(depth, reference, curve, window=10, max_shift=3)
+    assert centres.size == shifts.size == correlations.size
+    expected = 0.5 + 0.02 * (centres - 1000)
+    np.testing.assert_allclose(shifts, expected, atol=0.15)
+
+def test_apply_bulk_shift():
+    reference = log(depth)
+    curve = log(depth + 1.3)
+    shifted = depthmatch.apply_shifts(depth, {"GR": curve, "RHOB": curve * 2}, 1.3)
+    inside = ~np.isnan(shifted["GR"])
+    assert inside.sum() > depth.size - 15
+    np.testing.assert_allclose(shifted["GR"][inside], reference[inside], atol=1e-9)
+    np.testing.assert_allclose(shifted["RHOB"][inside], 2 * reference[inside], atol=1e-9)
+
+def test_match_and_apply_windowed():
+    reference = log(depth)
+    curve = log(depth + 0.5 + 0.02 * (depth - 1000))
+    centres, shifts, _ = depthmatch.windowed_shifts(depth, reference, curve, window=10, max_shift=3)
+    shifted = depthmatch.apply_shifts(depth, curve, shifts, centres)
+    inside = ~np.isnan(shifted)
+    before = np.abs(curve - reference).mean()
+    after = np.abs(shifted[inside] - reference[inside]).mean()
+    assert after < 0.2 * before
+
+def test_errors():
+    with pytest.raises(Exception):
+        depthmatch.bulk_shift(np.array([0, 1, 3.0]), np.ones(3), np.ones(3), 1)
+    with pytest.raises(Exception):
+        depthmatch.apply_shifts(depth, log(depth), np.array([0, 1.0]))
+    with pytest.raises(Exception):
+        depthmatch.apply_shifts(depth, log(depth), np.array([5.0, 0]), np.array([1000, 1000.5]))
+
+def test_length_mismatch():
+    reference = log(depth)
+    with pytest.raises(Exception, match="same length"):
+        depthmatch.bulk_shift(depth, reference, reference[:-10], 2)
+    with pytest.raises(Exception, match="same length"):
+        depthmatch.windowed_shifts(depth[:-1], reference, reference, 10, 2)
+
+def test_all_nan_reference():
+    reference = np.full(depth.size, np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        shift, correlation = depthmatch.bulk_shift(depth, reference, log(depth), 2)
+        _, shifts, _ = depthmatch.windowed_shifts(depth, reference, log(depth), 10, 2)
+    assert np.isnan(shift) and np.isnan(correlation)
+    assert np.isnan(shifts).all()
+
+def test_no_valid_shifts():
+    with pytest.raises(Exception, match="No valid shifts"):
+        depthmatch.apply_shifts(depth, log(depth), np.full(3, np.nan), np.array([1000, 1020, 1040]))
+    with pytest.raises(Exception, match="No valid shifts"):
+        depthmatch.apply_shifts(depth, log(depth), np.nan)
+
+@pytest.mark.parametrize('window, max_shift', [(10, 0), (10, -1), (0, 2), (-10, 2)])
+def test_invalid_search_parameters(window, max_shift):
+    reference = log(depth)
+    with pytest.raises(Exception, match="valid"):
+        depthmatch.windowed_shifts(depth, reference, reference, window, max_shift)
+    if max_shift <= 0:
+        with pytest.raises(Exception, match="valid"):
+            depthmatch.bulk_shift(depth, reference, reference, max_shift)
@@ -0,0 +1,53 @@
+import warnings
+
+import numpy as np
+import pytest
+from pypetrophysics import filters
+
+rng = np.random.default_rng(8)
+curve = rng.normal(75, 10, 2000)
+curve[[5, 6, 500, 1999]] = np.nan
+
+def reference(values, window, reducer):
+    half = window // 2
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.array([reducer(values[max(i - half, 0):i + half + 1]) for i in range(values.size)])
+
+@pytest.mark.parametrize('window, max_block_memory', [(1, 800), (5, 64 * 5 * 8), (11, 8 * 2**20), (31, 7 * 31 * 8), (501, 1)])
+def test_running_median(window, max_block_memory):
+    result = filters.running_median(curve, window, max_block_memory=max_block_memory)
+    np.testing.assert_allclose(result, reference(curve, window, np.nanmedian))
+
+def test_running_median_all_nan_window():
+    values = np.array([1, np.nan, np.nan, np.nan, 5.0])
+    np.testing.assert_array_equal(filters.running_median(values, 3), [1, 1, np.nan, 5, 5])
+
+@pytest.mark.parametrize('window', [1, 3, 25])
+def test_moving_average(window):
+    np.testing.assert_allclose(filters.moving_average(curve, window), reference(curve, window, np.nanmean))
+
+def test_hampel():
+    values = curve.copy()
+    values[[100, 1000]] = [500, -200]
+    despiked, spikes = filters.hampel(values, 11, return_mask=True)
+    assert spikes[100] and spikes[1000]
+    assert spikes.sum() < 0.05 * values.size
+    assert despiked[100] == pytest.approx(np.nanmedian(values[95:106]))
+    np.testing.assert_array_equal(despiked[~spikes], values[~spikes])
+    assert np.isnan(despiked[5])
+    np.testing.assert_array_equal(filters.hampel(values, 11), despiked)
+    np.testing.assert_array_equal(filters.hampel(values, 11, max_block_memory=11 * 8 * 37), despiked)
+
+def test_washout_mask():
+    caliper = np.array([8.5, 8.6, 9.8, 10.2, 8.7, np.nan, 8.5, 8.5, 11, 8.5])
+    np.testing.assert_array_equal(filters.washout_mask(caliper, 8.5), [0, 0, 1, 1, 0, 0, 0, 0, 1, 0])
+    np.testing.assert_array_equal(filters.washout_mask(caliper, 8.5, threshold=2), [0, 0, 0, 0, 0, 0, 0, 0, 1, 0])
+    np.testing.assert_array_equal(filters.washout_mask(caliper, 8.5, pad=1), [0, 1, 1, 1, 1, 0, 0, 1, 1, 1])
+
+@pytest.mark.parametrize('window', [0, 4, -3])
+def test_invalid_window(window):
+    with pytest.raises(Exception):
+        filters.running_median(curve, window)
+    with pytest.raises(Exception):
+        filters.moving_average(curve, window)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, fused, porosity, saturation
+
+rng = np.random.default_rng(0)
+rhob = rng.uniform(2.0, 2.65, 1000)
+gr = rng.uniform(10, 150, 1000)
+rt = rng.uniform(1, 200, 1000)
+rhob[5] = np.nan
+
+def unfused(rhomatrix=2.65, vsh_method="linear"):
+    vsh = clayshale.gr_clay_shale_vol(20, 130, gr, vsh_method, limit_result=True)
+    phit = porosity.porosity_density(rhomatrix, 1, rhob, limit_result=True)
+    phie = np.clip(porosity.porosity_effective(phit, vsh, 0.1), 0, 0.6)
+    with np.errstate(divide="ignore"):
+        sw = saturation.sw_archie(phie, 0.05, rt, 1, 2, 2, limit_result=True)
+    return {"vsh": vsh, "phit": phit, "phie": phie, "sw": sw}
+
+@pytest.mark.parametrize('block_size, vsh_method', [(64, "linear"), (1000, "steiber"), (333, "larionov-young")])
+def test_sw_archie_from_logs(block_size, vsh_method):
+    result = fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2, vsh_method=vsh_method, block_size=block_size)
+    expected = unfused(vsh_method=vsh_method)
+    for name in fused.FUSED_OUTPUTS:
+        np.testing.assert_allclose(result[name], expected[name])
+
+def test_sw_archie_from_logs_out():
+    sw = np.zeros(1000)
+    result = fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2, out={"sw": sw}, block_size=100)
+    assert list(result) == ["sw"]
+    assert result["sw"] is sw
+    np.testing.assert_allclose(sw, unfused()["sw"])
+
+def test_sw_archie_from_logs_array_parameters():
+    rhomatrix = np.where(np.arange(1000) < 500, 2.65, 2.71)
+    result = fused.sw_archie_from_logs(rhob, gr, rt, rhomatrix, 1, 20, 130, 0.1, 0.05, 1, 2, 2, block_size=128)
+    np.testing.assert_allclose(result["phit"][:500], unfused(2.65)["phit"][:500])
+    np.testing.assert_allclose(result["sw"][500:], unfused(2.71)["sw"][500:])
+
+def test_sw_archie_from_logs_out_exceptions():
+    with pytest.raises(Exception):
+        fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2, out={"bvw": np.zeros(1000)})
+    with pytest.raises(Exception):
+        fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2, out={"sw": np.zeros(10)})
@@ -0,0 +1,45 @@
+import inspect
+import subprocess
+import sys
+
+import pytest
+import pypetrophysics
+
+# Cold import of the package root, measured in a fresh interpreter (seconds)
+IMPORT_BUDGET = 0.05
+
+COLD_IMPORT = """
+import sys, time
+start = time.perf_counter()
+import pypetrophysics
+elapsed = time.perf_counter() - start
+sys.stderr.write("{} {}".format(elapsed, int("numpy" in sys.modules)))
+"""
+
+def test_cold_import():
+    result = subprocess.run([sys.executable, "-c", COLD_IMPORT], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    elapsed, numpy_loaded = result.stderr.split()
+    assert result.stdout == ""
+    assert numpy_loaded == "0"
+    assert float(elapsed) < IMPORT_BUDGET
+
+def test_submodule_import_has_no_output(capfd):
+    subprocess.run([sys.executable, "-c", "import pypetrophysics.temperature"], check=True)
+    assert capfd.readouterr().out == ""
+
+@pytest.mark.parametrize('module_name', sorted(pypetrophysics._EXPORTS))
+def test_exports_complete(module_name):
+    module = pytest.importorskip("pypetrophysics." + module_name)
+    public = {name for name, obj in vars(module).items()
+              if not name.startswith("_") and (inspect.isfunction(obj) or inspect.isclass(obj))
+              and obj.__module__ == module.__name__}
+    assert public == set(pypetrophysics._EXPORTS[module_name])
+    assert getattr(pypetrophysics, module_name) is module
+    for name in public:
+        assert getattr(pypetrophysics, name) is getattr(module, name)
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        pypetrophysics.not_a_function
+    assert "sw_archie" in dir(pypetrophysics)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from pypetrophysics import las, porosity
+
+las_text = """~VERSION INFORMATION
+ VERS.                  2.0 :   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                  {wrap}  :   ONE LINE PER DEPTH STEP
+~WELL INFORMATION
+#MNEM.UNIT              DATA                       DESCRIPTION
+STRT    .FT            1000.0000                :START DEPTH
+STOP    .FT            1002.0000                :STOP DEPTH
+STEP    .FT            0.5000                   :STEP
+NULL    .              -999.25                  :NULL VALUE
+WELL    .              TEST WELL #1             :WELL
+~CURVE INFORMATION
+DEPT   .FT                  :   DEPTH
+RHOB   .G/C3                :   BULK DENSITY
+GR     .GAPI                :   GAMMA RAY
+~PARAMETER INFORMATION
+BHT     .DEGF   150.0000                        :BOTTOM HOLE TEMPERATURE
+~A  DEPTH     RHOB    GR
+{data}
+"""
+
+depth = [1000.0, 1000.5, 1001.0, 1001.5, 1002.0]
+rhob = [2.45, -999.25, 2.30, 2.55, 2.60]
+gr = [45.0, 60.0, -999.25, 110.0, 30.0]
+
+@pytest.fixture
+def las_file(tmp_path):
+    data = "\n".join("{} {} {}".format(*row) for row in zip(depth, rhob, gr))
+    filepath = tmp_path / "test.las"
+    filepath.write_text(las_text.format(wrap="NO", data=data))
+    return str(filepath)
+
+@pytest.fixture
+def wrapped_las_file(tmp_path):
+    data = "\n".join("{}\n {} {}".format(*row) for row in zip(depth, rhob, gr))
+    filepath = tmp_path / "wrapped.las"
+    filepath.write_text(las_text.format(wrap="YES", data=data))
+    return str(filepath)
+
+def test_read_las_header(las_file):
+    header = las.read_las_header(las_file)
+    assert [curve["mnemonic"] for curve in header["curves"]] == ["DEPT", "RHOB", "GR"]
+    assert header["curves"][1]["unit"] == "G/C3"
+    assert header["null"] == -999.25
+    assert header["well"]["WELL"]["value"] == "TEST WELL #1"
+    assert header["parameters"]["BHT"]["value"] == "150.0000"
+    assert header["wrap"] is False
+
+def test_read_las(las_file):
+    curves = las.read_las(las_file)
+    np.testing.assert_array_equal(curves["DEPT"], depth)
+    np.testing.assert_array_equal(curves["RHOB"], [2.45, np.nan, 2.30, 2.55, 2.60])
+    np.testing.assert_array_equal(curves["GR"], [45.0, 60.0, np.nan, 110.0, 30.0])
+
+def test_read_las_wrapped(wrapped_las_file):
+    curves = las.read_las(wrapped_las_file, chunk_size=2)
+    np.testing.assert_array_equal(curves["DEPT"], depth)
+    np.testing.assert_array_equal(curves["GR"], [45.0, 60.0, np.nan, 110.0, 30.0])
+
+def test_iter_las_chunks(las_file):
+    chunks = list(las.iter_las(las_file, chunk_size=2, curves=["RHOB"]))
+    assert [len(chunk["RHOB"]) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0]) == ["RHOB"]
+    full = np.concatenate([porosity.porosity_density(2.65, 1, chunk["RHOB"]) for chunk in chunks])
+    np.testing.assert_allclose(full, porosity.porosity_density(2.65, 1, las.read_las(las_file)["RHOB"]))
+
+@pytest.mark.parametrize('chunk_size', [1, 2])
+def test_read_las_comments_in_data(tmp_path, chunk_size):
+    rows = ["{} {} {}".format(*row) for row in zip(depth, rhob, gr)]
+    data = "\n".join([rows[0], "# comment", "# another comment", "# third comment"] + rows[1:3] + ["#"] + rows[3:])
+    filepath = tmp_path / "comments.las"
+    filepath.write_text(las_text.format(wrap="NO", data=data))
+    curves = las.read_las(str(filepath), chunk_size=chunk_size)
+    np.testing.assert_array_equal(curves["DEPT"], depth)
+
+def test_iter_las_invalid_chunk_size(las_file):
+    with pytest.raises(Exception, match="chunk_size"):
+        next(las.iter_las(las_file, chunk_size=0))
+
+def test_iter_las_missing_curve(las_file):
+    with pytest.raises(Exception):
+        next(las.iter_las(las_file, curves=["NPHI"]))
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pypetrophysics.miscfuncs import dec_perc_convert
 from pypetrophysics.miscfuncs import limit_vals
@@ -25,4 +26,12 @@ def test_limit_vals_low():
     assert limit_vals(50, 60, 100) == 60
 
 def test_limit_vals_in():
-    assert limit_vals(50, 20, 100) == 50
\ No newline at end of file
+    assert limit_vals(50, 20, 100) == 50
+
+def test_limit_vals_array():
+    result = limit_vals(np.array([10, 50, 120, np.nan]), 20, 100)
+    np.testing.assert_array_equal(result, [20, 50, 100, np.nan])
+
+def test_limit_vals_array_limits():
+    result = limit_vals(np.array([0.1, 0.5, 0.9]), np.array([0.2, 0.6, 0]), 0.8)
+    np.testing.assert_allclose(result, [0.2, 0.6, 0.8])
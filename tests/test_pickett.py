@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from pypetrophysics import pickett, saturation
+
+rng = np.random.default_rng(3)
+well = np.repeat(["W1", "W2", "W3"], 2000)
+true_rw = {"W1": 0.05, "W2": 0.1, "W3": 0.2}
+true_m = {"W1": 1.8, "W2": 2.0, "W3": 2.3}
+phi = rng.uniform(0.05, 0.35, well.size)
+rw = np.array([true_rw[w] for w in well])
+m = np.array([true_m[w] for w in well])
+rt = rw / phi**m * 10**rng.normal(0, 0.01, well.size)
+
+def test_pickett_fit_groups():
+    fit = pickett.pickett_fit(rt, phi, groups=well)
+    assert list(fit.groups) == ["W1", "W2", "W3"]
+    np.testing.assert_allclose(fit.rw, [0.05, 0.1, 0.2], rtol=0.03)
+    np.testing.assert_allclose(fit.m, [1.8, 2.0, 2.3], atol=0.02)
+    assert np.all(fit.r2 > 0.99)
+    np.testing.assert_array_equal(fit.n, [2000, 2000, 2000])
+
+def test_pickett_fit_matches_polyfit():
+    select = well == "W2"
+    slope, intercept = np.polyfit(np.log10(phi[select]), np.log10(rt[select]), 1)
+    fit = pickett.pickett_fit(rt[select], phi[select], arch_a=0.81)
+    assert fit.m[0] == pytest.approx(-slope)
+    assert fit.rw[0] == pytest.approx(10**intercept / 0.81)
+
+def test_pickett_fit_fixed_m_and_mask():
+    bad = rt.copy()
+    bad[:10] = np.nan
+    bad[10:20] = -1
+    mask = np.ones(well.size, dtype=bool)
+    mask[20:30] = False
+    fit = pickett.pickett_fit(bad, phi, groups=well, arch_m=2, mask=mask)
+    np.testing.assert_array_equal(fit.m, [2, 2, 2])
+    assert fit.n[0] == 1970
+    assert fit.rw[1] == pytest.approx(0.1, rel=0.01)
+    assert fit.r2[1] > 0.99
+
+def test_pickett_fit_small_group():
+    fit = pickett.pickett_fit([10, 20, 5], [0.2, 0.1, 0.3], groups=[1, 2, 2])
+    assert np.isnan(fit.m[0])
+    assert fit.n[0] == 1
+
+def test_pickett_fit_ignores_samples_outside_zones():
+    zones = np.where(well == "W1", 0, np.where(well == "W2", 1, -1))
+    fit = pickett.pickett_fit(rt, phi, groups=zones)
+    np.testing.assert_array_equal(fit.groups, [0, 1])
+    np.testing.assert_allclose(fit.rw, [0.05, 0.1], rtol=0.03)
+    curves = pickett.pickett_curves(fit, zones)
+    assert np.isnan(curves["rw"][zones == -1]).all()
+
+def test_pickett_curves_into_sw_archie():
+    fit = pickett.pickett_fit(rt, phi, groups=well)
+    curves = pickett.pickett_curves(fit, np.append(well, "W4"))
+    assert np.isnan(curves["rw"][-1])
+    sw = saturation.sw_archie(phi, curves["rw"][:-1], rt, 1, curves["m"][:-1], 2)
+    assert np.median(np.abs(sw - 1)) < 0.02
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import pytest
 
 from pypetrophysics import porosity
@@ -24,3 +25,30 @@ porosity_den_params_limits = [
 def test_porosity_density_limits(rhomatrix, rhofluid, rhobulk, lowlimit, highlimit, expected):
     assert porosity.porosity_density(rhomatrix, rhofluid, rhobulk, limit_result=True, low_limit=lowlimit, high_limit=highlimit) == expected
     # assert result == expected
+
+# Testing array inputs give the same result as scalar inputs
+def test_porosity_density_array():
+    rhob = np.array([2.08, 2.35, 2.45, 2.68, 2.75])
+    result = porosity.porosity_density(2.65, 1, rhob, limit_result=True)
+    expected = [porosity.porosity_density(2.65, 1, val, limit_result=True) for val in rhob]
+    np.testing.assert_allclose(result, expected)
+
+def test_porosity_density_array_matrix():
+    rhob = np.array([2.45, 2.45])
+    result = porosity.porosity_density(np.array([2.65, 2.71]), 1, rhob)
+    np.testing.assert_allclose(result, [porosity.porosity_density(2.65, 1, 2.45), porosity.porosity_density(2.71, 1, 2.45)])
+
+@pytest.mark.parametrize('method', ["wyllie", "raymer"])
+def test_porosity_sonic_array(method):
+    dt = np.array([60, 75, 90, 110])
+    result = porosity.porosity_sonic(55.5, 189, dt, method, limit_result=True)
+    expected = [porosity.porosity_sonic(55.5, 189, val, method, limit_result=True) for val in dt]
+    np.testing.assert_allclose(result, expected)
+
+def test_porosity_effective_series():
+    pd = pytest.importorskip("pandas")
+    phit = pd.Series([0.2, 0.25, 0.3])
+    vclay = pd.Series([0.1, 0.3, 0.5])
+    result = porosity.porosity_effective(phit, vclay, 0.15)
+    assert isinstance(result, pd.Series)
+    np.testing.assert_allclose(result, [0.185, 0.205, 0.225])
@@ -0,0 +1,87 @@
+import asyncio
+
+import numpy as np
+import pytest
+from pypetrophysics import fused, realtime
+
+rng = np.random.default_rng(7)
+size = 5000
+depth = 1000 + np.arange(size) * 0.5
+gr = rng.uniform(10, 150, size)
+rhob = rng.uniform(2.0, 2.65, size)
+rt = rng.uniform(1, 200, size)
+params = dict(rhomatrix=2.65, rhofluid=1, rw=0.05, arch_a=1, arch_m=2, arch_n=2)
+
+def batches(sizes=(1, 3, 7, 50)):
+    start = 0
+    i = 0
+    while start < size:
+        stop = min(start + sizes[i % len(sizes)], size)
+        yield slice(start, stop)
+        start = stop
+        i += 1
+
+def test_push_matches_full_evaluation():
+    evaluator = realtime.IncrementalEvaluator(gr_clean=20, gr_shale=130, phi_shale=0.1, **params)
+    received = []
+    evaluator.subscribe(received.append)
+    pushed = [evaluator.push(depth[block], gr[block], rhob[block], rt[block]) for block in batches()]
+    expected = fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0.1, 0.05, 1, 2, 2)
+    for name in ("vsh", "phit", "phie", "sw"):
+        np.testing.assert_allclose(np.concatenate([result[name] for result in pushed]), expected[name])
+    assert len(received) == len(pushed)
+    history = evaluator.history()
+    np.testing.assert_array_equal(history["depth"], depth)
+    np.testing.assert_allclose(history["sw"], expected["sw"])
+    assert evaluator.samples == size
+
+def test_scalar_push():
+    evaluator = realtime.IncrementalEvaluator(gr_clean=20, gr_shale=130, **params)
+    result = evaluator.push(1000.0, 75, 2.3, 20)
+    assert result["vsh"][0] == pytest.approx(0.5)
+
+def test_auto_picked_endpoints():
+    evaluator = realtime.IncrementalEvaluator(min_samples=100, keep_history=False, **params)
+    first = evaluator.push(depth[:50], gr[:50], rhob[:50], rt[:50])
+    assert np.all(np.isnan(first["vsh"]))
+    assert np.all(np.isnan(evaluator.endpoints()))
+    for start in range(50, size, 200):
+        block = slice(start, start + 200)
+        evaluator.push(depth[block], gr[block], rhob[block], rt[block])
+    clean, shale = evaluator.endpoints()
+    assert clean == pytest.approx(np.percentile(gr, 5), abs=3)
+    assert shale == pytest.approx(np.percentile(gr, 95), abs=3)
+    with pytest.raises(Exception):
+        evaluator.history()
+
+def test_gr_smoothing():
+    curve = gr.copy()
+    curve[10] = np.nan
+    evaluator = realtime.IncrementalEvaluator(gr_clean=20, gr_shale=130, gr_window=5, **params)
+    for block in batches():
+        evaluator.push(depth[block], curve[block], rhob[block], rt[block])
+    smoothed = evaluator.history()["gr"]
+    expected = [np.nanmean(curve[max(i - 4, 0):i + 1]) for i in range(size)]
+    np.testing.assert_allclose(smoothed, expected)
+    with pytest.raises(Exception):
+        realtime.IncrementalEvaluator(gr_window=0, **params)
+
+def test_stream():
+    async def source():
+        for block in batches((25,)):
+            await asyncio.sleep(0)
+            yield {"depth": depth[block], "gr": gr[block], "rhob": rhob[block], "rt": rt[block]}
+
+    async def collect():
+        evaluator = realtime.IncrementalEvaluator(gr_clean=20, gr_shale=130, **params)
+        return [result async for result in evaluator.stream(source())]
+
+    results = asyncio.run(collect())
+    assert len(results) == size // 25
+    expected = fused.sw_archie_from_logs(rhob, gr, rt, 2.65, 1, 20, 130, 0, 0.05, 1, 2, 2)
+    np.testing.assert_allclose(np.concatenate([result["sw"] for result in results]), expected["sw"])
+
+def test_mismatched_push():
+    evaluator = realtime.IncrementalEvaluator(gr_clean=20, gr_shale=130, **params)
+    with pytest.raises(Exception):
+        evaluator.push(depth[:3], gr[:2], rhob[:3], rt[:3])
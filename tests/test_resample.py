@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from pypetrophysics import resample
+
+source = np.arange(1000, 1010.01, 0.5)
+gr = np.sin(source)
+rhob = 2.3 + 0.01 * (source - 1000)
+
+def test_depth_grid():
+    grid = resample.depth_grid(1000, 1001, 0.1)
+    assert grid.size == 11
+    assert grid[-1] == pytest.approx(1001)
+
+def test_depth_grid_invalid_step():
+    for step in (0, -0.5):
+        with pytest.raises(Exception):
+            resample.depth_grid(1000, 1001, step)
+
+def test_linear_matches_interp():
+    target = np.linspace(999, 1011, 97)
+    result = resample.resample_curves({"GR": gr, "RHOB": rhob}, source, target)
+    for name, curve in (("GR", gr), ("RHOB", rhob)):
+        expected = np.interp(target, source, curve, left=np.nan, right=np.nan)
+        np.testing.assert_allclose(result[name], expected)
+
+def test_linear_nan_handling():
+    curve = gr.copy()
+    curve[4] = np.nan
+    target = np.array([1001.5, 1001.75, 1002.0, 1002.25, 1010.0])
+    result = resample.resample_curves(curve, source, target)
+    assert result[0] == pytest.approx(gr[3])
+    assert np.isnan(result[1:4]).all()
+    assert result[4] == pytest.approx(gr[-1])
+
+def test_max_gap():
+    depth = np.array([0, 1, 2, 10, 11.0])
+    values = np.arange(5.0)
+    result = resample.resample_curves(values, depth, [1.5, 5, 10], max_gap=2)
+    np.testing.assert_array_equal(result, [1.5, np.nan, 3])
+    result = resample.resample_curves(values, depth, [1.4, 5, 9.2], method="nearest", max_gap=2)
+    np.testing.assert_array_equal(result, [1, np.nan, 3])
+
+def test_nearest():
+    target = np.array([999.9, 1000.2, 1000.3, 1005.74, 1010])
+    result = resample.resample_curves(gr, source, target, method="nearest")
+    np.testing.assert_array_equal(result, [np.nan, gr[0], gr[1], gr[11], gr[-1]])
+
+def test_average():
+    values = np.arange(source.size, dtype=float)
+    values[3] = np.nan
+    result = resample.resample_curves(values, source, [1000.5, 1001.5, 1002.5], method="average")
+    np.testing.assert_allclose(result, [0.5, 2, 4.5])
+    result = resample.resample_curves(values, source, [1009.5, 1010.5, 1011.5], method="average")
+    np.testing.assert_allclose(result, [18.5, 20, np.nan])
+    # max_gap does not apply to averaging
+    result = resample.resample_curves(values, source, [1000.5, 1001.5, 1002.5], method="average", max_gap=0.1)
+    np.testing.assert_allclose(result, [0.5, 2, 4.5])
+
+def test_shared_resampler_2d():
+    target = resample.depth_grid(1000, 1010, 0.1524)
+    resampler = resample.Resampler(source, target)
+    stacked = resampler(np.vstack([gr, rhob]))
+    assert stacked.shape == (2, target.size)
+    np.testing.assert_allclose(stacked[1], resampler(rhob))
+
+def test_align_runs():
+    run2_depth = np.arange(1005, 1020.01, 0.25)
+    grid, curves = resample.align_runs([(source, {"GR": gr}), (run2_depth, {"RT": np.log(run2_depth)})], step=0.5)
+    np.testing.assert_allclose(grid, np.arange(1000, 1020.01, 0.5))
+    assert set(curves) == {"GR", "RT"}
+    assert np.isnan(curves["GR"][-1]) and np.isnan(curves["RT"][0])
+    np.testing.assert_allclose(curves["RT"][grid >= 1005], np.log(grid[grid >= 1005]))
+    with pytest.raises(Exception):
+        resample.align_runs([(source, {"GR": gr}), (run2_depth, {"GR": run2_depth})], step=0.5)
+
+@pytest.mark.parametrize('kwargs', [dict(method="cubic"), dict(source_depth=source[::-1])])
+def test_invalid(kwargs):
+    args = dict(source_depth=source, target_depth=source, method="linear")
+    args.update(kwargs)
+    with pytest.raises(Exception):
+        resample.Resampler(**args)
+
+def test_wrong_length():
+    with pytest.raises(Exception):
+        resample.resample_curves(gr[:-1], source, source)
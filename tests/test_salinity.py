@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pypetrophysics import salinity
 
@@ -11,4 +12,43 @@ def test_chlorides_to_NaCl():
 
 def test_NaCl_to_chlorides():
     result = salinity.NaCl_to_chlorides(21385)
-    assert result == 13000
\ No newline at end of file
+    assert result == 13000
+
+def test_rw_from_salinity():
+    assert salinity.rw_from_salinity(20000, 75) == pytest.approx(0.297, abs=0.001)
+    hot = salinity.rw_from_salinity(20000, 150)
+    assert hot == pytest.approx(salinity.rw_at_form_temp(0.2970814, 75, "f", 150))
+    assert salinity.rw_from_salinity(20000, 65.5556, "c") == pytest.approx(hot, rel=1e-5)
+    with pytest.raises(Exception):
+        salinity.rw_from_salinity(20000, 75, "k")
+
+def test_salinity_from_rw():
+    ppm = np.array([500, 5000, 50000, 250000])
+    rw = salinity.rw_from_salinity(ppm, 180)
+    np.testing.assert_allclose(salinity.salinity_from_rw(rw, 180), ppm)
+    assert np.isnan(salinity.salinity_from_rw(0.001, 75))
+
+grid = salinity.RwGrid()
+
+def test_rw_grid_rw():
+    rng = np.random.default_rng(4)
+    ppm = np.exp(rng.uniform(np.log(100), np.log(300000), 10000))
+    temp = rng.uniform(32, 450, 10000)
+    np.testing.assert_allclose(grid.rw(ppm, temp), salinity.rw_from_salinity(ppm, temp), rtol=1e-3)
+    assert grid.rw(20000, 23.8889, "c") == pytest.approx(grid.rw(20000, 75), rel=1e-6)
+    assert np.all(np.isnan(grid.rw([50, 20000, 20000, np.nan], [75, 500, np.nan, 75])))
+
+def test_rw_grid_salinity_from_rw():
+    ppm = np.array([150, 2000, 35000, 200000])
+    temp = np.array([60, 120, 250, 400])
+    rw = grid.rw(ppm, temp)
+    np.testing.assert_allclose(grid.salinity_from_rw(rw, temp), ppm, rtol=2e-3)
+    np.testing.assert_allclose(grid.salinity_from_rw(0.1, temp), salinity.salinity_from_rw(0.1, temp), rtol=1e-3)
+    assert np.isnan(grid.salinity_from_rw(1000, 75))
+
+def test_rw_grid_model():
+    def chart(ppm, temp):
+        return 1000 / ppm * 80 / (temp + 5)
+    custom = salinity.RwGrid(temperature_range=(50, 250), model=chart)
+    assert custom.rw(10000, 100) == pytest.approx(chart(10000, 100), rel=1e-3)
+    assert custom.salinity_from_rw(chart(10000, 100), 100) == pytest.approx(10000, rel=1e-3)
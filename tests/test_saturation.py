@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pypetrophysics import saturation
 
@@ -27,4 +28,156 @@ def test_resistivity_index():
 
 def test_resistivity_index_2():
     result = saturation.resistivity_index(123, 3)
-    assert result == pytest.approx(41, abs=0.01)
\ No newline at end of file
+    assert result == pytest.approx(41, abs=0.01)
+
+# Testing array inputs give the same result as scalar inputs
+def test_sw_archie_array():
+    phi = np.array([0.05, 0.12, 0.23, 0.3])
+    rt = np.array([400, 80, 40, 2])
+    result = saturation.sw_archie(phi, 0.9, rt, 0.62, 2.15, 2, limit_result=True)
+    expected = [saturation.sw_archie(p, 0.9, r, 0.62, 2.15, 2, limit_result=True) for p, r in zip(phi, rt)]
+    np.testing.assert_allclose(result, expected)
+
+def test_sw_indonesian_array():
+    vclay = np.array([0.05, 0.2, 0.4])
+    phi = np.array([0.25, 0.18, 0.1])
+    result = saturation.sw_indonesian(0.05, 20, 4, vclay, phi, 2, 2)
+    expected = [saturation.sw_indonesian(0.05, 20, 4, v, p, 2, 2) for v, p in zip(vclay, phi)]
+    np.testing.assert_allclose(result, expected)
+
+# Testing the Waxman-Smits solver
+def waxsmit_fixed_point(rw, rt, b, qv, a, phit, m_star, n_star):
+    swt = saturation.sw_archie(phit, rw, rt, a, m_star, n_star)
+    for _ in range(1000):
+        swt = (rt * (1 + rw * b * qv / swt) / (a * phit**(-m_star) * rw)) ** (-1 / n_star)
+    return swt
+
+waxsmit_params = [
+    (0.05, 20, 4, 0.5, 1, 0.2, 2, 2),
+    (0.1, 5, 3.5, 0.1, 1, 0.25, 1.8, 2.2),
+    (0.03, 200, 4.5, 1.2, 0.81, 0.12, 2.1, 1.9),
+]
+
+@pytest.mark.parametrize('rw, rt, b, qv, a, phit, m_star, n_star', waxsmit_params)
+def test_sw_waxsmit(rw, rt, b, qv, a, phit, m_star, n_star):
+    result = saturation.sw_waxsmit(rw, rt, b, qv, a, phit, m_star, n_star)
+    expected = waxsmit_fixed_point(rw, rt, b, qv, a, phit, m_star, n_star)
+    assert result == pytest.approx(expected, abs=1e-6)
+
+def test_sw_waxsmit_no_clay_equals_archie():
+    result = saturation.sw_waxsmit(0.05, 20, 4, 0, 1, 0.2, 2, 2)
+    assert result == pytest.approx(saturation.sw_archie(0.2, 0.05, 20, 1, 2, 2))
+
+def test_sw_waxsmit_array():
+    rt = np.array([2, 10, 50, 250])
+    qv = np.array([0.05, 0.3, 0.8, 1.5])
+    result = saturation.sw_waxsmit(0.05, rt, 4, qv, 1, 0.2, 2, 2)
+    expected = [saturation.sw_waxsmit(0.05, r, 4, q, 1, 0.2, 2, 2) for r, q in zip(rt, qv)]
+    np.testing.assert_allclose(result, expected)
+
+def test_sw_waxsmit_diagnostics():
+    rt = np.array([np.nan, 10, 50])
+    result = saturation.sw_waxsmit(0.05, rt, 4, 0.5, 1, 0.2, 2, 2, diagnostics=True)
+    np.testing.assert_array_equal(result.converged, [False, True, True])
+    assert np.isnan(result.sw[0])
+    assert result.iterations[0] == 0
+    assert np.all(result.iterations[1:] > 0)
+    np.testing.assert_allclose(result.residual[1:], 0, atol=1e-6)
+
+def test_sw_waxsmit_invalid_inputs():
+    qv = np.array([0.5, -0.5, 0.5, 0.5])
+    b = np.array([4, 4, -4, 4])
+    rt = np.array([10, 10, 10, -10])
+    result = saturation.sw_waxsmit(0.05, rt, b, qv, 1, 0.2, 2, 2, diagnostics=True)
+    assert np.isfinite(result.sw[0])
+    assert np.isnan(result.sw[1:]).all()
+    np.testing.assert_array_equal(result.converged, [True, False, False, False])
+    assert np.isnan(saturation.sw_waxsmit(0.05, 10, 4, -0.5, 1, 0.2, 2, 2))
+
+def test_sw_waxsmit_max_iterations():
+    result = saturation.sw_waxsmit(0.05, 20, 4, 0.5, 1, 0.2, 2, 2, max_iterations=1, diagnostics=True)
+    assert result.iterations == 1
+    assert not result.converged
+
+# Testing shaly sand models
+def test_sw_simandoux():
+    result = saturation.sw_simandoux(0.05, 20, 4, 0.2, 0.18, 1, 2)
+    assert result == pytest.approx(0.2419, abs=0.001)
+
+def test_sw_simandoux_solves_equation():
+    sw = saturation.sw_simandoux(0.05, 20, 4, 0.2, 0.18, 0.81, 2.1)
+    assert 0.18**2.1 * sw**2 / (0.81 * 0.05) + 0.2 * sw / 4 == pytest.approx(1 / 20)
+
+def test_sw_simandoux_no_clay_equals_archie():
+    result = saturation.sw_simandoux(0.05, 20, 4, 0, 0.18, 1, 2)
+    assert result == pytest.approx(saturation.sw_archie(0.18, 0.05, 20, 1, 2, 2))
+
+def test_sw_modified_simandoux():
+    result = saturation.sw_modified_simandoux(0.05, 20, 4, 0.2, 0.18, 1, 2)
+    assert result == pytest.approx(0.2195, abs=0.001)
+
+def test_sw_indonesian():
+    result = saturation.sw_indonesian(0.05, 20, 4, 0.2, 0.18, 2, 2)
+    assert result == pytest.approx(0.2424, abs=0.001)
+
+shaly_sand_inputs = dict(
+    rw=0.05,
+    rt=np.array([2, 8, 20, 60]),
+    rshale=4,
+    vclay=np.array([0.05, 0.15, 0.3, 0.45]),
+    phi=np.array([0.28, 0.22, 0.16, 0.1]),
+)
+
+def test_sw_shaly_sand_matches_individual_models():
+    results = saturation.sw_shaly_sand(arch_a=0.81, arch_m=2, arch_n=2, b=4, qv=0.4, **shaly_sand_inputs)
+    args = [shaly_sand_inputs[key] for key in ("rw", "rt", "rshale", "vclay", "phi")]
+    np.testing.assert_allclose(results["simandoux"], saturation.sw_simandoux(*args, 0.81, 2))
+    np.testing.assert_allclose(results["modified-simandoux"], saturation.sw_modified_simandoux(*args, 0.81, 2))
+    np.testing.assert_allclose(results["indonesian"], saturation.sw_indonesian(*args, 2, 2, archie_a=0.81))
+    np.testing.assert_allclose(results["waxman-smits"], saturation.sw_waxsmit(0.05, shaly_sand_inputs["rt"], 4, 0.4, 0.81, shaly_sand_inputs["phi"], 2, 2))
+
+def test_sw_shaly_sand_models():
+    results = saturation.sw_shaly_sand(models=["indonesian"], limit_result=True, **shaly_sand_inputs)
+    assert list(results) == ["indonesian"]
+    assert np.all(results["indonesian"] <= 1)
+
+def test_sw_shaly_sand_exceptions():
+    with pytest.raises(Exception):
+        saturation.sw_shaly_sand(models=["archie"], **shaly_sand_inputs)
+    with pytest.raises(Exception):
+        saturation.sw_shaly_sand(models=["waxman-smits"], **shaly_sand_inputs)
+
+series_index = np.array([1000.0, 1000.5, 1001.0, 1001.5])
+
+@pytest.mark.parametrize('func, args', [
+    (saturation.sw_simandoux, (0.81, 2)),
+    (saturation.sw_modified_simandoux, (0.81, 2)),
+    (saturation.sw_indonesian, (2, 2)),
+])
+def test_shaly_sand_series(func, args):
+    pd = pytest.importorskip("pandas")
+    rt = pd.Series(shaly_sand_inputs["rt"], index=series_index)
+    vclay = pd.Series(shaly_sand_inputs["vclay"], index=series_index)
+    result = func(0.05, rt, 4, vclay, shaly_sand_inputs["phi"], *args)
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(rt.index)
+    np.testing.assert_allclose(result, func(0.05, shaly_sand_inputs["rt"], 4, shaly_sand_inputs["vclay"],
+                                            shaly_sand_inputs["phi"], *args))
+
+def test_sw_waxsmit_series():
+    pd = pytest.importorskip("pandas")
+    rt = pd.Series(shaly_sand_inputs["rt"], index=series_index)
+    result = saturation.sw_waxsmit(0.05, rt, 4, 0.4, 1, 0.2, 2, 2)
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(rt.index)
+    np.testing.assert_allclose(result, saturation.sw_waxsmit(0.05, shaly_sand_inputs["rt"], 4, 0.4, 1, 0.2, 2, 2))
+    diagnostics = saturation.sw_waxsmit(0.05, rt, 4, 0.4, 1, 0.2, 2, 2, diagnostics=True)
+    assert diagnostics.converged.index.equals(rt.index)
+
+def test_sw_shaly_sand_series():
+    pd = pytest.importorskip("pandas")
+    inputs = dict(shaly_sand_inputs, rt=pd.Series(shaly_sand_inputs["rt"], index=series_index))
+    results = saturation.sw_shaly_sand(b=4, qv=0.4, **inputs)
+    for sw in results.values():
+        assert isinstance(sw, pd.Series)
+        assert sw.index.equals(inputs["rt"].index)
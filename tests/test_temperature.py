@@ -1,5 +1,6 @@
+import numpy as np
 import pytest
-from pypetrophysics import temperature
+from pypetrophysics import salinity, temperature
 
 def test_temp_gradient():
     result = temperature.temp_gradient(150, 60, 8000)
@@ -7,4 +8,28 @@ def test_temp_gradient():
 
 def test_formation_temperature():
     result = temperature.formation_temperature(60, 0.01125, 8000)
-    assert result == 150
\ No newline at end of file
+    assert result == 150
+
+profile = temperature.TemperatureProfile([8000, 4000], [150, 110], surface_temperature=60)
+
+def test_temperature_profile_gradients():
+    np.testing.assert_allclose(profile.depths, [0, 4000, 8000])
+    np.testing.assert_allclose(profile.gradients, [0.0125, 0.01])
+
+def test_temperature_profile_temperature():
+    depth = np.array([-100, 0, 2000, 4000, 6000, 8000, 10000])
+    np.testing.assert_allclose(profile.temperature(depth), [58.75, 60, 85, 110, 130, 150, 170])
+    assert profile.temperature(6000) == pytest.approx(130)
+    linear = temperature.TemperatureProfile([8000], [150], surface_temperature=60)
+    assert linear.temperature(8000) == temperature.formation_temperature(60, temperature.temp_gradient(150, 60, 8000), 8000)
+
+def test_temperature_profile_rw_at_depth():
+    depth = np.array([1000, 5000, 9000])
+    result = profile.rw_at_depth(depth, 0.05, 75, "f")
+    expected = [salinity.rw_at_form_temp(0.05, 75, "f", profile.temperature(d)) for d in depth]
+    np.testing.assert_allclose(result, expected)
+
+@pytest.mark.parametrize('depths, temperatures', [([8000], [150]), ([4000, 4000], [100, 110]), ([4000, 8000], [100])])
+def test_temperature_profile_invalid(depths, temperatures):
+    with pytest.raises(Exception):
+        temperature.TemperatureProfile(depths, temperatures)
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, porosity, saturation, uncertainty
+
+rhob = np.array([2.2, 2.3, 2.4, 2.5, 2.6])
+gr = np.array([25, 40, 60, 90, 120])
+rt = np.array([50, 20, 8, 3, 2])
+
+def test_sample_distribution():
+    rng = np.random.default_rng(1)
+    assert np.all(uncertainty.sample_distribution(0.05, 10) == 0.05)
+    samples = uncertainty.sample_distribution(("uniform", 1.8, 2.2), 1000, rng)
+    assert samples.min() >= 1.8 and samples.max() <= 2.2
+    samples = uncertainty.sample_distribution(("normal", 2, 0.1), 10000, rng)
+    assert samples.mean() == pytest.approx(2, abs=0.01)
+    samples = uncertainty.sample_distribution(("triangular", 1, 2, 3), 10, rng)
+    assert samples.shape == (10,)
+    with pytest.raises(Exception):
+        uncertainty.sample_distribution(("poisson", 1), 10)
+
+def test_percentile_accumulator():
+    rng = np.random.default_rng(2)
+    values = rng.uniform(0, 1, (5000, 3))
+    values[:, 2] = np.nan
+    acc = uncertainty.PercentileAccumulator(3, bins=200)
+    acc.add(values[:2000])
+    other = uncertainty.PercentileAccumulator(3, bins=200)
+    other.add(values[2000:])
+    acc.merge(other)
+    for pct in (10, 50, 90):
+        np.testing.assert_allclose(acc.percentile(pct)[:2], np.percentile(values[:, :2], pct, axis=0), atol=0.01)
+    assert np.isnan(acc.percentile(50)[2])
+
+def test_monte_carlo_sw_fixed_parameters():
+    result = uncertainty.monte_carlo_sw(rhob, gr, rt, 2.65, 1, 20, 130, 0.05, 1, 2, 2, realizations=50,
+                                        bins=1000, sw_cutoff=0.5, sample_thickness=0.5)
+    phi = porosity.porosity_density(2.65, 1, rhob)
+    sw = saturation.sw_archie(phi, 0.05, rt, 1, 2, 2, limit_result=True)
+    np.testing.assert_allclose(result["phi"]["P50"], phi, atol=0.001)
+    np.testing.assert_allclose(result["sw"]["P10"], sw, atol=0.001)
+    np.testing.assert_allclose(result["vsh"]["P90"], clayshale.gr_clay_shale_vol(20, 130, gr), atol=0.001)
+    assert np.all(result["net_pay"] == 0.5 * np.sum(sw <= 0.5))
+
+def test_monte_carlo_sw_distributions():
+    kwargs = dict(rhomatrix=("normal", 2.65, 0.02), rhofluid=1, gr_clean=("uniform", 15, 30), gr_shale=("uniform", 110, 140),
+                  rw=("lognormal", np.log(0.05), 0.2), arch_a=1, arch_m=("triangular", 1.8, 2, 2.2), arch_n=2,
+                  realizations=2000, sw_cutoff=0.6, seed=42)
+    result = uncertainty.monte_carlo_sw(rhob, gr, rt, max_block_memory=5 * 8 * 6 * 300, **kwargs)
+    assert np.all(result["sw"]["P10"] <= result["sw"]["P50"])
+    assert np.all(result["sw"]["P50"] <= result["sw"]["P90"])
+    assert result["net_pay"].shape == (2000,)
+    repeat = uncertainty.monte_carlo_sw(rhob, gr, rt, **kwargs)
+    np.testing.assert_array_equal(result["net_pay"], repeat["net_pay"])
+    np.testing.assert_allclose(result["sw"]["P50"], repeat["sw"]["P50"])
+
+def test_monte_carlo_sw_scalar_curves():
+    result = uncertainty.monte_carlo_sw(2.3, 40, 20, 2.65, 1, 20, 130, 0.05, 1, 2, 2, realizations=10, bins=1000)
+    assert result["sw"]["P50"].shape == (1,)
+    expected = uncertainty.monte_carlo_sw(rhob, gr, rt, 2.65, 1, 20, 130, 0.05, 1, 2, 2, realizations=10, bins=1000)
+    assert result["sw"]["P50"][0] == pytest.approx(expected["sw"]["P50"][1])
+
+def test_monte_carlo_sw_exceptions():
+    with pytest.raises(Exception, match="realizations"):
+        uncertainty.monte_carlo_sw(rhob, gr, rt, 2.65, 1, 20, 130, 0.05, 1, 2, 2, realizations=0)
+    with pytest.raises(Exception, match="curves"):
+        uncertainty.monte_carlo_sw(np.array([]), np.array([]), np.array([]), 2.65, 1, 20, 130, 0.05, 1, 2, 2)
+
+# Testing analytic derivatives against central differences
+derivative_params = [
+    (saturation.sw_archie, uncertainty.sw_archie_derivatives, dict(phi=0.2, rw=0.05, rt=20, arch_a=0.8, arch_m=2.1, arch_n=1.9), {}),
+    (saturation.formation_factor, uncertainty.formation_factor_derivatives, dict(arch_a=0.8, phi=0.2, arch_m=2.1), {}),
+    (porosity.porosity_density, uncertainty.porosity_density_derivatives, dict(rhomatrix=2.65, rhofluid=1.05, rhobulk=2.4), {}),
+    (porosity.porosity_sonic, uncertainty.porosity_sonic_derivatives, dict(dtmatrix=55.5, dtfluid=189, dtlog=80), {"method": "wyllie"}),
+    (porosity.porosity_sonic, uncertainty.porosity_sonic_derivatives, dict(dtmatrix=55.5, dtfluid=189, dtlog=80), {"method": "raymer"}),
+] + [
+    (clayshale.gr_clay_shale_vol, uncertainty.gr_clay_shale_vol_derivatives, dict(minvalue=20, maxvalue=130, inputvalue=70), {"method": method})
+    for method in ["linear", "larionov-young", "larionov-old", "steiber", "clavier"]
+]
+
+@pytest.mark.parametrize('func, derivative_func, args, options', derivative_params)
+def test_derivatives(func, derivative_func, args, options):
+    value, derivatives = derivative_func(**args, **options)
+    assert value == pytest.approx(func(**args, **options))
+    assert set(derivatives) == set(args)
+    for name, derivative in derivatives.items():
+        step = 1e-6 * max(1, abs(args[name]))
+        upper = func(**dict(args, **{name: args[name] + step}), **options)
+        lower = func(**dict(args, **{name: args[name] - step}), **options)
+        assert derivative == pytest.approx((upper - lower) / (2 * step), rel=1e-5)
+
+def test_sw_archie_uncertainty_array():
+    phi = np.array([0.1, 0.2, 0.3])
+    sw, sw_std = uncertainty.sw_archie_uncertainty(phi, 0.05, np.array([50, 20, 5]), 1, 2, 2, std={"phi": 0.01, "arch_m": 0.1})
+    np.testing.assert_allclose(sw, saturation.sw_archie(phi, 0.05, np.array([50, 20, 5]), 1, 2, 2))
+    _, derivatives = uncertainty.sw_archie_derivatives(phi, 0.05, np.array([50, 20, 5]), 1, 2, 2)
+    np.testing.assert_allclose(sw_std, np.hypot(derivatives["phi"] * 0.01, derivatives["arch_m"] * 0.1))
+
+def test_first_order_std_covariance():
+    derivatives = {"x": np.array([1.0, 2.0]), "y": np.array([3.0, -1.0])}
+    independent = uncertainty.first_order_std(derivatives, std={"x": 0.1, "y": 0.2})
+    diagonal = uncertainty.first_order_std(derivatives, covariance=(["x", "y"], [[0.01, 0], [0, 0.04]]))
+    np.testing.assert_allclose(independent, diagonal)
+    correlated = uncertainty.first_order_std(derivatives, covariance=(["x", "y"], [[0.01, 0.02], [0.02, 0.04]]))
+    np.testing.assert_allclose(correlated, np.abs(derivatives["x"] * 0.1 + derivatives["y"] * 0.2))
+
+def test_first_order_std_exceptions():
+    derivatives = {"x": 1.0, "y": 2.0}
+    with pytest.raises(Exception):
+        uncertainty.first_order_std(derivatives, std={"z": 0.1})
+    with pytest.raises(Exception):
+        uncertainty.first_order_std(derivatives, std={"x": 0.1}, covariance=(["x", "y"], np.eye(2)))
+
+def test_uncertainty_matches_monte_carlo():
+    rng = np.random.default_rng(3)
+    rhomatrix = rng.normal(2.65, 0.01, 200000)
+    rhobulk = rng.normal(2.35, 0.02, 200000)
+    _, phi_std = uncertainty.porosity_density_uncertainty(2.65, 1, 2.35, std={"rhomatrix": 0.01, "rhobulk": 0.02})
+    assert phi_std == pytest.approx(np.std(porosity.porosity_density(rhomatrix, 1, rhobulk)), rel=0.02)
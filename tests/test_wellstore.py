@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, porosity, temperature
+from pypetrophysics.wellstore import WellStore
+
+las_text = """~VERSION INFORMATION
+ VERS.                  2.0 :   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                  NO  :   ONE LINE PER DEPTH STEP
+~WELL INFORMATION
+NULL    .              -999.25                  :NULL VALUE
+WELL    .              WELL-A                   :WELL
+~CURVE INFORMATION
+DEPT   .FT                  :   DEPTH
+RHOB   .G/C3                :   BULK DENSITY
+GR     .GAPI                :   GAMMA RAY
+~A
+1000.0 2.45 45
+1000.5 -999.25 60
+1001.0 2.30 75
+"""
+
+@pytest.fixture
+def store(tmp_path):
+    filepath = tmp_path / "well.las"
+    filepath.write_text(las_text)
+    store = WellStore(str(tmp_path / "store"))
+    store.import_las(str(filepath), chunk_size=2)
+    return store
+
+def test_import_las(store):
+    assert store.wells() == ["WELL-A"]
+    well = store.open_well("WELL-A")
+    assert well.size == 3
+    assert well.curves == ["DEPT", "RHOB", "GR"]
+    assert well.unit("RHOB") == "G/C3"
+    assert well.null == -999.25
+    assert isinstance(well["GR"], np.memmap)
+    np.testing.assert_array_equal(well.index, [1000.0, 1000.5, 1001.0])
+    np.testing.assert_array_equal(well["RHOB"], [2.45, np.nan, 2.30])
+
+def test_write_derived_curves(store):
+    well = store.open_well("WELL-A", mode="r+")
+    well.write_curve("PHID", porosity.porosity_density(2.65, 1, well["RHOB"]), unit="V/V")
+    vsh = well.create_curve("VSH", unit="V/V")
+    vsh[:] = clayshale.gr_clay_shale_vol(30, 120, well["GR"])
+    well["TEMP"] = temperature.formation_temperature(60, 0.01125, well.index)
+    del vsh, well
+
+    well = store.open_well("WELL-A")
+    np.testing.assert_allclose(well["PHID"], [0.1379, np.nan, 0.2692], atol=0.001)
+    np.testing.assert_allclose(well["VSH"], [0.1667, 0.3333, 0.5], atol=0.001)
+    np.testing.assert_allclose(well["TEMP"], [71.25, 71.256, 71.261], atol=0.001)
+    assert well.unit("PHID") == "V/V"
+
+def test_read_only(store):
+    well = store.open_well("WELL-A")
+    with pytest.raises(Exception):
+        well.write_curve("PHID", np.zeros(3))
+    with pytest.raises(ValueError):
+        well["GR"][0] = 1
+
+def test_write_curve_wrong_size(store):
+    well = store.open_well("WELL-A", mode="r+")
+    with pytest.raises(Exception):
+        well.write_curve("PHID", np.zeros(5))
+
+def test_create_and_delete_well(tmp_path):
+    store = WellStore(str(tmp_path))
+    well = store.create_well("WELL-B", np.arange(0, 10, 0.5), index_unit="M")
+    assert well.size == 20
+    with pytest.raises(Exception):
+        store.create_well("WELL-B", np.arange(5))
+    store.delete_well("WELL-B")
+    assert store.wells() == []
+
+def test_colliding_curve_names(store):
+    well = store.open_well("WELL-A", mode="r+")
+    well.write_curve("GR/1", np.ones(3))
+    well.write_curve("GR:1", np.full(3, 2.0))
+    well.create_curve("gr_1")[:] = 3
+    well.write_curve("GR/1", np.full(3, 4.0))
+    well = store.open_well("WELL-A")
+    np.testing.assert_array_equal(well["GR/1"], [4, 4, 4])
+    np.testing.assert_array_equal(well["GR:1"], [2, 2, 2])
+    np.testing.assert_array_equal(well["gr_1"], [3, 3, 3])
+    assert len({well.header["curves"][name]["file"] for name in ("GR/1", "GR:1", "gr_1")}) == 3
+
+def test_well_name_is_sanitized(tmp_path):
+    store = WellStore(str(tmp_path / "store"))
+    well = store.create_well("../15/9-F-1", np.arange(3.0))
+    assert well.name == "../15/9-F-1"
+    assert store.wells() == [".._15_9-F-1"]
+    assert "../15/9-F-1" in store
+    assert store.open_well("../15/9-F-1").size == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["store"]
+    store.create_well("..", np.arange(3.0))
+    assert store.wells() == [".._15_9-F-1", "_.."]
+    assert store.open_well("..").name == ".."
+
+def test_delete_unknown_curve(store):
+    well = store.open_well("WELL-A", mode="r+")
+    with pytest.raises(Exception, match="not found"):
+        well.delete_curve("NPHI")
+
+def test_import_las_without_curves(tmp_path):
+    filepath = tmp_path / "empty.las"
+    filepath.write_text(las_text.split("~CURVE")[0] + "~CURVE INFORMATION\n~A\n")
+    store = WellStore(str(tmp_path / "store"))
+    with pytest.raises(Exception, match="no curves"):
+        store.import_las(str(filepath))
+    assert store.wells() == []
+
+def test_failed_import_is_removed(tmp_path):
+    filepath = tmp_path / "bad.las"
+    filepath.write_text(las_text + "1001.5 2.4\n")
+    store = WellStore(str(tmp_path / "store"))
+    with pytest.raises(Exception):
+        store.import_las(str(filepath), chunk_size=2)
+    assert "WELL-A" not in store
+    assert list((tmp_path / "store").iterdir()) == []
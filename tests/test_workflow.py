@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, porosity, saturation
+from pypetrophysics.workflow import Workflow
+
+gr = np.array([30, 60, 90])
+rhob = np.array([2.3, 2.4, 2.5])
+rt = np.array([20, 10, 5])
+
+def counted(func, calls):
+    def wrapper(**kwargs):
+        calls.append(func.__name__)
+        return func(**kwargs)
+    return wrapper
+
+@pytest.fixture
+def calls():
+    return []
+
+@pytest.fixture
+def workflow(calls):
+    wf = Workflow()
+    wf.add_input("GR", gr)
+    wf.add_input("RHOB", rhob)
+    wf.add_input("RT", rt)
+    wf.add_node("VSH", counted(clayshale.gr_clay_shale_vol, calls), inputs={"inputvalue": "GR"},
+                params={"minvalue": 20, "maxvalue": 120, "limit_result": True})
+    wf.add_node("PHIT", counted(porosity.porosity_density, calls), inputs={"rhobulk": "RHOB"},
+                params={"rhomatrix": 2.65, "rhofluid": 1.0})
+    wf.add_node("PHIE", counted(porosity.porosity_effective, calls), inputs={"phit": "PHIT", "vclay": "VSH"},
+                params={"phitclay": 0.1})
+    wf.add_node("SW", counted(saturation.sw_archie, calls), inputs={"phi": "PHIE", "rt": "RT"},
+                params={"rw": 0.05, "arch_a": 1, "arch_m": 2, "arch_n": 2})
+    return wf
+
+def expected_sw(gr_min=20):
+    vsh = clayshale.gr_clay_shale_vol(gr_min, 120, gr, limit_result=True)
+    phie = porosity.porosity_effective(porosity.porosity_density(2.65, 1.0, rhob), vsh, 0.1)
+    return saturation.sw_archie(phie, 0.05, rt, 1, 2, 2)
+
+def test_lazy_evaluation(workflow, calls):
+    assert calls == []
+    workflow["PHIT"]
+    assert calls == ["porosity_density"]
+    np.testing.assert_allclose(workflow["SW"], expected_sw())
+    assert sorted(calls) == ["gr_clay_shale_vol", "porosity_density", "porosity_effective", "sw_archie"]
+
+def test_cached_results(workflow, calls):
+    workflow["SW"]
+    workflow["SW"]
+    assert len(calls) == 4
+
+def test_set_params_invalidates_dependents(workflow, calls):
+    workflow["SW"]
+    del calls[:]
+    workflow.set_params("VSH", minvalue=25)
+    assert workflow.is_cached("PHIT")
+    assert not workflow.is_cached("PHIE")
+    np.testing.assert_allclose(workflow["SW"], expected_sw(gr_min=25))
+    assert sorted(calls) == ["gr_clay_shale_vol", "porosity_effective", "sw_archie"]
+
+def test_replace_input(workflow, calls):
+    workflow["SW"]
+    del calls[:]
+    workflow.add_input("RT", rt * 2)
+    workflow["SW"]
+    assert calls == ["sw_archie"]
+
+def test_dependents(workflow):
+    assert workflow.dependents("GR") == {"VSH", "PHIE", "SW"}
+
+def test_unknown_input(workflow):
+    with pytest.raises(Exception):
+        workflow.add_node("BVW", saturation.bvw, inputs={"sw": "SW", "phi": "PHID"})
+
+def test_run(workflow):
+    results = workflow.run({"GR": gr, "RHOB": rhob, "RT": rt / 2, "NPHI": None}, names=["SW"])
+    np.testing.assert_allclose(results["SW"], expected_sw() * 2**0.5)
+
+def test_run_missing_input(workflow):
+    with pytest.raises(Exception):
+        workflow.run({"GR": gr})
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from pypetrophysics import clayshale, fused, zones
+
+table = zones.ZoneTable(tops=[1000, 1100, 1300], bases=[1100, 1250, 1400], names=["A", "B", "C"],
+                        minvalue=[20, 30, 40], maxvalue=[120, 130, 140], rw=[0.05, 0.08, 0.1])
+depth = np.array([950, 1000, 1050, 1100, 1249.5, 1260, 1300, 1399, 1400, np.nan])
+
+def test_zone_index():
+    np.testing.assert_array_equal(table.zone_index(depth), [-1, 0, 0, 1, 1, -1, 2, 2, -1, -1])
+    assert list(table.zone_names(depth[:4], outside="-")) == ["-", "A", "A", "B"]
+
+def test_scalar_depth():
+    assert table.zone_index(1050) == 0
+    assert table.zone_index(1260.0) == -1
+    assert table.zone_names(1100) == "B"
+    assert table.parameter("rw", 1350) == 0.1
+    assert np.isnan(table.parameter("rw", 950))
+    assert table.apply(clayshale.gr_clay_shale_vol, 1050.0, inputvalue=70, method="linear") == pytest.approx(0.5)
+
+def test_default_bases():
+    open_ended = zones.ZoneTable(tops=[0, 10])
+    np.testing.assert_array_equal(open_ended.zone_index([-1, 5, 10, 1e9]), [-1, 0, 1, 1])
+    assert open_ended.names == ["0", "1"]
+
+def test_parameter():
+    np.testing.assert_array_equal(table.parameter("rw", depth[:4]), [np.nan, 0.05, 0.05, 0.08])
+    np.testing.assert_array_equal(table.parameter("minvalue", depth[:2], default=0), [0, 20])
+    curves = table.curves(depth, names=["minvalue"])
+    assert list(curves) == ["minvalue"]
+
+def test_apply():
+    gr = np.array([70, 70, 70, 70, 70, 70, 70, 70, 70, 70])
+    result = table.apply(clayshale.gr_clay_shale_vol, depth, inputvalue=gr, method="linear")
+    expected = [np.nan, 0.5, 0.5, 0.4, 0.4, np.nan, 0.3, 0.3, np.nan, np.nan]
+    np.testing.assert_allclose(result, expected)
+
+    result = table.apply(clayshale.gr_clay_shale_vol, depth, inputvalue=gr, method="linear", minvalue=20)
+    np.testing.assert_allclose(result[[1, 3, 6]], [0.5, 0.5 * 100 / 110, 0.5 * 100 / 120])
+
+def test_apply_columns_with_fused():
+    n = depth.size
+    result = table.apply(fused.sw_archie_from_logs, depth, columns={"gr_clean": "minvalue", "gr_shale": "maxvalue"},
+                         rhob=np.full(n, 2.3), gr=np.full(n, 70.0), rt=np.full(n, 10.0), rhomatrix=2.65,
+                         rhofluid=1.0, phi_shale=0, arch_a=1, arch_m=2, arch_n=2)
+    np.testing.assert_allclose(result["vsh"][[1, 3, 6]], [0.5, 0.4, 0.3])
+    assert np.isnan(result["sw"][0])
+
+@pytest.mark.parametrize('kwargs', [
+    dict(tops=[10, 5]),
+    dict(tops=[0, 10], bases=[12, 20]),
+    dict(tops=[0, 10], bases=[0, 20]),
+    dict(tops=[0, 10], names=["A"]),
+    dict(tops=[0, 10], rw=[0.1]),
+])
+def test_invalid_table(kwargs):
+    with pytest.raises(Exception):
+        zones.ZoneTable(**kwargs)
+
+def test_missing_parameter():
+    with pytest.raises(Exception):
+        table.parameter("phi_shale", depth)